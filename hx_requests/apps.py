@@ -1,10 +1,89 @@
+import logging
+import threading
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
 
 
 class HxRequestsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "hx_requests"
 
+    #: The thread running a ``HX_REQUESTS_EAGER_LOAD = "background"`` warm-up.
+    eager_load_thread = None
+
     def ready(self):
         # Register system checks (e.g. auth-mixin ordering on HtmxViewMixin views).
         from hx_requests import checks  # noqa: F401
+
+        if settings.DEBUG and getattr(settings, "HX_REQUESTS_AUTORELOAD_REFRESH", False):
+            from django.utils.autoreload import autoreload_started, file_changed
+
+            autoreload_started.connect(
+                watch_hx_requests_files, dispatch_uid="hx_requests_autoreload_watch"
+            )
+            file_changed.connect(
+                refresh_registry_on_file_change, dispatch_uid="hx_requests_autoreload_refresh"
+            )
+
+        eager_load = getattr(settings, "HX_REQUESTS_EAGER_LOAD", False)
+        if eager_load == "background":
+            self.eager_load_thread = threading.Thread(
+                target=self._eager_load_in_background, name="hx-requests-eager-load", daemon=True
+            )
+            self.eager_load_thread.start()
+        elif eager_load:
+            from hx_requests.hx_registry import HxRequestRegistry
+
+            HxRequestRegistry.eager_load()
+
+    @staticmethod
+    def _eager_load_in_background():
+        from hx_requests.hx_registry import HxRequestRegistry
+
+        try:
+            HxRequestRegistry.eager_load()
+        except Exception:
+            # Nothing is lost: the lazy path imports (and raises) on first use.
+            logger.exception("hx_requests: background eager load failed.")
+
+
+def watch_hx_requests_files(sender, **kwargs):
+    """
+    ``autoreload.autoreload_started`` receiver: watch every app's
+    ``hx_requests.py`` and ``hx_requests`` package. The autoreloader only
+    watches imported modules, so lazily imported and newly created hx_requests
+    files would otherwise never reach :func:`refresh_registry_on_file_change`.
+    """
+    from django.apps import apps
+
+    for app in apps.get_app_configs():
+        sender.watch_dir(app.path, "hx_requests.py")
+        sender.watch_dir(app.path, "hx_requests/**/*.py")
+
+
+def refresh_registry_on_file_change(sender, file_path, **kwargs):
+    """
+    ``autoreload.file_changed`` receiver: when the changed file is an app's
+    hx_requests module, refresh the registry in place and return ``True`` so
+    the development server skips its process restart. Any other file, a
+    refresh that fails, or one that added, removed or reloaded nothing from
+    the file falls back to the normal restart.
+    """
+    from hx_requests.hx_registry import HxRequestRegistry
+
+    if not HxRequestRegistry.is_hx_requests_file(file_path):
+        return None
+    names_before = HxRequestRegistry.get_file_hx_names(file_path)
+    try:
+        changes = HxRequestRegistry.refresh()
+    except Exception:
+        logger.exception("hx_requests: could not refresh the registry for %s; restarting.", file_path)
+        return None
+    file_names = names_before | HxRequestRegistry.get_file_hx_names(file_path)
+    if file_names.isdisjoint(name for names in changes.values() for name in names):
+        return None
+    logger.info("hx_requests: refreshed the registry for %s (%s).", file_path, changes)
+    return True
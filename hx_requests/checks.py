@@ -7,9 +7,17 @@ than as silent runtime surprises.
 
 from __future__ import annotations
 
-from django.core.checks import Warning, register
+import os
+
+from django.apps import apps
+from django.conf import settings
+from django.core.checks import Error, Warning, register
+from django.core.exceptions import ImproperlyConfigured
 
 W_AUTH_MIXIN_ORDER = "hx_requests.W001"
+W_MANIFEST_MISSING_HANDLER = "hx_requests.W002"
+W_MANIFEST_MODULE_NOT_FOUND = "hx_requests.W003"
+E_OWNER_VIEW = "hx_requests.E001"
 
 
 def _all_subclasses(cls):
@@ -69,3 +77,93 @@ def check_auth_mixin_ordering(app_configs, **kwargs):
                 break
 
     return errors
+
+
+@register()
+def check_hx_requests_modules_manifest(app_configs, **kwargs):
+    """
+    Validate a module manifest (``HX_REQUESTS_MODULES`` or an app's
+    ``hx_requests_modules``) against what a full filesystem scan finds.
+
+    A manifest replaces discovery, so a handler module left off it silently
+    stops being registered and its tokens 404. This warns about every handler
+    the full scan finds outside the manifest, and about listed modules that do
+    not exist. Only runs when a manifest is configured.
+    """
+    from hx_requests.hx_registry import HxRequestRegistry, _scan_source
+
+    has_manifest = getattr(settings, "HX_REQUESTS_MODULES", None) is not None or any(
+        getattr(app, "hx_requests_modules", None) is not None for app in apps.get_app_configs()
+    )
+    if not has_manifest:
+        return []
+
+    errors = []
+    listed = HxRequestRegistry._collect_hx_request_files()
+    listed_paths = set()
+    for file_path, module_name in listed:
+        listed_paths.add(file_path)
+        if not (file_path and os.path.isfile(file_path)):
+            errors.append(
+                Warning(
+                    f"hx_requests module manifest lists {module_name}, which was not found.",
+                    hint="List dotted paths of modules inside an installed app's package.",
+                    id=W_MANIFEST_MODULE_NOT_FOUND,
+                )
+            )
+
+    for file_path, module_name in HxRequestRegistry._collect_hx_request_files(use_manifest=False):
+        if file_path in listed_paths:
+            continue
+        # Parsed directly rather than through the registry, so the check leaves
+        # its discovery index untouched.
+        try:
+            classes = _scan_source(file_path)
+        except (SyntaxError, OSError):
+            continue
+        for hx_name, class_name in classes:
+            errors.append(
+                Warning(
+                    f"HxRequest '{hx_name}' ({module_name}.{class_name}) is not in the "
+                    "hx_requests module manifest and will not be registered.",
+                    hint=(
+                        "Add its module to HX_REQUESTS_MODULES (or the app's "
+                        "hx_requests_modules), or remove the manifest to scan all apps."
+                    ),
+                    id=W_MANIFEST_MISSING_HANDLER,
+                )
+            )
+
+    return errors
+
+
+@register()
+def check_owner_views(app_configs, **kwargs):
+    """
+    Validate the ``owner_view`` of every HxRequest served by the hx router, so
+    a view the router cannot safely dispatch as (not using ``HtmxViewMixin``,
+    guarded by an auth mixin or a decorated ``dispatch``, or paired with
+    ``get_views_context``) fails at startup instead of on its first request.
+
+    Best effort: only HxRequest classes that have been imported are visible
+    via ``__subclasses__``; the router validates the rest on first use.
+    """
+    from hx_requests.hx_requests import BaseHxRequest
+    from hx_requests.views import resolve_owner_view
+
+    errors = []
+    for hx_cls in _all_subclasses(BaseHxRequest):
+        if getattr(hx_cls, "owner_view", None) is None:
+            continue
+        try:
+            resolve_owner_view(hx_cls)
+        except (ImproperlyConfigured, ImportError) as exc:
+            errors.append(
+                Error(
+                    str(exc),
+                    hint="See 'How To Serve HxRequests From One Endpoint' in the docs.",
+                    obj=hx_cls,
+                    id=E_OWNER_VIEW,
+                )
+            )
+    return errors
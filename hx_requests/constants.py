@@ -7,3 +7,13 @@ MODEL_INSTANCE_PREFIX = "model_instance__"
 # another (tampering the name invalidates the signature).
 HX_TOKEN_PARAM = "hx"
 HX_SIGNING_SALT = "hx-requests"
+
+# Page envelopes (see utils.get_envelope_urls): each row URL carries only
+# ``<envelope id>.<pk>.<short MAC>`` in this query param, and the signed
+# envelope it is bound to travels once per page in a header named after it.
+HX_ROW_PARAM = "hxr"
+HX_ENVELOPE_HEADER_PREFIX = "X-Hx-Envelope-"
+
+# Query params owned by the framework: stripped from the handler's view of
+# request.GET and never carried over from the page's own query string.
+HX_FRAMEWORK_PARAMS = (HX_TOKEN_PARAM, HX_ROW_PARAM, "hx_request_name", "object")
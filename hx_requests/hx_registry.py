@@ -7,6 +7,20 @@ Behavior:
   and stores name -> (module_path, class_name).
 - get_hx_request(name): lazily imports the module and returns the class.
 - get_all_hx_requests(): forces loading all discovered requests (imports all modules).
+- HX_REQUESTS_DISCOVERY_CACHE (optional): path of a JSON index of previous parse
+  results keyed by file path + mtime/size, so a warm start only stats files.
+- HX_REQUESTS_PARALLEL_DISCOVERY (optional): parse cold files on a process pool;
+  registration is still sequential so duplicate detection is unchanged.
+- freeze() / HX_REQUESTS_FREEZE_REGISTRY: resolve everything once and serve
+  lookups from an immutable snapshot.
+- eager_load() / HX_REQUESTS_EAGER_LOAD: import every handler at startup and
+  report per-module import time.
+- HX_REQUESTS_MODULES / AppConfig.hx_requests_modules (optional): an explicit
+  module manifest that replaces filesystem probing.
+- refresh(): re-parse only changed files and update just their names (used by
+  HX_REQUESTS_AUTORELOAD_REFRESH under the development server).
+- Files with no line that could be a `name =` assignment are skipped by a
+  bytes-level regex prefilter before any AST is built.
 
 Notes:
 - This approach intentionally does NOT validate BaseHxRequest inheritance at parse time.
@@ -16,14 +30,31 @@ Notes:
 from __future__ import annotations
 
 import ast
+import contextlib
 import importlib
+import json
 import logging
 import os
+import re
+import sys
+import tempfile
 import threading
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from django.apps import apps
+from django.conf import settings
 
-from hx_requests.hx_requests import BaseHxRequest
+from hx_requests import __version__
+from hx_requests.security_utils import app_label_for_object
+
+if TYPE_CHECKING:
+    # Only for annotations: importing hx_requests.hx_requests pulls in the whole
+    # rendering stack (render_block, messages, forms, the template loader),
+    # which discovery and token handling never need. It is imported lazily
+    # when a handler is actually resolved.
+    from hx_requests.hx_requests import BaseHxRequest
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +63,68 @@ class DuplicateHxRequestNameError(Exception):
     """Raised when two HxRequest classes declare the same ``name``."""
 
 
+class HxRequestMetadata:
+    """
+    Facts about a handler class that never change between requests, computed
+    once when the class is first resolved instead of on every dispatch.
+
+    Attributes
+    ----------
+    name : str
+        The handler's declared ``name`` (what the allow-list policy matches on)
+    hx_class : type
+        The resolved ``BaseHxRequest`` subclass
+    app_label : str, optional
+        Label of the app the handler class lives in
+    bind_to_path : bool
+        Whether the handler's tokens are bound to the path they are minted on
+    routed : bool
+        Whether the handler declares an ``owner_view`` and is served by the hx
+        router instead of the page it is rendered on
+    native_async : bool
+        Whether an async view can dispatch the handler through its async twins
+        (see ``BaseHxRequest.supports_native_async``)
+    """
+
+    __slots__ = ("name", "hx_class", "app_label", "bind_to_path", "routed", "native_async")
+
+    def __init__(self, hx_class: type[BaseHxRequest]):
+        self.name = getattr(hx_class, "name", None)
+        self.hx_class = hx_class
+        self.app_label = app_label_for_object(hx_class)
+        self.bind_to_path = bool(getattr(hx_class, "bind_to_path", True))
+        self.routed = getattr(hx_class, "owner_view", None) is not None
+        supports_native_async = getattr(hx_class, "supports_native_async", None)
+        self.native_async = bool(supports_native_async and supports_native_async())
+
+    def __repr__(self):
+        return f"<HxRequestMetadata {self.name!r} ({self.hx_class.__qualname__})>"
+
+
 class HxRequestRegistry:
     # name -> class OR (module_path, class_name)
     _registry: dict[str, type[BaseHxRequest] | tuple[str, str]] = {}
     _initialized = False
     _lock = threading.Lock()
+    # Immutable name -> class snapshot published by freeze(); None while lazy.
+    _frozen: MappingProxyType[str, type[BaseHxRequest]] | None = None
+    # name -> HxRequestMetadata, built when the class is resolved
+    _metadata: dict[str, HxRequestMetadata] = {}
+    # module_name -> seconds its first import through the registry took
+    _import_timings: dict[str, float] = {}
+    # file_path -> {"mtime_ns", "size", "classes": [[hx_name, class_name], ...]}
+    _file_index: dict[str, dict] = {}
+    _file_index_dirty = False
+    # file_path -> (module_name, [(hx_name, class_name), ...]) registered from it
+    _discovered: dict[str, tuple[str, list[tuple[str, str]]]] = {}
+    # Bumped whenever the set of registered names may have changed.
+    _names_version = 0
+    # Modules whose source changed after import; re-imported on next resolve.
+    _stale_modules: set[str] = set()
+
+    #: Below this many files to parse, a parallel scan is not worth the cost of
+    #: starting worker processes and the scan stays sequential.
+    parallel_discovery_min_files = 32
 
     @classmethod
     def initialize(cls):
@@ -47,27 +135,83 @@ class HxRequestRegistry:
             if cls._initialized:
                 return
 
-            for app in apps.get_app_configs():
-                # 1) hx_requests.py at the root of the app
-                hx_requests_file = os.path.join(app.path, "hx_requests.py")
-                if os.path.isfile(hx_requests_file):
-                    module_name = f"{app.label}.hx_requests"
-                    cls._parse_file(hx_requests_file, module_name)
+            cls._load_discovery_index()
 
-                # 2) hx_requests/ directory at the root of the app
-                hx_requests_dir = os.path.join(app.path, "hx_requests")
-                if os.path.isdir(hx_requests_dir):
-                    cls._process_hx_requests_directory(hx_requests_dir, app.label)
+            candidates = cls._collect_hx_request_files()
+            cls._parse_files_in_parallel([file_path for file_path, _ in candidates])
+            # Registration stays sequential and in scan order, so duplicate names
+            # are detected (and reported) exactly as in a sequential scan.
+            for file_path, module_name in candidates:
+                cls._parse_file(file_path, module_name)
 
+            cls._save_discovery_index(file_path for file_path, _ in candidates)
+            cls._names_version += 1
             cls._initialized = True
 
+        # Outside the lock: freezing imports handler modules, which may
+        # themselves touch the registry.
+        if getattr(settings, "HX_REQUESTS_FREEZE_REGISTRY", False):
+            cls.freeze()
+
+    @classmethod
+    def _collect_hx_request_files(cls, use_manifest: bool = True) -> list[tuple[str, str]]:
+        """
+        Return ``(file_path, module_name)`` for every hx_requests module of every
+        installed app, in a stable scan order.
+
+        When a manifest is configured -- the ``HX_REQUESTS_MODULES`` setting, or
+        an ``hx_requests_modules`` attribute on an app's ``AppConfig`` -- the
+        listed modules are used as-is and the filesystem is not probed for
+        them. ``use_manifest=False`` forces the full scan (used by the system
+        check that validates the manifest).
+        """
+        manifest = getattr(settings, "HX_REQUESTS_MODULES", None) if use_manifest else None
+        if manifest is not None:
+            return [cls._manifest_entry(module_name) for module_name in manifest]
+
+        candidates = []
+        for app in apps.get_app_configs():
+            app_manifest = getattr(app, "hx_requests_modules", None) if use_manifest else None
+            if app_manifest is not None:
+                candidates.extend(cls._manifest_entry(module_name, app) for module_name in app_manifest)
+                continue
+
+            # 1) hx_requests.py at the root of the app
+            hx_requests_file = os.path.join(app.path, "hx_requests.py")
+            if os.path.isfile(hx_requests_file):
+                candidates.append((hx_requests_file, f"{app.label}.hx_requests"))
+
+            # 2) hx_requests/ directory at the root of the app
+            hx_requests_dir = os.path.join(app.path, "hx_requests")
+            if os.path.isdir(hx_requests_dir):
+                candidates.extend(cls._walk_hx_requests_directory(hx_requests_dir, app.label))
+        return candidates
+
+    @classmethod
+    def _manifest_entry(cls, module_name: str, app=None) -> tuple[str, str]:
+        """
+        Map a dotted module path from a manifest to ``(file_path, module_name)``
+        without touching the filesystem: the file is ``<module>.py`` under the
+        path of the app whose package contains it. A module outside every app
+        maps to an empty path, which discovery reports as unreadable.
+        """
+        if app is None:
+            app = apps.get_containing_app_config(module_name)
+        if app is None or not module_name.startswith(f"{app.name}."):
+            return "", module_name
+        rest = module_name[len(app.name) + 1 :].split(".")
+        return os.path.join(app.path, *rest) + ".py", module_name
+
     @classmethod
-    def _process_hx_requests_directory(cls, directory_path: str, app_label: str):
-        """Process all modules in hx_requests/ (including nested subdirectories) via AST."""
-        for root, _, files in os.walk(directory_path):
+    def _walk_hx_requests_directory(cls, directory_path: str, app_label: str) -> list[tuple[str, str]]:
+        """List all modules in hx_requests/ (including nested subdirectories)."""
+        candidates = []
+        for root, dirs, files in os.walk(directory_path):
+            # os.walk order is filesystem-dependent; sort for a deterministic scan.
+            dirs.sort()
             rel_path = os.path.relpath(root, directory_path)
 
-            for file in files:
+            for file in sorted(files):
                 if not (file.endswith(".py") and file != "__init__.py"):
                     continue
 
@@ -80,35 +224,111 @@ class HxRequestRegistry:
                     subpackage = rel_path.replace(os.sep, ".")
                     module_name = f"{app_label}.hx_requests.{subpackage}.{mod_base}"
 
-                cls._parse_file(file_path, module_name)
+                candidates.append((file_path, module_name))
+        return candidates
 
     @classmethod
-    def _parse_file(cls, file_path: str, module_name: str):
+    def _parse_files_in_parallel(cls, file_paths: list[str]):
         """
-        Parse a Python file with AST to find class definitions containing
-        a string literal class attribute called `name`.
+        Pre-parse the files the index does not already cover on a process pool
+        when ``HX_REQUESTS_PARALLEL_DISCOVERY`` is enabled, filling the index so
+        the sequential registration pass that follows only reads results.
+
+        Files that fail to read or parse are left out of the index; the
+        sequential pass re-tries them and logs the usual warning.
         """
+        workers = getattr(settings, "HX_REQUESTS_PARALLEL_DISCOVERY", False)
+        if not workers:
+            return
+        if workers is True:
+            workers = os.cpu_count() or 1
+
+        pending = [path for path in file_paths if not cls._is_indexed(path)]
+        if workers < 2 or len(pending) < cls.parallel_discovery_min_files:
+            return
+
+        # Imported here: the multiprocessing machinery is only needed for this.
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for file_path, scanned in zip(
+                pending, executor.map(_scan_file_quietly, pending, chunksize=chunksize), strict=True
+            ):
+                if scanned is not None:
+                    cls._index_file(file_path, *scanned)
+
+    @classmethod
+    def _is_indexed(cls, file_path: str) -> bool:
+        entry = cls._file_index.get(file_path)
+        if not entry:
+            return False
         try:
-            with open(file_path, encoding="utf-8") as f:
-                source = f.read()
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size
+
+    @classmethod
+    def _index_file(cls, file_path: str, mtime_ns: int, size: int, classes: list[tuple[str, str]]):
+        cls._file_index[file_path] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "classes": [list(pair) for pair in classes],
+        }
+        cls._file_index_dirty = True
+
+    @classmethod
+    def _parse_file(cls, file_path: str, module_name: str):
+        """
+        Register the classes in a Python file that declare a string literal
+        class attribute called `name`. Parse results come from the discovery
+        index when the file is unchanged since it was last parsed.
+        """
+        if not file_path:
+            # A manifest entry that could not be mapped to a file.
+            logger.warning(
+                "hx_requests: skipping %s -- it is not a module of any installed app.", module_name
+            )
+            return
 
-            tree = ast.parse(source, filename=file_path)
+        classes = cls._get_file_classes(file_path)
+        if classes is None:
+            return
 
-            for node in tree.body:
-                if isinstance(node, ast.ClassDef):
-                    hx_name = cls._get_class_name_attribute(node)
-                    if not hx_name:
-                        continue
+        for hx_name, class_name in classes:
+            if hx_name in cls._registry:
+                raise DuplicateHxRequestNameError(
+                    f"Duplicate HxRequest name found: {hx_name} "
+                    f"(in {module_name}). HxRequest names must be unique across all apps."
+                )
 
-                    if hx_name in cls._registry:
-                        raise DuplicateHxRequestNameError(
-                            f"Duplicate HxRequest name found: {hx_name} "
-                            f"(in {module_name}). HxRequest names must be unique across all apps."
-                        )
+            # Store for lazy loading: (module_path, class_name)
+            cls._registry[hx_name] = (module_name, class_name)
+
+        cls._discovered[file_path] = (module_name, classes)
 
-                    # Store for lazy loading: (module_path, class_name)
-                    cls._registry[hx_name] = (module_name, node.name)
+    @classmethod
+    def _get_file_classes(cls, file_path: str) -> list[tuple[str, str]] | None:
+        """
+        Return ``(hx_name, class_name)`` pairs for ``file_path``, or ``None`` if
+        the file could not be read or parsed.
+
+        An index entry whose mtime and size still match the file is reused as-is,
+        so an unchanged file is only ``stat``-ed, never read or parsed.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError as exc:
+            logger.warning("hx_requests: skipping %s -- could not read it (%s).", file_path, exc)
+            return None
 
+        entry = cls._file_index.get(file_path)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return [tuple(pair) for pair in entry["classes"]]
+
+        try:
+            classes = _scan_source(file_path)
         except SyntaxError as exc:
             # A syntax error in a user's hx_requests file would otherwise make
             # its handlers vanish silently and resurface as a mystifying 404.
@@ -119,10 +339,73 @@ class HxRequestRegistry:
                 file_path,
                 exc,
             )
-            return
+            return None
         except OSError as exc:
             logger.warning("hx_requests: skipping %s -- could not read it (%s).", file_path, exc)
+            return None
+
+        # Failures are deliberately not indexed so the warning repeats on every
+        # start until the file is fixed.
+        cls._index_file(file_path, stat.st_mtime_ns, stat.st_size, classes)
+        return classes
+
+    @classmethod
+    def _load_discovery_index(cls):
+        """
+        Seed the in-memory file index from ``HX_REQUESTS_DISCOVERY_CACHE``.
+
+        A missing, unreadable or stale (written by another hx-requests version)
+        index is ignored -- the scan simply falls back to parsing every file.
+        """
+        index_path = getattr(settings, "HX_REQUESTS_DISCOVERY_CACHE", None)
+        if not index_path:
+            return
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != __version__:
+            return
+        files = data.get("files")
+        if isinstance(files, dict):
+            cls._file_index.update(files)
+
+    @classmethod
+    def _save_discovery_index(cls, scanned_paths):
+        """
+        Persist the file index to ``HX_REQUESTS_DISCOVERY_CACHE`` when the scan
+        changed it. Entries for files outside ``scanned_paths`` (deleted or
+        renamed since they were indexed) are dropped first. The file is written
+        to a temporary sibling and swapped in with ``os.replace`` so
+        concurrently booting workers never read a torn index. Failing to write
+        it only costs the next start a full parse.
+        """
+        stale = cls._file_index.keys() - set(scanned_paths)
+        if stale:
+            for file_path in stale:
+                del cls._file_index[file_path]
+            cls._file_index_dirty = True
+
+        index_path = getattr(settings, "HX_REQUESTS_DISCOVERY_CACHE", None)
+        if not index_path or not cls._file_index_dirty:
+            return
+        index_path = os.fspath(index_path)
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(index_path)), suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": __version__, "files": cls._file_index}, f)
+            os.replace(tmp_path, index_path)
+        except OSError as exc:
+            logger.warning("hx_requests: could not write discovery index %s (%s).", index_path, exc)
+            if tmp_path:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
             return
+        cls._file_index_dirty = False
 
     @classmethod
     def _get_class_name_attribute(cls, class_node: ast.ClassDef) -> str | None:
@@ -163,15 +446,30 @@ class HxRequestRegistry:
                 f"Duplicate HxRequest name found: {name}. HxRequest names must be unique across all apps."
             )
         cls._registry[name] = hx_request_class
+        cls._metadata[name] = HxRequestMetadata(hx_request_class)
+        cls._names_version += 1
+        if cls._frozen is not None:
+            # Publish a new snapshot rather than mutating the one readers hold.
+            cls._frozen = MappingProxyType({**cls._frozen, name: hx_request_class})
 
     @classmethod
     def get_hx_request(cls, name: str):
         """
         Retrieve a single HxRequest class by name.
         Lazily imports the defining module if needed.
+
+        Once the registry is frozen (see :meth:`freeze`) this is a single read
+        of the immutable snapshot.
         """
+        frozen = cls._frozen
+        if frozen is not None:
+            return frozen.get(name)
+
         cls.initialize()
+        return cls._resolve(name)
 
+    @classmethod
+    def _resolve(cls, name: str):
         entry = cls._registry.get(name)
         if entry is None:
             return None
@@ -182,8 +480,10 @@ class HxRequestRegistry:
 
         module_name, class_name = entry
 
+        from hx_requests.hx_requests import BaseHxRequest
+
         try:
-            module = importlib.import_module(module_name)
+            module = cls._import_module(module_name)
             hx_class = getattr(module, class_name, None)
             if hx_class is None:
                 return None
@@ -193,13 +493,92 @@ class HxRequestRegistry:
             if not (isinstance(hx_class, type) and issubclass(hx_class, BaseHxRequest)):
                 return None
 
-            # Cache loaded class
+            # Cache loaded class, and the per-class facts dispatch needs
+            cls._metadata[name] = HxRequestMetadata(hx_class)
             cls._registry[name] = hx_class
             return hx_class
 
         except ModuleNotFoundError:
             return None
 
+    @classmethod
+    def get_hx_request_metadata(cls, name: str) -> HxRequestMetadata | None:
+        """
+        Return the :class:`HxRequestMetadata` for the handler registered under
+        ``name`` (resolving it if needed), or ``None`` if there is none.
+        """
+        metadata = cls._metadata.get(name)
+        if metadata is not None:
+            return metadata
+        hx_class = cls.get_hx_request(name)
+        if hx_class is None:
+            return None
+        metadata = cls._metadata.get(name)
+        if metadata is None or metadata.hx_class is not hx_class:
+            metadata = cls._metadata[name] = HxRequestMetadata(hx_class)
+        return metadata
+
+    @classmethod
+    def _import_module(cls, module_name: str):
+        """Import a handler module, recording how long the first import took."""
+        if module_name in cls._stale_modules:
+            cls._stale_modules.discard(module_name)
+            module = sys.modules.get(module_name)
+            if module is not None:
+                return importlib.reload(module)
+        if module_name in cls._import_timings:
+            return importlib.import_module(module_name)
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        cls._import_timings[module_name] = time.perf_counter() - start
+        return module
+
+    @classmethod
+    def eager_load(cls) -> dict[str, float]:
+        """
+        Import every discovered handler module and resolve every name now,
+        instead of on the first request that hits each handler.
+
+        Returns ``module_name -> seconds`` spent importing each handler module
+        (including its transitive imports). A module that was already imported
+        elsewhere reports close to zero. Also logged: a summary at INFO and the
+        per-module times at DEBUG, slowest first.
+
+        Wired into ``AppConfig.ready()`` by ``HX_REQUESTS_EAGER_LOAD``.
+        """
+        start = time.perf_counter()
+        cls.initialize()
+        loaded = cls.get_all_hx_requests()
+        elapsed = time.perf_counter() - start
+
+        timings = dict(cls._import_timings)
+        logger.info(
+            "hx_requests: eagerly loaded %d HxRequests from %d modules in %.1f ms.",
+            len(loaded),
+            len(timings),
+            elapsed * 1000,
+        )
+        for module_name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+            logger.debug("hx_requests: imported %s in %.1f ms.", module_name, seconds * 1000)
+        return timings
+
+    @classmethod
+    def get_hx_request_names(cls) -> list[str]:
+        """Return the name of every registered HxRequest, without importing any."""
+        frozen = cls._frozen
+        if frozen is not None:
+            return list(frozen)
+        cls.initialize()
+        return list(cls._registry)
+
+    @classmethod
+    def get_names_version(cls) -> int:
+        """
+        Return a counter that changes whenever the set of registered names may
+        have changed, so callers can cache facts derived from the names.
+        """
+        return cls._names_version
+
     @classmethod
     def get_all_hx_requests(cls):
         """
@@ -208,18 +587,205 @@ class HxRequestRegistry:
         This will import all discovered modules/classes (not lazy anymore).
         Not used but can be useful for debugging or admin views.
         """
+        frozen = cls._frozen
+        if frozen is not None:
+            return dict(frozen)
+
         cls.initialize()
 
         for name, entry in list(cls._registry.items()):
             if isinstance(entry, tuple):
-                cls.get_hx_request(name)
+                cls._resolve(name)
 
         # By now, any entries that failed to import or failed subclass check
         # may still be tuples. Filter them out to match typical expectation.
         return {k: v for k, v in cls._registry.items() if isinstance(v, type)}
 
+    @classmethod
+    def freeze(cls):
+        """
+        Resolve every discovered entry and publish the result as an immutable
+        ``name -> class`` mapping.
+
+        The snapshot is built off to the side and swapped in with a single
+        assignment, so concurrent readers see either the lazy registry or the
+        complete snapshot, never a half-resolved one. From then on lookups do
+        no importing, no tuple/``isinstance`` branching and no writes. Names
+        that fail to import or are not ``BaseHxRequest`` subclasses are left
+        out, exactly as the lazy path would return ``None`` for them.
+
+        Called automatically after discovery when ``HX_REQUESTS_FREEZE_REGISTRY``
+        is ``True``. :meth:`reset` thaws the registry.
+        """
+        cls.initialize()
+        cls._frozen = MappingProxyType(cls.get_all_hx_requests())
+
+    @classmethod
+    def refresh(cls) -> dict[str, list[str]]:
+        """
+        Pick up added, edited and deleted hx_requests files without a full
+        re-scan or a process restart.
+
+        Only files whose mtime/size changed since they were last parsed are
+        re-parsed; every other file's names are left untouched (including
+        classes already loaded). Names from a changed file go back to lazy
+        entries and their module is re-imported on next use, so edits to a
+        handler's body are picked up too. Manually registered handlers are
+        kept.
+
+        Duplicates are validated against the whole new state before anything
+        is applied: on ``DuplicateHxRequestNameError`` the registry is left as
+        it was. Returns ``{"added": [...], "removed": [...], "reloaded": [...]}``
+        name lists.
+        """
+        if not cls._initialized:
+            cls.initialize()
+            return {"added": sorted(cls._registry), "removed": [], "reloaded": []}
+
+        with cls._lock:
+            # Re-parsing a changed file indexes it; the index is only kept once
+            # the new state validates, or a rejected file would look unchanged
+            # (and keep its stale names) on the next refresh.
+            index_before = (dict(cls._file_index), cls._file_index_dirty)
+            changed_files = set()
+            new_discovered = {}
+            for file_path, module_name in cls._collect_hx_request_files():
+                previous = cls._discovered.get(file_path)
+                if previous is not None and previous[0] == module_name and cls._is_indexed(file_path):
+                    new_discovered[file_path] = previous
+                    continue
+                changed_files.add(file_path)
+                classes = cls._get_file_classes(file_path) if file_path else None
+                new_discovered[file_path] = (module_name, classes or [])
+
+            old_names = {
+                hx_name: (file_path, module_name, class_name)
+                for file_path, (module_name, classes) in cls._discovered.items()
+                for hx_name, class_name in classes
+            }
+            new_names = {}
+            for file_path, (module_name, classes) in new_discovered.items():
+                for hx_name, class_name in classes:
+                    manual = hx_name in cls._registry and hx_name not in old_names
+                    if hx_name in new_names or manual:
+                        cls._file_index, cls._file_index_dirty = index_before
+                        raise DuplicateHxRequestNameError(
+                            f"Duplicate HxRequest name found: {hx_name} "
+                            f"(in {module_name}). HxRequest names must be unique across all apps."
+                        )
+                    new_names[hx_name] = (file_path, module_name, class_name)
+
+            removed = sorted(set(old_names) - set(new_names))
+            added = sorted(set(new_names) - set(old_names))
+            reloaded = sorted(
+                hx_name
+                for hx_name, (file_path, _, _) in new_names.items()
+                if hx_name in old_names
+                and (file_path in changed_files or old_names[hx_name] != new_names[hx_name])
+            )
+
+            for hx_name in removed:
+                cls._registry.pop(hx_name, None)
+                cls._metadata.pop(hx_name, None)
+            for hx_name in (*added, *reloaded):
+                _, module_name, class_name = new_names[hx_name]
+                cls._registry[hx_name] = (module_name, class_name)
+                cls._metadata.pop(hx_name, None)
+                if module_name in sys.modules:
+                    cls._stale_modules.add(module_name)
+
+            cls._discovered = new_discovered
+            cls._save_discovery_index(new_discovered)
+            if added or removed:
+                cls._names_version += 1
+
+        if cls._frozen is not None:
+            cls._frozen = None
+            cls.freeze()
+
+        return {"added": added, "removed": removed, "reloaded": reloaded}
+
+    @classmethod
+    def is_hx_requests_file(cls, file_path) -> bool:
+        """
+        Whether ``file_path`` is (or would be discovered as) an hx_requests
+        module: one already registered from, an app's ``hx_requests.py``, or a
+        module inside an app's ``hx_requests`` package.
+        """
+        file_path = os.fspath(file_path)
+        if file_path in cls._discovered:
+            return True
+        if not file_path.endswith(".py"):
+            return False
+        for app in apps.get_app_configs():
+            if file_path == os.path.join(app.path, "hx_requests.py"):
+                return True
+            if file_path.startswith(os.path.join(app.path, "hx_requests", "")):
+                return True
+        return False
+
+    @classmethod
+    def get_file_hx_names(cls, file_path) -> set[str]:
+        """Return the HxRequest names currently discovered in ``file_path``."""
+        _, classes = cls._discovered.get(os.fspath(file_path), (None, []))
+        return {hx_name for hx_name, _ in classes}
+
     @classmethod
     def reset(cls):
         """Reset the registry state. Useful for tests."""
         cls._registry = {}
         cls._initialized = False
+        cls._frozen = None
+        cls._metadata = {}
+        cls._import_timings = {}
+        cls._file_index = {}
+        cls._file_index_dirty = False
+        cls._discovered = {}
+        cls._stale_modules = set()
+        cls._names_version += 1
+
+
+# Every `name = "..."` / `name: str = "..."` class attribute starts a line, or
+# follows a one-line `class X:`, a `;` or a chained `x = name = ...`. A file with
+# no match cannot declare an HxRequest, so it is skipped without building an AST.
+# False positives (module-level `name = ...`, `name == x`) only cost a parse.
+_NAME_ASSIGNMENT_RE = re.compile(rb"(?:^|[:;=])[ \t]*name[ \t]*(?::[^=\n]*)?=(?!=)", re.MULTILINE)
+
+
+def _scan_source(file_path: str) -> list[tuple[str, str]]:
+    """
+    Read and AST-parse ``file_path``, returning ``(hx_name, class_name)`` for
+    each top-level class with a string literal ``name``. Raises ``OSError`` /
+    ``SyntaxError`` on failure.
+
+    Files that fail the cheap :data:`_NAME_ASSIGNMENT_RE` prefilter return
+    ``[]`` without being parsed.
+    """
+    with open(file_path, "rb") as f:
+        source = f.read()
+
+    if not _NAME_ASSIGNMENT_RE.search(source):
+        return []
+
+    # Parsing bytes lets ast honor a PEP 263 coding cookie (UTF-8 by default).
+    tree = ast.parse(source, filename=file_path)
+
+    classes = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            hx_name = HxRequestRegistry._get_class_name_attribute(node)
+            if hx_name:
+                classes.append((hx_name, node.name))
+    return classes
+
+
+def _scan_file_quietly(file_path: str) -> tuple[int, int, list[tuple[str, str]]] | None:
+    """
+    Process-pool worker: ``(mtime_ns, size, classes)`` for ``file_path``, or
+    ``None`` if it cannot be read or parsed (the parent logs that case).
+    """
+    try:
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size, _scan_source(file_path)
+    except (OSError, SyntaxError):
+        return None
@@ -4,6 +4,7 @@ import contextlib
 import json
 from functools import partial
 
+from asgiref.sync import async_to_sync, sync_to_async
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.messages import get_messages
@@ -16,7 +17,14 @@ from django.utils.functional import cached_property
 from django.utils.html import format_html, strip_tags
 from render_block import render_block_to_string
 
-from hx_requests.utils import deserialize, parse_model_ref, resolve_model_ref
+from hx_requests.utils import (
+    adeserialize,
+    aresolve_model_ref,
+    deserialize,
+    parse_model_ref,
+    resolve_model_ref,
+    shadows_async_twin,
+)
 
 
 class Renderer:
@@ -83,6 +91,18 @@ class BaseHxRequest:
         for a handler whose token must work across paths. Origin hardening layered on
         top of authorization -- it narrows the "replay from another page" surface, it
         does not replace an authorization check.
+    owner_view: type, str, optional
+        A view using HtmxViewMixin (or its dotted path). When set, the HxRequest is
+        served by the hx router endpoint (see hx_requests.urls) instead of the page it
+        is rendered on, and the allow rules are checked against this view. Requires
+        get_views_context = False, since the page view is never run.
+
+    When the host view is async, the HxRequest is dispatched through the async
+    twins of its methods (``adispatch``, ``aget``, ``apost``, ``aget_hx_object``,
+    ...), which run on the event loop and only render in a worker thread. A
+    subclass that overrides a sync method without its async twin is dispatched
+    through the sync methods instead, in a single worker thread, so the override
+    is never skipped.
 
 
 
@@ -111,6 +131,18 @@ class BaseHxRequest:
     refresh_views_context_on_POST: bool = False
     use_current_url: bool = False
     bind_to_path: bool = True
+    owner_view: type | str | None = None
+
+    #: Sync methods paired with the async twin that replaces them when the
+    #: HxRequest is dispatched natively from an async view.
+    async_twins: dict[str, str] = {
+        "dispatch": "adispatch",
+        "get": "aget",
+        "post": "apost",
+        "post_action": "apost_action",
+        "get_hx_object": "aget_hx_object",
+        "_setup_hx_request": "_asetup_hx_request",
+    }
 
     #: Maps the friendly phase keys accepted in a dict return from
     #: :meth:`get_triggers` to their HTMX response-header names.
@@ -230,13 +262,84 @@ class BaseHxRequest:
         except ObjectDoesNotExist:
             raise Http404(f"No {ref[1]} matches the given query for HxRequest '{self.name}'.")
 
+    async def aget_hx_object(self, request, **kwargs):
+        """
+        Async version of :meth:`get_hx_object`, fetching the object with
+        ``aget`` through the same :meth:`get_queryset`. An overridden
+        :meth:`get_queryset` runs in a worker thread.
+        """
+        payload = getattr(request, "hx_payload", None) or {}
+        serialized = payload.get("object")
+        if not serialized:
+            return None
+
+        ref = parse_model_ref(serialized)
+        if ref is None:
+            return await adeserialize(serialized)
+
+        if shadows_async_twin(type(self), "get_queryset", "aget_hx_object"):
+            queryset = await sync_to_async(self.get_queryset)()
+        else:
+            queryset = self.get_queryset()
+        try:
+            return await aresolve_model_ref(*ref, queryset=queryset)
+        except ObjectDoesNotExist:
+            raise Http404(f"No {ref[1]} matches the given query for HxRequest '{self.name}'.")
+
+    @classmethod
+    def supports_native_async(cls) -> bool:
+        """
+        Whether the class can be dispatched through its async twins: no sync
+        method in :attr:`async_twins` is overridden below its twin.
+        """
+        return not any(
+            shadows_async_twin(cls, name, async_name)
+            for name, async_name in cls.async_twins.items()
+            if hasattr(cls, name)
+        )
+
     @cached_property
     def view_response(self):
         # Page view's get(); harvests its context_data. Cached, and only read by
         # get_context_data, so it runs at most once and only when a template renders.
+        if getattr(self.view, "view_is_async", False):
+            # An async page view is only ever reached from the worker thread an
+            # async dispatch renders in; its get() runs back on the event loop.
+            return async_to_sync(self.view.get)(
+                self.request, *self._view_get_args, **self._view_get_kwargs
+            )
         return self.view.get(self.request, *self._view_get_args, **self._view_get_kwargs)
 
+    async def _aview_response(self):
+        if getattr(self.view, "view_is_async", False):
+            response = await self.view.get(self.request, *self._view_get_args, **self._view_get_kwargs)
+        else:
+            response = await sync_to_async(self.view.get)(
+                self.request, *self._view_get_args, **self._view_get_kwargs
+            )
+        # Fill the cached_property, so rendering reuses this response.
+        self.__dict__["view_response"] = response
+        return response
+
     def _setup_hx_request(self, request, *args, **kwargs):
+        self._bind_request(request, *args, **kwargs)
+
+        if not hasattr(self, "hx_object"):
+            self.hx_object = self.get_hx_object(request, **kwargs)
+
+        if self._snapshots_view_context():
+            _ = self.view_response
+
+    async def _asetup_hx_request(self, request, *args, **kwargs):
+        self._bind_request(request, *args, **kwargs)
+
+        if not hasattr(self, "hx_object"):
+            self.hx_object = await self.aget_hx_object(request, **kwargs)
+
+        if self._snapshots_view_context():
+            await self._aview_response()
+
+    def _bind_request(self, request, *args, **kwargs):
         self.request = request
         # Mirror Django's View.setup: expose the resolved args/kwargs on the
         # handler so hooks can read self.kwargs directly. Hooks still receive
@@ -247,9 +350,7 @@ class BaseHxRequest:
         self._view_get_kwargs = kwargs
         self.renderer = Renderer()
 
-        if not hasattr(self, "hx_object"):
-            self.hx_object = self.get_hx_object(request, **kwargs)
-
+    def _snapshots_view_context(self):
         # POST must snapshot the view context before post() mutates it; skip that
         # work when the POST renders nothing (refresh_page/redirect/return_empty).
         # This is a setup-time optimization only, so it reads the static
@@ -257,12 +358,11 @@ class BaseHxRequest:
         # the form has not been validated yet here, so a hook keyed on form state
         # can't run. The hooks stay authoritative at render time; a hook-only
         # handler simply snapshots context it may not use (harmless).
-        if (
+        return bool(
             self.get_views_context
             and self.is_post_request
             and not (self.refresh_page or self.redirect or self.return_empty)
-        ):
-            _ = self.view_response
+        )
 
     def hx_object_to_str(self) -> str:
         if not self.hx_object:
@@ -531,6 +631,11 @@ class BaseHxRequest:
             headers=self.get_headers(**kwargs),
         )
 
+    async def _aget_response(self, **kwargs):
+        # Templates, context hooks and lazy querysets are all sync, so the
+        # whole response is built in one worker thread.
+        return await sync_to_async(self._get_response)(**kwargs)
+
     def dispatch(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
         """
         Entry point for a resolved HxRequest, mirroring Django's
@@ -546,12 +651,27 @@ class BaseHxRequest:
             return HttpResponseNotAllowed(["GET", "POST"])
         return handler(request, *args, **kwargs)
 
+    async def adispatch(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Async version of :meth:`dispatch`, routing to ``aget`` or ``apost``.
+        """
+        handler = getattr(self, f"a{request.method.lower()}", None)
+        if handler is None:
+            return HttpResponseNotAllowed(["GET", "POST"])
+        return await handler(request, *args, **kwargs)
+
     def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
         """
         Method that all GET requests hit.
         """
         return self._get_response(**kwargs)
 
+    async def aget(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Async version of :meth:`get`.
+        """
+        return await self._aget_response(**kwargs)
+
     def post(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
         """
         Method that all POST requests hit.
@@ -562,6 +682,13 @@ class BaseHxRequest:
         response = self.post_action(**kwargs)
         return response if response is not None else self._get_response(**kwargs)
 
+    async def apost(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Async version of :meth:`post`, running :meth:`apost_action`.
+        """
+        response = await self.apost_action(**kwargs)
+        return response if response is not None else await self._aget_response(**kwargs)
+
     def post_action(self, **kwargs) -> HttpResponse | None:
         """
         Hook for a non-form POST side effect (toggle / increment / enqueue).
@@ -584,6 +711,12 @@ class BaseHxRequest:
         """
         return None
 
+    async def apost_action(self, **kwargs) -> HttpResponse | None:
+        """
+        Async version of :meth:`post_action`.
+        """
+        return None
+
 
 class FormHxRequest(BaseHxRequest):
     """
@@ -617,18 +750,31 @@ class FormHxRequest(BaseHxRequest):
         (useful when the form already renders inline field errors).
     """
 
+    async_twins = {
+        **BaseHxRequest.async_twins,
+        "form_valid": "aform_valid",
+        "form_invalid": "aform_invalid",
+    }
+
     form_class: type[Form] | None = None
     add_form_errors_to_error_message: bool = False
     set_initial_from_kwargs: bool = False
     show_form_invalid_message: bool = True
 
     def _setup_hx_request(self, request, *args, **kwargs):
+        self._check_form_class()
+        super()._setup_hx_request(request, *args, **kwargs)
+
+    async def _asetup_hx_request(self, request, *args, **kwargs):
+        self._check_form_class()
+        await super()._asetup_hx_request(request, *args, **kwargs)
+
+    def _check_form_class(self):
         if self.form_class is None:
             raise ImproperlyConfigured(
                 f"{type(self).__name__} is a FormHxRequest but sets no form_class. "
                 "Set form_class to the Form/ModelForm this handler drives."
             )
-        super()._setup_hx_request(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs) -> dict:
         """
@@ -645,6 +791,13 @@ class FormHxRequest(BaseHxRequest):
         self.form = self.form_class(**self.get_form_kwargs(**kwargs))
         return self._get_response(**kwargs)
 
+    async def aget(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Async version of :meth:`get`.
+        """
+        self.form = self.form_class(**await self.aget_form_kwargs(**kwargs))
+        return await self._aget_response(**kwargs)
+
     def post(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
         """
         If the form is valid form_valid.
@@ -659,6 +812,21 @@ class FormHxRequest(BaseHxRequest):
 
         return response if response is not None else self._get_response(**kwargs)
 
+    async def apost(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Async version of :meth:`post`, calling :meth:`aform_valid` or
+        :meth:`aform_invalid`.
+        """
+        self.form = self.form_class(**await self.aget_form_kwargs(**kwargs))
+
+        # Validation may query the database (unique checks, model choices).
+        if await sync_to_async(self.form.is_valid)():
+            response = await self.aform_valid(**kwargs)
+        else:
+            response = await self.aform_invalid(**kwargs)
+
+        return response if response is not None else await self._aget_response(**kwargs)
+
     def form_valid(self, **kwargs) -> HttpResponse | None:
         """
         Saves the form and sets a success message.
@@ -669,6 +837,15 @@ class FormHxRequest(BaseHxRequest):
         self.form.save()
         messages.success(self.request, self.get_success_message(**kwargs))
 
+    async def aform_valid(self, **kwargs) -> HttpResponse | None:
+        """
+        Async version of :meth:`form_valid`. ``ModelForm.save`` has no async
+        version, so the save runs in a worker thread.
+        """
+        await sync_to_async(self.form.save)()
+        # The message renders the object's __str__, which may query the database.
+        messages.success(self.request, await sync_to_async(self.get_success_message)(**kwargs))
+
     def form_invalid(self, **kwargs) -> HttpResponse | None:
         """
         Sets an error message unless ``show_form_invalid_message`` is False.
@@ -679,6 +856,13 @@ class FormHxRequest(BaseHxRequest):
         if self.show_form_invalid_message:
             messages.error(self.request, self.get_error_message(**kwargs))
 
+    async def aform_invalid(self, **kwargs) -> HttpResponse | None:
+        """
+        Async version of :meth:`form_invalid`.
+        """
+        if self.show_form_invalid_message:
+            messages.error(self.request, await sync_to_async(self.get_error_message)(**kwargs))
+
     def get_response_html(self, **kwargs):
         """
         On POST if the form is invalid instead of returning the
@@ -709,6 +893,19 @@ class FormHxRequest(BaseHxRequest):
             form_kwargs.update({"instance": self.hx_object})
         return form_kwargs
 
+    async def aget_form_kwargs(self, **kwargs):
+        """
+        Async version of :meth:`get_form_kwargs`. A subclass that overrides
+        only the sync hooks (:meth:`get_form_kwargs` or :meth:`get_initial`)
+        has them run in a worker thread.
+        """
+        cls = type(self)
+        if shadows_async_twin(cls, "get_form_kwargs", "aget_form_kwargs") or shadows_async_twin(
+            cls, "get_initial", "aget_form_kwargs"
+        ):
+            return await sync_to_async(self.get_form_kwargs)(**kwargs)
+        return self.get_form_kwargs(**kwargs)
+
     def get_initial(self, **kwargs):
         """
         Override to set initial values in the form.
@@ -763,9 +960,11 @@ class DeleteHxRequest(BaseHxRequest):
     HxRequest for deleting objects.
 
     The object passed into a DeleteHxRequest is deleted.
-    Override ``delete`` for custom behavior.
+    Override ``delete`` (or ``adelete``, for async views) for custom behavior.
     """
 
+    async_twins = {**BaseHxRequest.async_twins, "delete": "adelete"}
+
     def post(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
         """
         Calls delete on the hx_object.
@@ -776,6 +975,13 @@ class DeleteHxRequest(BaseHxRequest):
         response = self.delete(**kwargs)
         return response if response is not None else self._get_response(**kwargs)
 
+    async def apost(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Async version of :meth:`post`, calling :meth:`adelete`.
+        """
+        response = await self.adelete(**kwargs)
+        return response if response is not None else await self._aget_response(**kwargs)
+
     def delete(self, **kwargs) -> HttpResponse | None:
         """
         Deletes the hx_object and sets a success message.
@@ -786,6 +992,14 @@ class DeleteHxRequest(BaseHxRequest):
         self.hx_object.delete()
         messages.success(self.request, self.get_success_message(**kwargs))
 
+    async def adelete(self, **kwargs) -> HttpResponse | None:
+        """
+        Async version of :meth:`delete`.
+        """
+        await self.hx_object.adelete()
+        # The message renders the object's __str__, which may query the database.
+        messages.success(self.request, await sync_to_async(self.get_success_message)(**kwargs))
+
     def get_success_message(self, **kwargs) -> str:
         """
         Message set when the object is deleted. Override to set
@@ -0,0 +1,104 @@
+"""
+Preload entry point for prefork servers.
+
+Under gunicorn's ``preload_app`` (or uWSGI without ``lazy-apps``) the
+application is imported once in the master process and workers are forked
+from it. Anything built before the fork is shared between workers
+copy-on-write; anything built lazily is rebuilt -- and held privately -- by
+every worker. :func:`preload` moves the hx-requests work that would otherwise
+happen on each worker's first requests into the master:
+
+- registry discovery and the import of every handler module,
+- the per-handler metadata records,
+- compilation of the handlers' static templates into the cached template
+  loader,
+- optionally ``gc.freeze()``, so the collector never touches (and so never
+  un-shares) the preloaded objects in the workers.
+
+Call it from the module the server preloads, after Django is set up::
+
+    # wsgi.py
+    application = get_wsgi_application()
+
+    from hx_requests.preload import preload
+
+    preload(freeze_gc=True)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+from hx_requests.hx_registry import HxRequestRegistry
+
+
+def preload(freeze_registry: bool = True, warm_templates: bool = True, freeze_gc: bool = False) -> dict:
+    """
+    Do all of hx-requests' per-process warm-up now, in the pre-fork master.
+
+    Parameters
+    ----------
+    freeze_registry : bool
+        Publish the registry as an immutable snapshot (see
+        ``HxRequestRegistry.freeze``) so workers never write to it.
+    warm_templates : bool
+        Compile every template a handler names statically (``GET_template``,
+        ``POST_template``, the templates of dict-form blocks) and the modal and
+        messages templates. Only pays off with the cached template loader,
+        which Django uses by default.
+    freeze_gc : bool
+        Run a full collection and then ``gc.freeze()``, which moves every
+        tracked object into the permanent generation, ignored by later
+        collections.
+
+    Returns ``{"handlers": <count>, "templates": <count>}``.
+    """
+    if freeze_registry:
+        HxRequestRegistry.freeze()
+    else:
+        HxRequestRegistry.eager_load()
+    hx_classes = HxRequestRegistry.get_all_hx_requests()
+
+    # Resolution already built the metadata; this covers manual registrations.
+    for name in hx_classes:
+        HxRequestRegistry.get_hx_request_metadata(name)
+
+    templates = set()
+    if warm_templates:
+        for template_name in _static_template_names(hx_classes.values()):
+            with contextlib.suppress(TemplateDoesNotExist):
+                get_template(template_name)
+                templates.add(template_name)
+
+    if freeze_gc:
+        gc.collect()
+        gc.freeze()
+
+    return {"handlers": len(hx_classes), "templates": len(templates)}
+
+
+def _static_template_names(hx_classes) -> set[str]:
+    names = set()
+    for hx_class in hx_classes:
+        for attr in ("GET_template", "POST_template"):
+            names.update(_as_template_names(getattr(hx_class, attr, None)))
+        for attr in ("GET_block", "POST_block"):
+            blocks = getattr(hx_class, attr, None)
+            if isinstance(blocks, dict):
+                names.update(name for name in blocks if isinstance(name, str))
+    for setting_name in ("HX_REQUESTS_MODAL_TEMPLATE", "HX_REQUESTS_HX_MESSAGES_TEMPLATE"):
+        names.update(_as_template_names(getattr(settings, setting_name, None)))
+    return names
+
+
+def _as_template_names(value) -> list[str]:
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, (list, tuple)):
+        return [name for name in value if isinstance(name, str) and name]
+    return []
@@ -7,19 +7,59 @@ from django.apps import apps
 # ---------- App & URL helpers (pure) ----------
 
 
+# (app_configs, trie, resolved labels), built from the app registry on first
+# use. The registry replaces ``apps.app_configs`` whenever it is repopulated
+# (override_settings(INSTALLED_APPS=...) and set_installed_apps), so a stale
+# index is spotted by identity and rebuilt.
+_label_index: tuple[dict, dict, dict[str, str | None]] | None = None
+
+
+def _get_label_index() -> tuple[dict, dict, dict[str, str | None]]:
+    global _label_index
+    index = _label_index
+    if index is None or index[0] is not apps.app_configs:
+        # A trie over the dotted app module names; the node at the end of an
+        # app's name holds its label under the ``None`` key.
+        trie: dict = {}
+        for cfg in apps.get_app_configs():
+            node = trie
+            for part in cfg.name.split("."):
+                node = node.setdefault(part, {})
+            node[None] = cfg.label
+        index = _label_index = (apps.app_configs, trie, {})
+    return index
+
+
 def app_label_from_module(module_name: str) -> str | None:
     """
-    Resolve a Django app label from a module path.
-    Uses apps.get_containing_app_config with a light fallback.
+    Resolve a Django app label from a module path: the label of the app whose
+    module is the longest prefix of the path (as
+    apps.get_containing_app_config does), with a light fallback.
+
+    Results are memoized until the app registry changes, and a miss walks a
+    trie of the installed apps' module names, one step per path segment.
     """
-    cfg = apps.get_containing_app_config(module_name)
-    if cfg:
-        return cfg.label
-    top = module_name.split(".", 1)[0]
+    _, trie, labels = _get_label_index()
     try:
-        return apps.get_app_config(top).label
-    except Exception:
-        return None
+        return labels[module_name]
+    except KeyError:
+        pass
+
+    label = None
+    node = trie
+    for part in module_name.split("."):
+        node = node.get(part)
+        if node is None:
+            break
+        label = node.get(None, label)
+    if label is None:
+        top = module_name.split(".", 1)[0]
+        try:
+            label = apps.get_app_config(top).label
+        except Exception:
+            label = None
+    labels[module_name] = label
+    return label
 
 
 def app_label_for_object(obj: Any) -> str | None:
@@ -0,0 +1,59 @@
+"""
+Signers for ``hx`` tokens. The token codecs sign with the class named by the
+``HX_REQUESTS_SIGNER`` setting, which must be a ``django.core.signing.Signer``
+subclass; by default they use Django's own signers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+
+from django.conf import settings
+from django.core import signing
+from django.utils.encoding import force_bytes
+from django.utils.module_loading import import_string
+
+
+def get_hx_signer(salt: str, default: type[signing.Signer] | None = None) -> signing.Signer | None:
+    """
+    Return an instance of the ``HX_REQUESTS_SIGNER`` class for ``salt`` (the
+    setting may be the class itself or its dotted path). When the setting is
+    unset, return an instance of ``default``, or ``None`` if there is none.
+    """
+    signer_class = getattr(settings, "HX_REQUESTS_SIGNER", None) or default
+    if signer_class is None:
+        return None
+    if isinstance(signer_class, str):
+        signer_class = import_string(signer_class)
+    return signer_class(salt=salt)
+
+
+@lru_cache(maxsize=32)
+def _keyed_blake2b(secret: str | bytes, salt: str):
+    # A per-salt key is derived from the secret once. Hashing it into a keyed
+    # BLAKE2b state up front means each signature only copies that state and
+    # hashes the value. Keyed on the secret, so SECRET_KEY_FALLBACKS entries
+    # get their own state.
+    secret_digest = hashlib.blake2b(force_bytes(secret), digest_size=64).digest()
+    derived_key = hashlib.blake2b(
+        force_bytes(salt + "signer"), key=secret_digest, digest_size=64
+    ).digest()
+    return hashlib.blake2b(key=derived_key, digest_size=32)
+
+
+class Blake2bSigner(signing.Signer):
+    """
+    A ``Signer`` whose signature is a keyed BLAKE2b MAC instead of Django's
+    HMAC-SHA256.
+
+    BLAKE2b is a MAC on its own when keyed, so there is no HMAC double hashing,
+    and the keyed state for each (secret, salt) pair is derived once per
+    process and reused. ``SECRET_KEY_FALLBACKS`` are honoured exactly as by
+    ``Signer``: a token signed with any fallback key still verifies.
+    """
+
+    def signature(self, value, key=None):
+        state = _keyed_blake2b(key or self.key, self.salt).copy()
+        state.update(force_bytes(value))
+        return signing.b64_encode(state.digest()).decode()
@@ -6,7 +6,7 @@ from django import template
 from django.middleware.csrf import get_token
 from django.utils.html import format_html
 
-from hx_requests.utils import get_url
+from hx_requests.utils import HxEnvelope, get_envelope_urls, get_url, get_urls
 
 register = template.Library()
 
@@ -54,3 +54,65 @@ def hx_url(context: dict, hx_request_name: str, object=None, use_full_path=False
     ```
     """
     return get_url(context, hx_request_name, object, use_full_path, **kwargs)
+
+
+@register.simple_tag(takes_context=True)
+def hx_urls(context: dict, hx_request_name: str, objects, use_full_path=False, **kwargs) -> dict:
+    """
+    Returns the URLs for one HX request over many objects as a mapping of pk -> URL.
+    The work shared by every object is done once, so use it for long lists instead of
+    an hx_url per row. Assign the result and look each object up with hx_url_for.
+    For example:
+
+    ```
+    {% hx_urls 'edit-widget' widgets as edit_urls %}
+    {% for widget in widgets %}
+        <button hx-get="{{ edit_urls|hx_url_for:widget }}"></button>
+    {% endfor %}
+    ```
+    """
+    return get_urls(context, hx_request_name, objects, use_full_path, **kwargs)
+
+
+@register.simple_tag(takes_context=True)
+def hx_envelope(
+    context: dict, hx_request_name: str, objects, use_full_path=False, **kwargs
+) -> HxEnvelope:
+    """
+    Like hx_urls, but the handler, kwargs and path are signed once into a page envelope
+    and each object's URL only carries its pk and a short MAC. The envelope has to be sent
+    with the requests: render hx_envelope_attrs on an element that wraps the rows.
+    For example:
+
+    ```
+    {% hx_envelope 'edit-widget' widgets as edit_urls %}
+    <tbody {% hx_envelope_attrs edit_urls %}>
+        {% for widget in widgets %}
+            <tr><td><button hx-get="{{ edit_urls|hx_url_for:widget }}"></button></td></tr>
+        {% endfor %}
+    </tbody>
+    ```
+    """
+    return get_envelope_urls(context, hx_request_name, objects, use_full_path, **kwargs)
+
+
+@register.simple_tag
+def hx_envelope_attrs(*envelopes: HxEnvelope) -> str:
+    """
+    Renders the hx-headers attribute that sends one or more page envelopes (from
+    hx_envelope) with every htmx request made inside the element.
+    """
+    headers = {}
+    for envelope in envelopes:
+        headers.update(envelope.headers)
+    if not headers:
+        return ""
+    return format_html("hx-headers='{}'", json.dumps(headers))
+
+
+@register.filter
+def hx_url_for(urls: dict, object) -> str:
+    """
+    Looks up an object's URL in the mapping returned by hx_urls.
+    """
+    return urls.get(object.pk, "")
@@ -0,0 +1,342 @@
+"""
+Token codecs: how a payload (``{"name", "object", "kw", "kw_models"?,
+"path"?}``) is turned into the signed ``hx`` token and back. The codec is chosen with the
+``HX_REQUESTS_TOKEN_CODEC`` setting (see :func:`hx_requests.utils.get_token_codec`).
+
+A codec is any class with ``encode(payload) -> str`` and ``decode(token) ->
+payload``. ``decode`` must verify the signature and raise
+``django.core.signing.BadSignature`` for anything it cannot trust.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+from typing import Any
+
+from django.conf import settings
+from django.core import signing
+from django.core.serializers.json import DjangoJSONEncoder
+
+from hx_requests.constants import HX_SIGNING_SALT, MODEL_INSTANCE_PREFIX
+from hx_requests.signers import get_hx_signer
+
+__ = "__"
+
+
+def _dump_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), cls=DjangoJSONEncoder)
+
+
+# Serialized payloads shorter than this are never compressed: zlib's own
+# overhead means it almost never wins on them, and skipping it saves the work.
+DEFAULT_COMPRESS_THRESHOLD = 256
+
+
+def _compression_policy() -> tuple[int | None, int]:
+    return (
+        getattr(settings, "HX_REQUESTS_TOKEN_COMPRESS_THRESHOLD", DEFAULT_COMPRESS_THRESHOLD),
+        getattr(settings, "HX_REQUESTS_TOKEN_COMPRESS_LEVEL", zlib.Z_DEFAULT_COMPRESSION),
+    )
+
+
+def _compress(data: bytes, threshold: int | None, level: int) -> bytes | None:
+    """
+    Return ``data`` zlib-compressed if it is at least ``threshold`` bytes long
+    and compressing it saves more than the one byte that marks a compressed
+    token; otherwise ``None``.
+    """
+    if threshold is None or len(data) < threshold:
+        return None
+    compressed = zlib.compress(data, level)
+    return compressed if len(compressed) < len(data) - 1 else None
+
+
+class DjangoJSONSerializer(signing.JSONSerializer):
+    """``signing.JSONSerializer`` that also encodes ``DjangoJSONEncoder`` types."""
+
+    def dumps(self, obj):
+        return _dump_json(obj).encode("latin-1")
+
+
+class JSONTokenCodec:
+    """
+    The default codec: the payload in ``django.core.signing.dumps`` format, i.e.
+    base64-encoded JSON with a timestamp and an HMAC-SHA256 signature. With
+    ``HX_REQUESTS_SIGNER`` set, the JSON is signed by that signer instead.
+    Large payloads are zlib-compressed when that makes the token shorter (see
+    ``HX_REQUESTS_TOKEN_COMPRESS_THRESHOLD``).
+    """
+
+    def __init__(self):
+        self.signer = get_hx_signer(HX_SIGNING_SALT)
+        self.compress_threshold, self.compress_level = _compression_policy()
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        # The same layout ``signing.dumps`` / ``Signer.sign_object`` produce (a
+        # leading "." marks zlib data), so ``decode`` reads it with them; only
+        # the decision to compress is ours.
+        data = _dump_json(payload).encode()
+        compressed = _compress(data, self.compress_threshold, self.compress_level)
+        if compressed is None:
+            value = signing.b64_encode(data).decode()
+        else:
+            value = "." + signing.b64_encode(compressed).decode()
+        if self.signer is None:
+            return signing.TimestampSigner(salt=HX_SIGNING_SALT).sign(value)
+        return self.signer.sign(value)
+
+    def decode(self, token: str) -> dict[str, Any]:
+        if self.signer is None:
+            return signing.loads(token, salt=HX_SIGNING_SALT, serializer=DjangoJSONSerializer)
+        return self.signer.unsign_object(token, serializer=DjangoJSONSerializer)
+
+
+# Field tags of the binary format. Every field is a tag byte followed by its
+# value; strings are a varint byte length followed by UTF-8.
+_FORMAT_VERSION = 1
+_COMPRESSED = 0  # in place of the version byte: the rest is a zlib-compressed token body
+_NAME_ID = 1  # 4-byte handler id (see BinaryTokenCodec)
+_NAME = 2  # string
+_MODEL_INT_PK = 3  # "app_label.model_name" string, varint pk
+_MODEL_PK = 4  # "app_label.model_name" string, string pk
+_OBJECT = 5  # any other serialized object, string
+_KWARG = 6  # key string, serialized value string (tokens minted before typed kwargs)
+_PATH = 7  # string
+_TYPED_KWARGS = 8  # the whole ``kw`` dict as one JSON string
+_MODEL_KWARG = 9  # key string, then a model object field
+_STORED = 10  # payload store key string (see HX_REQUESTS_PAYLOAD_STORE_THRESHOLD)
+_ROWS = 11  # "app_label.model_name" of a page envelope's rows (see get_envelope_urls)
+
+_HANDLER_ID_SIZE = 4
+
+
+def _handler_id(name: str) -> bytes:
+    return hashlib.blake2b(name.encode(), digest_size=_HANDLER_ID_SIZE).digest()
+
+
+def _write_varint(buffer: bytearray, value: int):
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _write_str(buffer: bytearray, value: str):
+    data = value.encode()
+    _write_varint(buffer, len(data))
+    buffer += data
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    def at_end(self) -> bool:
+        return self.offset >= len(self.data)
+
+    def read(self, size: int) -> bytes:
+        end = self.offset + size
+        if end > len(self.data):
+            raise ValueError("truncated")
+        chunk = self.data[self.offset : end]
+        self.offset = end
+        return chunk
+
+    def read_varint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self.read(1)[0]
+            value |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return value
+            shift += 7
+
+    def read_str(self) -> str:
+        return self.read(self.read_varint()).decode()
+
+
+class BinaryTokenCodec:
+    """
+    A compact codec for pages where tokens make up a large share of the HTML.
+
+    The payload is packed into tagged binary fields instead of JSON: a
+    registered handler's name becomes a 4-byte id (a hash of the name, looked
+    up in the registry on decode), a model object becomes its label plus a
+    varint pk, and no timestamp is included. The result is base64-encoded and
+    signed under its own salt with ``django.core.signing.Signer`` (HMAC-SHA256,
+    honouring ``SECRET_KEY_FALLBACKS``), or with ``HX_REQUESTS_SIGNER`` if set.
+    Large payloads are compressed under the same policy as the JSON codec.
+
+    Tokens minted by :class:`JSONTokenCodec` are still accepted, so switching
+    to this codec doesn't break pages that were rendered before the switch.
+    """
+
+    salt = f"{HX_SIGNING_SALT}:binary"
+
+    def __init__(self):
+        self.signer = get_hx_signer(self.salt, default=signing.Signer)
+        self.compress_threshold, self.compress_level = _compression_policy()
+        self._names_by_id: dict[bytes, str | None] = {}
+        # Registry names version the ids were loaded at (None: never loaded).
+        self._ids_version: int | None = None
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        buffer = bytearray([_FORMAT_VERSION])
+
+        name = payload["name"]
+        if self._has_unique_id(name):
+            buffer.append(_NAME_ID)
+            buffer += _handler_id(name)
+        else:
+            buffer.append(_NAME)
+            _write_str(buffer, name)
+
+        obj = payload.get("object")
+        if obj is not None:
+            self._write_object(buffer, obj)
+
+        if "kw" in payload:
+            buffer.append(_TYPED_KWARGS)
+            _write_str(buffer, _dump_json(payload["kw"]))
+        for key, ref in payload.get("kw_models", {}).items():
+            buffer.append(_MODEL_KWARG)
+            _write_str(buffer, key)
+            self._write_object(buffer, ref)
+        for key, value in payload.get("kwargs", {}).items():
+            buffer.append(_KWARG)
+            _write_str(buffer, key)
+            _write_str(buffer, value)
+
+        path = payload.get("path")
+        if path is not None:
+            buffer.append(_PATH)
+            _write_str(buffer, path)
+
+        rows = payload.get("rows")
+        if rows is not None:
+            buffer.append(_ROWS)
+            _write_str(buffer, rows)
+
+        stored = payload.get("stored")
+        if stored is not None:
+            buffer.append(_STORED)
+            _write_str(buffer, stored)
+
+        data = bytes(buffer)
+        compressed = _compress(data, self.compress_threshold, self.compress_level)
+        if compressed is not None:
+            data = bytes([_COMPRESSED]) + compressed
+        return self.signer.sign(signing.b64_encode(data).decode())
+
+    def decode(self, token: str) -> dict[str, Any]:
+        if token.startswith(("ey", ".")):
+            # Base64 of '{"...' (or a compressed payload): minted by the JSON codec.
+            return JSONTokenCodec().decode(token)
+
+        value = self.signer.unsign(token)
+        try:
+            data = signing.b64_decode(value.encode())
+            if data[:1] == bytes([_COMPRESSED]):
+                data = zlib.decompress(data[1:])
+            return self._read_payload(_Reader(data))
+        except (ValueError, IndexError, UnicodeDecodeError, zlib.error) as e:
+            # Correctly signed but unreadable: a token from another format version.
+            raise signing.BadSignature("Malformed hx token.") from e
+
+    def _write_object(self, buffer: bytearray, obj: str):
+        if not obj.startswith(MODEL_INSTANCE_PREFIX):
+            buffer.append(_OBJECT)
+            _write_str(buffer, obj)
+            return
+        app_label, model_name, pk = obj[len(MODEL_INSTANCE_PREFIX) :].split(__, 2)
+        label = f"{app_label}.{model_name}"
+        if pk.isdigit() and pk.isascii() and str(int(pk)) == pk:
+            buffer.append(_MODEL_INT_PK)
+            _write_str(buffer, label)
+            _write_varint(buffer, int(pk))
+        else:
+            buffer.append(_MODEL_PK)
+            _write_str(buffer, label)
+            _write_str(buffer, pk)
+
+    def _read_payload(self, reader: _Reader) -> dict[str, Any]:
+        if reader.read(1)[0] != _FORMAT_VERSION:
+            raise ValueError("unknown format version")
+
+        payload = {"name": None, "object": None}
+        while not reader.at_end():
+            tag = reader.read(1)[0]
+            if tag == _NAME_ID:
+                payload["name"] = self._name_for_id(reader.read(_HANDLER_ID_SIZE))
+            elif tag == _NAME:
+                payload["name"] = reader.read_str()
+            elif tag in (_MODEL_INT_PK, _MODEL_PK, _OBJECT):
+                payload["object"] = self._read_object(reader, tag)
+            elif tag == _TYPED_KWARGS:
+                payload["kw"] = json.loads(reader.read_str())
+            elif tag == _MODEL_KWARG:
+                key = reader.read_str()
+                payload.setdefault("kw_models", {})[key] = self._read_object(reader, reader.read(1)[0])
+            elif tag == _KWARG:
+                key = reader.read_str()
+                payload.setdefault("kwargs", {})[key] = reader.read_str()
+            elif tag == _PATH:
+                payload["path"] = reader.read_str()
+            elif tag == _STORED:
+                payload["stored"] = reader.read_str()
+            elif tag == _ROWS:
+                payload["rows"] = reader.read_str()
+            else:
+                raise ValueError(f"unknown field tag {tag}")
+        if payload["name"] is None:
+            raise ValueError("no handler name")
+        if "kw" not in payload and "kwargs" not in payload:
+            payload["kwargs"] = {}
+        return payload
+
+    def _read_object(self, reader: _Reader, tag: int) -> str:
+        if tag == _OBJECT:
+            return reader.read_str()
+        if tag not in (_MODEL_INT_PK, _MODEL_PK):
+            raise ValueError(f"unknown object tag {tag}")
+        app_label, model_name = reader.read_str().split(".", 1)
+        pk = reader.read_varint() if tag == _MODEL_INT_PK else reader.read_str()
+        return f"{MODEL_INSTANCE_PREFIX}{app_label}{__}{model_name}{__}{pk}"
+
+    def _has_unique_id(self, name: str) -> bool:
+        # Unregistered names and names sharing an id are minted literally; the
+        # table is only rebuilt when the registered names change, not on every
+        # such mint.
+        self._sync_handler_ids()
+        return self._names_by_id.get(_handler_id(name)) == name
+
+    def _name_for_id(self, handler_id: bytes) -> str:
+        self._sync_handler_ids()
+        name = self._names_by_id.get(handler_id)
+        if name is None:
+            # Validly signed, but the handler is gone (or its id is ambiguous).
+            raise ValueError("unknown handler id")
+        return name
+
+    def _sync_handler_ids(self):
+        # Lazy import: avoids a token_codecs -> hx_registry import at startup.
+        from hx_requests.hx_registry import HxRequestRegistry
+
+        if self._ids_version != HxRequestRegistry.get_names_version():
+            self._load_handler_ids()
+
+    def _load_handler_ids(self):
+        from hx_requests.hx_registry import HxRequestRegistry
+
+        names_by_id: dict[bytes, str | None] = {}
+        names = HxRequestRegistry.get_hx_request_names()
+        # Read after listing the names: listing may run the initial discovery.
+        self._ids_version = HxRequestRegistry.get_names_version()
+        for name in names:
+            handler_id = _handler_id(name)
+            # Two names sharing an id are both minted with their literal name.
+            names_by_id[handler_id] = None if handler_id in names_by_id else name
+        self._names_by_id = names_by_id
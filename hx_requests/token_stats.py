@@ -0,0 +1,76 @@
+"""
+Per-handler statistics on the size of minted ``hx`` tokens, collected while the
+``HX_REQUESTS_TOKEN_STATS`` setting is on. They show which handlers add the most
+weight to rendered pages, e.g. ones whose kwargs make every token large.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds (in characters) of the histogram buckets; a last bucket takes
+# everything longer.
+SIZE_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096)
+
+
+class TokenSizeStats:
+    """
+    A thread-safe tally of token sizes per handler: how many tokens were
+    minted, their total and largest size, and a histogram over
+    :data:`SIZE_BUCKETS`.
+    """
+
+    def __init__(self):
+        self._handlers: dict[str, list[Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, hx_request_name: str, size: int) -> None:
+        bucket = bisect_left(SIZE_BUCKETS, size)
+        with self._lock:
+            entry = self._handlers.get(hx_request_name)
+            if entry is None:
+                entry = self._handlers[hx_request_name] = [0, 0, 0, [0] * (len(SIZE_BUCKETS) + 1)]
+            entry[0] += 1
+            entry[1] += size
+            entry[2] = max(entry[2], size)
+            entry[3][bucket] += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the statistics as ``{handler name: {...}}``, heaviest handlers
+        (by total token size) first.
+        """
+        labels = [f"<={bound}" for bound in SIZE_BUCKETS] + [f">{SIZE_BUCKETS[-1]}"]
+        with self._lock:
+            entries = sorted(self._handlers.items(), key=lambda item: item[1][1], reverse=True)
+            return {
+                name: {
+                    "count": count,
+                    "total_size": total,
+                    "mean_size": total / count,
+                    "max_size": largest,
+                    "histogram": dict(zip(labels, histogram, strict=True)),
+                }
+                for name, (count, total, largest, histogram) in entries
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._handlers.clear()
+
+
+token_stats = TokenSizeStats()
+
+
+def get_token_stats() -> dict[str, dict[str, Any]]:
+    """
+    Return the token size statistics collected so far in this process (see
+    ``HX_REQUESTS_TOKEN_STATS``), heaviest handlers first.
+    """
+    return token_stats.snapshot()
+
+
+def reset_token_stats() -> None:
+    token_stats.clear()
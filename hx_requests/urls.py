@@ -0,0 +1,15 @@
+"""
+The hx router: one endpoint for every HxRequest that declares an ``owner_view``.
+Mount it once in the project's URLconf, e.g. with
+``path("hx/", include("hx_requests.urls"))``.
+"""
+
+from django.urls import path
+
+from hx_requests.views import HxRouterView
+
+app_name = "hx_requests"
+
+urlpatterns = [
+    path("", HxRouterView.as_view(), name="router"),
+]
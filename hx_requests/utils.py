@@ -1,3 +1,4 @@
+import hashlib
 import json
 from urllib.parse import urlencode
 
@@ -5,16 +6,39 @@ from django.apps import apps
 from django.conf import settings
 from django.core import signing
 from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
 from django.db import models
+from django.dispatch import receiver
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.utils.module_loading import import_string
 
+from hx_requests.cache_utils import LRUCache
 from hx_requests.constants import (
-    HX_SIGNING_SALT,
+    HX_ENVELOPE_HEADER_PREFIX,
+    HX_FRAMEWORK_PARAMS,
+    HX_ROW_PARAM,
+    HX_SIGNING_SALT,  # noqa: F401 -- re-exported
     HX_TOKEN_PARAM,
     MODEL_INSTANCE_PREFIX,
 )
+from hx_requests.token_stats import token_stats
 
 __ = "__"
 
+# Cache key prefix for payloads kept in the server-side payload store.
+PAYLOAD_STORE_KEY_PREFIX = "hx_requests:payload:"
+
+# Upper bound on the number of minted tokens kept for reuse (see
+# HX_REQUESTS_TOKEN_CACHE_SIZE). Sized so a few thousand tags -- a long table
+# with several actions per row -- fit without cycling the cache.
+DEFAULT_TOKEN_CACHE_SIZE = 4096
+
+DEFAULT_TOKEN_CODEC = "hx_requests.token_codecs.JSONTokenCodec"
+
+_token_codec = None
+_token_cache = None
+_payload_cache = None
+
 
 def serialize(value):
     if isinstance(value, models.Model):
@@ -70,6 +94,31 @@ def resolve_model_ref(app_label, model_name, pk, queryset=None):
     return queryset.get(pk=pk)
 
 
+async def aresolve_model_ref(app_label, model_name, pk, queryset=None):
+    """Async version of :func:`resolve_model_ref`, fetching with ``aget``."""
+    if queryset is None:
+        queryset = apps.get_model(app_label, model_name)._default_manager.all()
+    return await queryset.aget(pk=pk)
+
+
+async def adeserialize(value):
+    ref = parse_model_ref(value)
+    if ref is not None:
+        return await aresolve_model_ref(*ref)
+    return json.loads(value)
+
+
+def shadows_async_twin(cls, name, async_name):
+    """
+    Whether ``cls`` overrides the sync method ``name`` further down its MRO
+    than the class that defines its async twin ``async_name``, so that running
+    the twin would silently skip the override.
+    """
+    sync_owner = next(klass for klass in cls.__mro__ if name in vars(klass))
+    async_owner = next(klass for klass in cls.__mro__ if async_name in vars(klass))
+    return not issubclass(async_owner, sync_owner)
+
+
 def is_htmx_request(request):
     return "HX-Request" in request.headers
 
@@ -87,6 +136,47 @@ def deserialize_kwargs(**kwargs):
     return {k: deserialize(v) for k, v in kwargs.items()}
 
 
+def split_typed_kwargs(**kwargs):
+    """
+    Split kwargs for a token into ``(kw, kw_models)``: model instances become
+    serialized references in ``kw_models``, everything else stays as-is in
+    ``kw`` and is JSON-encoded once, together with the rest of the payload
+    (``DjangoJSONEncoder`` types included), when the token is signed.
+    """
+    kw, kw_models = {}, {}
+    for key, value in kwargs.items():
+        if isinstance(value, models.Model):
+            kw_models[key] = serialize(value)
+        else:
+            kw[key] = value
+    return kw, kw_models
+
+
+def deserialize_payload_kwargs(payload):
+    """
+    Return the live kwargs carried by a verified token payload: ``kw`` values
+    as decoded, plus the model instances referenced in ``kw_models``. Tokens
+    minted before typed kwargs carry a ``kwargs`` dict of individually
+    serialized values instead; those are read with :func:`deserialize_kwargs`.
+    """
+    if "kwargs" in payload:
+        return deserialize_kwargs(**payload["kwargs"])
+    kwargs = dict(payload.get("kw", {}))
+    for key, ref in payload.get("kw_models", {}).items():
+        kwargs[key] = deserialize(ref)
+    return kwargs
+
+
+async def adeserialize_payload_kwargs(payload):
+    """Async version of :func:`deserialize_payload_kwargs`."""
+    if "kwargs" in payload:
+        return {k: await adeserialize(v) for k, v in payload["kwargs"].items()}
+    kwargs = dict(payload.get("kw", {}))
+    for key, ref in payload.get("kw_models", {}).items():
+        kwargs[key] = await adeserialize(ref)
+    return kwargs
+
+
 def sign_hx_payload(hx_request_name, obj=None, bind_path=None, **kwargs):
     """
     Pack everything the template tag controls -- the handler name, the object,
@@ -94,48 +184,248 @@ def sign_hx_payload(hx_request_name, obj=None, bind_path=None, **kwargs):
     read the token (it is base64-encoded JSON) but cannot forge it without
     ``SECRET_KEY``, which closes the object/kwarg/name tampering vectors.
 
+    Kwargs travel typed (see :func:`split_typed_kwargs`); read them back with
+    :func:`deserialize_payload_kwargs`.
+
     When ``bind_path`` is given, it is packed into the token too, binding the
     token to that URL path (see :func:`get_url` and ``bind_to_path``).
+
+    Minted tokens are kept in a bounded LRU cache keyed by the payload, and a
+    cache hit reuses the token minted earlier for the same payload: a table
+    that renders the same tag on every row signs it once.
     """
-    payload = {
-        "name": hx_request_name,
-        "object": serialize(obj) if obj is not None else None,
-        "kwargs": serialize_kwargs(**kwargs),
-    }
+    mint = _token_minter(hx_request_name, bind_path, kwargs)
+    return mint(serialize(obj) if obj is not None else None)
+
+
+def _token_minter(hx_request_name, bind_path, kwargs):
+    """
+    Return ``mint(object_ref) -> token`` for one handler, bound path and set of
+    kwargs. Everything that doesn't depend on the object (splitting the kwargs,
+    their cache key, the codec) is done once, up front, so minting tokens for
+    many objects only pays for the per-object part.
+    """
+    kw, kw_models = split_typed_kwargs(**kwargs)
+    kwargs_key = (_kwargs_cache_key(kw), tuple(kw_models.items()))
+    payload = {"name": hx_request_name, "object": None, "kw": kw}
+    if kw_models:
+        payload["kw_models"] = kw_models
     if bind_path is not None:
         payload["path"] = bind_path
-    return signing.dumps(payload, salt=HX_SIGNING_SALT)
+    cache = _get_token_cache()
+    codec = get_token_codec()
+    store_threshold = getattr(settings, "HX_REQUESTS_PAYLOAD_STORE_THRESHOLD", None)
+    stats = token_stats if getattr(settings, "HX_REQUESTS_TOKEN_STATS", False) else None
+
+    def mint(object_ref):
+        cache_key = (hx_request_name, object_ref, kwargs_key, bind_path)
+        token = cache.get(cache_key)
+        if token is None:
+            row_payload = {**payload, "object": object_ref}
+            token = codec.encode(row_payload)
+            if store_threshold is not None and len(token) > store_threshold:
+                # Not cached: the stored copy can be evicted, and a cached stub
+                # would keep pointing at it. Storing on every mint keeps the
+                # payload alive for as long as pages carrying it are rendered.
+                token = codec.encode(_store_payload(row_payload))
+            else:
+                cache.set(cache_key, token)
+        if stats is not None:
+            stats.record(hx_request_name, len(token))
+        return token
+
+    return mint
+
+
+class HxPayloadExpired(signing.BadSignature):
+    """
+    A validly signed token whose payload was kept in the server-side payload
+    store (``HX_REQUESTS_PAYLOAD_STORE_THRESHOLD``) and is no longer there.
+    """
+
+
+def _payload_store():
+    # Lazy import: the cache framework is only needed once the store is used.
+    from django.core.cache import caches
+
+    return caches[getattr(settings, "HX_REQUESTS_PAYLOAD_STORE_CACHE", "default")]
+
+
+def _store_payload(payload):
+    """
+    Put ``payload`` in the payload store under a hash of its content and return
+    the stub that is signed in its place.
+    """
+    data = json.dumps(payload, separators=(",", ":"), cls=DjangoJSONEncoder)
+    key = hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+    timeout = getattr(settings, "HX_REQUESTS_PAYLOAD_STORE_TIMEOUT", 60 * 60 * 24)
+    _payload_store().set(PAYLOAD_STORE_KEY_PREFIX + key, data, timeout)
+    return {"name": payload["name"], "stored": key}
+
+
+def _load_stored_payload(stub):
+    data = _payload_store().get(PAYLOAD_STORE_KEY_PREFIX + stub["stored"])
+    if data is None:
+        raise HxPayloadExpired(f"The stored payload for '{stub['name']}' has expired.")
+    payload = json.loads(data)
+    if payload.get("name") != stub["name"]:
+        raise signing.BadSignature("Stored payload does not match its token.")
+    return payload
+
+
+# Values of these exact types compare equal only when they encode to the same
+# JSON, so they can key the token cache directly.
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _kwargs_cache_key(kw):
+    if all(type(value) in _SCALAR_TYPES for value in kw.values()):
+        # The type is part of the key: True == 1, but they encode differently.
+        # Floats are keyed by repr for the same reason: -0.0 == 0.0.
+        return tuple(
+            (key, type(value), repr(value) if isinstance(value, float) else value)
+            for key, value in kw.items()
+        )
+    return json.dumps(kw, cls=DjangoJSONEncoder)
+
+
+def _get_token_cache():
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = LRUCache(
+            getattr(settings, "HX_REQUESTS_TOKEN_CACHE_SIZE", DEFAULT_TOKEN_CACHE_SIZE)
+        )
+    return _token_cache
+
+
+@receiver(setting_changed)
+def _clear_token_cache(setting, **kwargs):
+    # A cached token is only valid for the key it was signed with, and the
+    # cache is sized from settings: drop it when either changes (tests,
+    # override_settings).
+    global _token_codec, _token_cache, _payload_cache
+    if setting in ("SECRET_KEY", "SECRET_KEY_FALLBACKS") or setting.startswith("HX_REQUESTS_"):
+        _token_codec = None
+        _token_cache = None
+        _payload_cache = None
+
+
+def get_token_codec():
+    """
+    Return the codec that mints and verifies ``hx`` tokens: an instance of the
+    class named by ``HX_REQUESTS_TOKEN_CODEC`` (see ``hx_requests.token_codecs``).
+    """
+    global _token_codec
+    if _token_codec is None:
+        _token_codec = import_string(getattr(settings, "HX_REQUESTS_TOKEN_CODEC", DEFAULT_TOKEN_CODEC))()
+    return _token_codec
 
 
 def unsign_hx_payload(token):
     """
     Verify and unpack a signed token. Raises ``signing.BadSignature`` (a base
     class covering tampered/truncated/hand-crafted tokens) on any failure.
+
+    A token that only carries a reference to a stored payload (see
+    ``HX_REQUESTS_PAYLOAD_STORE_THRESHOLD``) is rehydrated from the store, and
+    raises :class:`HxPayloadExpired` if the payload is gone.
     """
-    return signing.loads(token, salt=HX_SIGNING_SALT)
+    payload = get_token_codec().decode(token)
+    if "stored" in payload:
+        return _load_stored_payload(payload)
+    return payload
+
+
+def _verify_hx_token(token):
+    """
+    :func:`unsign_hx_payload` behind the optional verified-payload cache
+    (``HX_REQUESTS_PAYLOAD_CACHE_SIZE``). Only tokens that passed verification
+    are cached, so a forged token always takes the full signature check.
+    """
+    cache = _get_payload_cache()
+    if cache is None:
+        return unsign_hx_payload(token)
+    # Keyed by a digest of the token rather than the token itself, so a lookup
+    # never compares attacker-supplied bytes against a cached valid token.
+    key = hashlib.blake2b(token.encode(), digest_size=32).digest()
+    payload = cache.get(key)
+    if payload is None:
+        payload = unsign_hx_payload(token)
+        cache.set(key, payload)
+    # Hand out a copy so a caller mutating its payload can't poison the cache.
+    return _copy_json(payload)
+
+
+def _copy_json(value):
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
+
+def _get_payload_cache():
+    global _payload_cache
+    size = getattr(settings, "HX_REQUESTS_PAYLOAD_CACHE_SIZE", 0)
+    if not size:
+        return None
+    if _payload_cache is None:
+        _payload_cache = LRUCache(size, ttl=getattr(settings, "HX_REQUESTS_PAYLOAD_CACHE_TTL", 60))
+    return _payload_cache
 
 
 def get_hx_payload(request):
     """
     Return the *verified* contents of the signed ``hx`` token on ``request`` as
-    ``{"name": ..., "object": ..., "kwargs": ...}``, or ``None`` if the request
+    ``{"name": ..., "object": ..., "kw": ..., ...}``, or ``None`` if the request
     carries no token or the signature is invalid.
 
     This is the supported way for view code to introspect an inbound
     hx-requests request (detect it, read its name/object/kwargs) *without*
-    going through ``HtmxViewMixin`` dispatch. The ``object`` and ``kwargs``
-    values are still in serialized form -- pass them through :func:`deserialize`
-    / :func:`deserialize_kwargs` to get live values.
+    going through ``HtmxViewMixin`` dispatch. The ``object`` is still in
+    serialized form -- pass it through :func:`deserialize` -- and
+    :func:`deserialize_payload_kwargs` returns the live kwargs.
+
+    The outcome is memoized on the request against the token it was computed
+    for, so middleware, :func:`is_hx_request` and view dispatch share a single
+    verification; a different token on ``request.GET`` is verified afresh.
     """
-    token = request.GET.get(HX_TOKEN_PARAM)
-    if not token:
-        return None
     try:
-        return unsign_hx_payload(token)
+        return verify_hx_payload(request)
     except signing.BadSignature:
         return None
 
 
+def verify_hx_payload(request):
+    """
+    Like :func:`get_hx_payload`, but raise ``signing.BadSignature`` (or
+    :class:`HxPayloadExpired`) for a token that can't be used, instead of
+    returning ``None``. Still returns ``None`` when there is no token.
+
+    A row param minted by :func:`get_envelope_urls` counts as a token: it is
+    verified against its page envelope and yields the same payload a full
+    token for that object would.
+    """
+    token = request.GET.get(HX_TOKEN_PARAM)
+    row = None if token else request.GET.get(HX_ROW_PARAM)
+    if not token and not row:
+        return None
+    key = token or row
+    verified = getattr(request, "_hx_verified_token", None)
+    if verified is None or verified[0] != key:
+        try:
+            payload = _verify_hx_row(request, row) if row else _verify_hx_token(token)
+            if "rows" in payload:
+                raise signing.BadSignature("A page envelope is not an hx token.")
+            verified = (key, payload, None)
+        except signing.BadSignature as e:
+            verified = (key, None, e)
+        request._hx_verified_token = verified
+    if verified[2] is not None:
+        raise verified[2]
+    return verified[1]
+
+
 def get_hx_request_name(request):
     """
     Return the :code:`HxRequest` name from the signed ``hx`` token, or ``None``
@@ -166,33 +456,178 @@ def is_hx_request(request):
 
 def get_url(context, hx_request_name, obj, use_full_path=False, **kwargs):
     request = context["request"]
+    path, bind_path = _handler_target(hx_request_name, request)
+    token = sign_hx_payload(hx_request_name, obj, bind_path=bind_path, **kwargs)
+    return _url_prefix(request, use_full_path, path) + urlencode({HX_TOKEN_PARAM: token})
 
+
+def get_urls(context, hx_request_name, objects, use_full_path=False, **kwargs):
+    """
+    Mint the URLs for one handler over many model instances, e.g. the rows of
+    a table, and return them as ``{obj.pk: url}``. Each URL is the same one
+    :func:`get_url` would return for that object, but the work every row
+    shares -- resolving the handler's path binding, the loose query params and
+    the kwargs -- is done once.
+    """
+    request = context["request"]
+    path, bind_path = _handler_target(hx_request_name, request)
+    mint = _token_minter(hx_request_name, bind_path, kwargs)
+    prefix = _url_prefix(request, use_full_path, path)
+    return {obj.pk: prefix + urlencode({HX_TOKEN_PARAM: mint(serialize(obj))}) for obj in objects}
+
+
+class HxEnvelope(dict):
+    """
+    The row URLs minted by :func:`get_envelope_urls`, as ``{obj.pk: url}``.
+    ``headers`` holds the page envelope they are bound to; it has to reach the
+    server with every row request (see the ``hx_envelope_attrs`` tag).
+    """
+
+    def __init__(self, *args, headers=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.headers = headers or {}
+
+
+# Row MACs are truncated to 8 bytes: short enough to keep a row URL at a few
+# dozen bytes, and still far out of reach of online guessing.
+ROW_MAC_SIZE = 8
+ROW_MAC_SALT = "hx-requests:row"
+
+
+def get_envelope_urls(context, hx_request_name, objects, use_full_path=False, **kwargs):
+    """
+    Like :func:`get_urls`, but for lists where only the object differs per row:
+    the handler, kwargs and bound path are signed once into a page envelope,
+    and each row URL carries only the object's pk plus a short MAC binding it
+    to that envelope. All objects must be instances of the same model.
+
+    Returns an :class:`HxEnvelope`; its ``headers`` must be sent with the row
+    requests, e.g. through ``hx-headers`` on an element wrapping the rows.
+    """
+    objects = list(objects)
+    if not objects:
+        return HxEnvelope()
+    meta = objects[0]._meta
+    request = context["request"]
+    path, bind_path = _handler_target(hx_request_name, request)
+
+    kw, kw_models = split_typed_kwargs(**kwargs)
+    payload = {"name": hx_request_name, "object": None, "kw": kw, "rows": meta.label_lower}
+    if kw_models:
+        payload["kw_models"] = kw_models
+    if bind_path is not None:
+        payload["path"] = bind_path
+    envelope = get_token_codec().encode(payload)
+    envelope_id = _envelope_id(envelope)
+    row_mac = _row_mac_minter(envelope)
+
+    stats = token_stats if getattr(settings, "HX_REQUESTS_TOKEN_STATS", False) else None
+    if stats is not None:
+        stats.record(hx_request_name, len(envelope))
+
+    prefix = _url_prefix(request, use_full_path, path)
+    urls = HxEnvelope(headers={HX_ENVELOPE_HEADER_PREFIX + envelope_id: envelope})
+    for obj in objects:
+        if obj._meta.label_lower != meta.label_lower:
+            raise ValueError(
+                f"Cannot put a {obj._meta.label} in a page envelope for {meta.label} objects."
+            )
+        if obj.pk is None:
+            raise ValueError(
+                f"Cannot serialize an unsaved {obj._meta.label} instance (pk is None). "
+                "Save the object before passing it to an hx tag."
+            )
+        pk = str(obj.pk)
+        row = f"{envelope_id}.{pk}.{row_mac(pk)}"
+        if stats is not None:
+            stats.record(hx_request_name, len(row))
+        urls[obj.pk] = prefix + urlencode({HX_ROW_PARAM: row})
+    return urls
+
+
+def _envelope_id(envelope):
+    # Only names the header the envelope travels in; the row MAC is what binds
+    # a row to its envelope.
+    return hashlib.blake2b(envelope.encode(), digest_size=4).hexdigest()
+
+
+def _row_mac_minter(envelope, secret=None):
+    # The HMAC state over the envelope is computed once and copied per row.
+    base = salted_hmac(ROW_MAC_SALT, f"{envelope}:", secret=secret, algorithm="sha256")
+
+    def row_mac(pk):
+        mac = base.copy()
+        mac.update(pk.encode())
+        return signing.b64_encode(mac.digest()[:ROW_MAC_SIZE]).decode()
+
+    return row_mac
+
+
+def _verify_hx_row(request, row):
+    """
+    Verify a row param (``<envelope id>.<pk>.<MAC>``) against the page envelope
+    sent alongside it, and return the payload the row stands for: the
+    envelope's, with the row's object.
+    """
+    envelope_id, _, rest = row.partition(".")
+    pk, _, mac = rest.rpartition(".")
+    envelope = request.headers.get(HX_ENVELOPE_HEADER_PREFIX + envelope_id)
+    if not pk or not envelope:
+        raise signing.BadSignature("hx row without its page envelope.")
+    payload = _verify_hx_token(envelope)
+    if "rows" not in payload:
+        raise signing.BadSignature("hx row bound to a token that is not a page envelope.")
+    secrets = [settings.SECRET_KEY, *getattr(settings, "SECRET_KEY_FALLBACKS", [])]
+    if not any(constant_time_compare(mac, _row_mac_minter(envelope, secret)(pk)) for secret in secrets):
+        raise signing.BadSignature("hx row MAC does not match its page envelope.")
+    app_label, model_name = payload.pop("rows").split(".")
+    payload["object"] = f"{MODEL_INSTANCE_PREFIX}{app_label}{__}{model_name}{__}{pk}"
+    return payload
+
+
+def _url_prefix(request, use_full_path, path):
     # Non-framework params (page filters/pagination) stay as ordinary loose
     # query params -- they are untrusted runtime input the view already reads.
     # Only the framework's routing/deserialization data is signed.
     params = {}
     if use_full_path:
         for k, v in request.GET.lists():
-            if k in (HX_TOKEN_PARAM, "hx_request_name", "object"):
+            if k in HX_FRAMEWORK_PARAMS:
                 continue
             params[k] = v[0] if len(v) == 1 else v
+    if not params:
+        return f"{path}?"
+    return f"{path}?{urlencode(params, doseq=True)}&"
 
-    # The token is bound to the path it is rendered on (so it only verifies when
-    # replayed back to this same path) unless the handler opts out.
-    bind_path = request.path if _handler_binds_to_path(hx_request_name) else None
-    params[HX_TOKEN_PARAM] = sign_hx_payload(hx_request_name, obj, bind_path=bind_path, **kwargs)
-
-    return f"{request.path}?{urlencode(params, doseq=True)}"
 
+def _handler_target(hx_request_name, request):
+    """
+    Return ``(path, bind_path)`` for a handler's URLs on ``request``: the path
+    its requests are sent to, and the path its tokens are bound to (``None``
+    when they are unbound).
+
+    A handler is sent back to the page it is rendered on, and its token is
+    bound to that page (so it only verifies when replayed back to this same
+    path) unless the handler opts out. A handler with an ``owner_view`` is
+    sent to the hx router instead (see ``hx_requests.urls``); its tokens are
+    not bound, since every routed token arrives at the same path.
+    """
+    # Lazy import: avoids a utils <-> hx_registry <-> hx_requests import cycle.
+    from hx_requests.hx_registry import HxRequestRegistry
 
-def _handler_binds_to_path(hx_request_name):
+    metadata = HxRequestRegistry.get_hx_request_metadata(hx_request_name)
+    if metadata is not None and metadata.routed:
+        return _router_path(), None
     # Global kill switch (e.g. when a proxy/middleware rewrites request.path).
     if not getattr(settings, "HX_REQUESTS_BIND_TOKEN_TO_PATH", True):
-        return False
+        return request.path, None
+    # Path-binding is on by default; a handler opts out with bind_to_path = False.
+    binds = metadata.bind_to_path if metadata is not None else True
+    return request.path, request.path if binds else None
 
-    # Lazy import: avoids a utils <-> hx_registry <-> hx_requests import cycle.
-    from hx_requests.hx_registry import HxRequestRegistry
 
-    hx_request_class = HxRequestRegistry.get_hx_request(hx_request_name)
-    # Path-binding is on by default; a handler opts out with bind_to_path = False.
-    return bool(getattr(hx_request_class, "bind_to_path", True))
+def _router_path():
+    # Lazy import: the URL resolver is only needed once a handler is routed.
+    from django.urls import reverse
+
+    return reverse("hx_requests:router")
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import inspect
 import logging
 from urllib.parse import parse_qs, urlparse
 
+import django
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core import signing
 from django.core.exceptions import ImproperlyConfigured
-from django.http import Http404, HttpRequest
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import Http404, HttpRequest, QueryDict
 from django.utils.decorators import method_decorator
+from django.utils.module_loading import import_string
+from django.views import View
 from django.views.decorators.csrf import ensure_csrf_cookie
 
-from hx_requests.constants import HX_TOKEN_PARAM
+from hx_requests.constants import HX_FRAMEWORK_PARAMS, HX_ROW_PARAM, HX_TOKEN_PARAM
 from hx_requests.hx_registry import HxRequestRegistry
 from hx_requests.security_utils import (
     app_label_for_object,
@@ -17,15 +25,78 @@ from hx_requests.security_utils import (
     is_unauthenticated_allowed,
 )
 from hx_requests.utils import (
-    deserialize_kwargs,
-    get_hx_payload,
+    HxPayloadExpired,
+    adeserialize_payload_kwargs,
+    deserialize_payload_kwargs,
     is_htmx_request,
+    shadows_async_twin,
+    verify_hx_payload,
 )
 
 logger = logging.getLogger(__name__)
 
+EXPIRED_PAYLOAD_MESSAGE = "The data for this hx request has expired from the server. Reload the page."
+
+# Compiled is_hx_allowed decisions, keyed by (view class, HxRequest class).
+_allow_policies: dict[tuple[type, type], tuple[bool, bool]] = {}
+
+_ALLOW_RULE_ATTRS = ("allowed_hx_requests", "use_global_hx_rules")
+
+# (HxRequest class, owner_view) -> the validated owner view class, for the router.
+_owner_views: dict[tuple[type, type | str], type] = {}
+
+
+def _has_static_allow_rules(view) -> bool:
+    # True when the view's allow attributes are plain class attributes, i.e.
+    # the same for every instance of the class.
+    if any(attr in vars(view) for attr in _ALLOW_RULE_ATTRS):
+        return False
+    return not any(
+        hasattr(inspect.getattr_static(view.__class__, attr, None), "__get__")
+        for attr in _ALLOW_RULE_ATTRS
+    )
+
+
+class _SharedQueryDict(QueryDict):
+    """
+    A mutable ``QueryDict`` whose value lists are shared with the query it was
+    built from instead of copied. They are copied before its first change, so
+    the source query never sees it.
+    """
+
+    _shares_lists = True
+
+    def _assert_mutable(self):
+        super()._assert_mutable()
+        if self._shares_lists:
+            self._shares_lists = False
+            for key, values in dict.items(self):
+                dict.__setitem__(self, key, list(values))
+
+
+def _without_framework_params(query, extra=None):
+    """
+    Return ``query`` minus the framework's own params, plus the params of
+    ``extra`` (a ``parse_qs`` result) that ``query`` doesn't have. Mutable,
+    like ``query.copy()``, but nothing is copied unless it is changed.
+    """
+    result = _SharedQueryDict(mutable=True, encoding=query.encoding)
+    for key, values in query.lists():
+        if key not in HX_FRAMEWORK_PARAMS:
+            dict.__setitem__(result, key, values)
+    for key, values in (extra or {}).items():
+        if key not in HX_FRAMEWORK_PARAMS and key not in result:
+            dict.__setitem__(result, key, values)
+    return result
+
+
+@receiver(setting_changed)
+def _clear_allow_policies(setting, **kwargs):
+    # Decisions read the HX_REQUESTS_* policy settings and the app labels.
+    if setting.startswith("HX_REQUESTS_") or setting == "INSTALLED_APPS":
+        _allow_policies.clear()
+
 
-@method_decorator(ensure_csrf_cookie, name="dispatch")
 class HtmxViewMixin:
     """
     Mixin to be added to views that are using HxRequests.
@@ -37,6 +108,20 @@ class HtmxViewMixin:
     use_global_hx_rules: bool = True  # True by default
 
     def dispatch(self, request, *args, **kwargs):
+        # An async view must return an awaitable all the way through the csrf
+        # cookie decorator, so it is dispatched by a coroutine of its own.
+        if getattr(self, "view_is_async", False):
+            if django.VERSION < (5, 0):
+                # ensure_csrf_cookie only wraps coroutines from Django 5.0 on.
+                raise ImproperlyConfigured(
+                    f"{self.__class__.__name__} is an async view; HtmxViewMixin supports "
+                    "async views on Django 5.0 or later only."
+                )
+            return self._adispatch(request, *args, **kwargs)
+        return self._dispatch(request, *args, **kwargs)
+
+    @method_decorator(ensure_csrf_cookie)
+    def _dispatch(self, request, *args, **kwargs):
         # HTMX requests are handed off to the resolved HxRequest's own dispatch.
         # super().dispatch() is deliberately NOT called on this path: it would
         # route to the page view's own get/post and defeat the handoff. As a
@@ -46,31 +131,93 @@ class HtmxViewMixin:
         # handoff runs first and skips them. `check_auth_mixin_ordering`
         # (checks.py) warns at startup when an auth mixin is ordered after this
         # mixin; enforce per-handler authorization on the HxRequest itself.
-        if (
-            is_htmx_request(request)
-            and request.GET.get(HX_TOKEN_PARAM)
-            and request.method.lower() in self.http_method_names
-        ):
-            request = self._resolve_hx_token(request)
-            extra_kwargs = self.get_hx_extra_kwargs(request)
-            collisions = set(kwargs) & set(extra_kwargs)
-            if collisions:
-                raise ImproperlyConfigured(
-                    f"hx-requests kwarg(s) {sorted(collisions)} collide with URLconf "
-                    f"kwargs on view {self.__class__.__name__}. A signed template-tag "
-                    "kwarg must not shadow a URL kwarg -- rename the template-tag kwarg."
-                )
-            kwargs.update(extra_kwargs)
-            hx_request = self._setup_hx_request(request, *args, **kwargs)
-
-            # Use request from hx_request, in case use_current_url is set to True
-            return hx_request.dispatch(hx_request.request, *args, **kwargs)
+        if self._is_hx_dispatch(request):
+            return self.dispatch_hx_request(request, *args, **kwargs)
 
         # No hx token: fall through to the page view's normal dispatch (full
         # page loads, hx-boost, and plain htmx all land here). A present-but-
         # invalid token never reaches this line -- it is rejected above.
         return super().dispatch(request, *args, **kwargs)
 
+    @method_decorator(ensure_csrf_cookie)
+    async def _adispatch(self, request, *args, **kwargs):
+        # The async twin of _dispatch, with the same handoff rules.
+        if self._is_hx_dispatch(request):
+            # A view overriding only the sync entry point keeps it, run in a
+            # worker thread.
+            if shadows_async_twin(type(self), "dispatch_hx_request", "adispatch_hx_request"):
+                return await sync_to_async(self.dispatch_hx_request)(request, *args, **kwargs)
+            return await self.adispatch_hx_request(request, *args, **kwargs)
+        return await super().dispatch(request, *args, **kwargs)
+
+    def _is_hx_dispatch(self, request):
+        return bool(
+            is_htmx_request(request)
+            and (request.GET.get(HX_TOKEN_PARAM) or request.GET.get(HX_ROW_PARAM))
+            and request.method.lower() in self.http_method_names
+        )
+
+    def dispatch_hx_request(self, request, *args, **kwargs):
+        """
+        Verify the request's hx token, resolve its HxRequest (checking it is
+        allowed on this view) and return the HxRequest's response. ``dispatch``
+        calls this for hx requests; the hx router calls it on an HxRequest's
+        ``owner_view``.
+        """
+        request = self._resolve_hx_token(request)
+        self._add_hx_extra_kwargs(kwargs, self.get_hx_extra_kwargs(request))
+        hx_request = self._setup_hx_request(request, *args, **kwargs)
+
+        # Use request from hx_request, in case use_current_url is set to True
+        return hx_request.dispatch(hx_request.request, *args, **kwargs)
+
+    async def adispatch_hx_request(self, request, *args, **kwargs):
+        """
+        Async version of ``dispatch_hx_request``, used when the view is async.
+        The HxRequest runs through its async twins (see
+        ``BaseHxRequest.supports_native_async``); one that cannot is run
+        through its sync methods in a worker thread.
+        """
+        if hasattr(request, "auser"):
+            # Resolve the lazy user up front: the allow rules and the
+            # HxRequest's hooks read request.user, which must not hit the
+            # session or database from the event loop.
+            request.user = await request.auser()
+        # Verifying the token may read the payload store, which can be a
+        # database-backed cache.
+        request = await sync_to_async(self._resolve_hx_token)(request)
+        self._add_hx_extra_kwargs(kwargs, await self.aget_hx_extra_kwargs(request))
+        hx_request, request = self._bind_hx_request(await self.aget_hx_request(request), request)
+
+        if not self._dispatches_natively(hx_request):
+            return await sync_to_async(self._dispatch_bound_hx_request)(
+                hx_request, request, *args, **kwargs
+            )
+        await hx_request._asetup_hx_request(request, *args, **kwargs)
+        return await hx_request.adispatch(hx_request.request, *args, **kwargs)
+
+    def _add_hx_extra_kwargs(self, kwargs, extra_kwargs):
+        collisions = set(kwargs) & set(extra_kwargs)
+        if collisions:
+            raise ImproperlyConfigured(
+                f"hx-requests kwarg(s) {sorted(collisions)} collide with URLconf "
+                f"kwargs on view {self.__class__.__name__}. A signed template-tag "
+                "kwarg must not shadow a URL kwarg -- rename the template-tag kwarg."
+            )
+        kwargs.update(extra_kwargs)
+
+    def _dispatches_natively(self, hx_request):
+        hx_class = type(hx_request)
+        metadata = HxRequestRegistry.get_hx_request_metadata(getattr(hx_class, "name", None))
+        if metadata is not None and metadata.hx_class is hx_class:
+            return metadata.native_async
+        return hx_class.supports_native_async()
+
+    @staticmethod
+    def _dispatch_bound_hx_request(hx_request, request, *args, **kwargs):
+        hx_request._setup_hx_request(request, *args, **kwargs)
+        return hx_request.dispatch(hx_request.request, *args, **kwargs)
+
     def get_hx_request(self, request):
         payload = getattr(request, "hx_payload", None) or {}
         hx_request_name = payload.get("name")
@@ -100,20 +247,42 @@ class HtmxViewMixin:
 
         return hx_request_class()
 
+    async def aget_hx_request(self, request):
+        """
+        Async version of ``get_hx_request``. A view that overrides only the
+        sync hooks (``get_hx_request`` or ``is_hx_allowed``) has them run in a
+        worker thread.
+        """
+        cls = type(self)
+        if shadows_async_twin(cls, "get_hx_request", "aget_hx_request") or shadows_async_twin(
+            cls, "is_hx_allowed", "aget_hx_request"
+        ):
+            return await sync_to_async(self.get_hx_request)(request)
+        return self.get_hx_request(request)
+
     def _resolve_hx_token(self, request):
         """
         Verify the signed ``hx`` token and attach its *trusted* contents to the
-        request as ``request.hx_payload`` (``{"name", "object", "kwargs", ...}``).
+        request as ``request.hx_payload`` (``{"name", "object", "kw", ...}``).
         Everything the framework controls (name, object, kwargs) comes from the
         signed token; any client-supplied framework params on the raw query
         string are stripped so they cannot shadow or forge the verified values
         and cannot leak into a page-view template's ``request.GET.urlencode()``.
         Non-framework params (page filters, runtime hx-vals) are left untouched.
+
+        A row param bound to a page envelope (see ``get_envelope_urls``) stands
+        in for the token and resolves to the same payload.
         """
-        if not request.GET.get(HX_TOKEN_PARAM):
+        if not (request.GET.get(HX_TOKEN_PARAM) or request.GET.get(HX_ROW_PARAM)):
             logger.debug("hx_requests: denied (404) -- request carried no '%s' token.", HX_TOKEN_PARAM)
             raise Http404("Missing required query param 'hx' for HTMX request.")
-        payload = get_hx_payload(request)
+        try:
+            payload = verify_hx_payload(request)
+        except HxPayloadExpired as e:
+            logger.debug("hx_requests: denied (404) -- %s", e)
+            raise Http404(EXPIRED_PAYLOAD_MESSAGE) from e
+        except signing.BadSignature:
+            payload = None
         if payload is None:
             logger.debug(
                 "hx_requests: denied (404) -- '%s' token was missing, tampered, or unsigned.",
@@ -130,43 +299,87 @@ class HtmxViewMixin:
         if binding_enabled and bound_path is not None and bound_path != request.path:
             raise Http404("hx token is bound to a different path.")
 
-        sanitized = request.GET.copy()
-        for key in list(sanitized.keys()):
-            if key in (HX_TOKEN_PARAM, "hx_request_name", "object"):
-                del sanitized[key]
-        request.GET = sanitized
+        request.GET = _without_framework_params(request.GET)
 
         # The verified payload is attached to the request, not smuggled back
         # through request.GET; get_hx_request / get_hx_object read it here.
         request.hx_payload = payload
-        # Verified, serialized kwargs from the token -- the only source of
-        # kwargs-as-context. Raw query params never feed this again.
-        request._hx_kwargs = payload.get("kwargs", {})
         return request
 
     def get_hx_extra_kwargs(self, request):
-        return deserialize_kwargs(**getattr(request, "_hx_kwargs", {}))
+        # The verified token is the only source of kwargs-as-context. Raw query
+        # params never feed this.
+        return deserialize_payload_kwargs(getattr(request, "hx_payload", None) or {})
+
+    async def aget_hx_extra_kwargs(self, request):
+        """
+        Async version of ``get_hx_extra_kwargs``. A view that overrides only
+        the sync hook has it run in a worker thread.
+        """
+        if shadows_async_twin(type(self), "get_hx_extra_kwargs", "aget_hx_extra_kwargs"):
+            return await sync_to_async(self.get_hx_extra_kwargs)(request)
+        return await adeserialize_payload_kwargs(getattr(request, "hx_payload", None) or {})
 
     def _setup_hx_request(self, request, *args, **kwargs):
-        hx_request = self.get_hx_request(request)
+        hx_request, request = self._bind_hx_request(self.get_hx_request(request), request)
+        hx_request._setup_hx_request(request, *args, **kwargs)
+        return hx_request
+
+    def _bind_hx_request(self, hx_request, request):
         hx_request.view = self
 
         if getattr(hx_request, "use_current_url", False):
             request = self._use_current_url(request)
-        hx_request._setup_hx_request(request, *args, **kwargs)
-        return hx_request
+        return hx_request, request
 
     def is_hx_allowed(self, hx_cls: type, request: HttpRequest) -> bool:
+        allowed, allowed_unauthenticated = self._get_allow_policy(hx_cls)
+        if not allowed:
+            return False
+        # --- auth gate ---
+        # The only per-request part of the decision.
+        return allowed_unauthenticated or bool(
+            getattr(request, "user", None) and request.user.is_authenticated
+        )
+
+    def _get_allow_policy(self, hx_cls: type) -> tuple[bool, bool]:
+        # Everything but the user depends only on the view class, the handler
+        # class and settings, so the decision is compiled once per pair. A view
+        # that sets the allow attributes per instance (as_view() kwargs) or
+        # computes them (properties) is compiled afresh on every call.
+        key = (self.__class__, hx_cls)
+        policy = _allow_policies.get(key)
+        if policy is None:
+            policy = self._compile_allow_policy(hx_cls)
+            if _has_static_allow_rules(self):
+                _allow_policies[key] = policy
+        return policy
+
+    def _compile_allow_policy(self, hx_cls: type) -> tuple[bool, bool]:
+        """
+        Return ``(allowed, allowed_unauthenticated)`` for ``hx_cls`` on this
+        view: whether the allow-list / same-app / global rules let it through,
+        and whether it may skip the authenticated-user check.
+        """
         hx_name = getattr(hx_cls, "name", None)
         if not hx_name:
-            return False
-
-        hx_app = app_label_for_object(hx_cls)
+            return False, False
+
+        # The handler's app label is precomputed in its registry metadata; only
+        # an unregistered class passed in directly is resolved here.
+        metadata = HxRequestRegistry.get_hx_request_metadata(hx_name)
+        if metadata is not None and metadata.hx_class is hx_cls:
+            hx_app = metadata.app_label
+        else:
+            hx_app = app_label_for_object(hx_cls)
         view_app = app_label_for_object(self.__class__)
 
         # --- auth settings ---
         require_auth = getattr(settings, "HX_REQUESTS_REQUIRE_AUTH", True)
         unauth_allow_spec = getattr(settings, "HX_REQUESTS_UNAUTHENTICATED_ALLOW", None)
+        allowed_unauthenticated = not require_auth or is_unauthenticated_allowed(
+            unauth_allow_spec, hx_app, hx_name
+        )
 
         # --- policy settings ---
         enforce_same_app = getattr(settings, "HX_REQUESTS_ENFORCE_SAME_APP", True)
@@ -174,58 +387,121 @@ class HtmxViewMixin:
         view_allow_list = set(getattr(self, "allowed_hx_requests", []) or [])
         use_global_hx_rules = bool(getattr(self, "use_global_hx_rules", True))
 
-        # --- auth gate ---
-        user_is_authed = bool(getattr(request, "user", None) and request.user.is_authenticated)
-        if (
-            require_auth
-            and not user_is_authed
-            and not is_unauthenticated_allowed(unauth_allow_spec, hx_app, hx_name)
-        ):
-            return False
-
         # --- policy signals ---
         same_app_ok = bool(hx_app and view_app and hx_app == view_app)
         global_ok = is_globally_allowed(global_allow_spec, hx_app, hx_name)
 
         # No view list and same-app enforcement is OFF -> allow all
         if not view_allow_list and not enforce_same_app:
-            return True
+            return True, allowed_unauthenticated
 
         # If there is a view allow list and the hx_name is in it -> allow
         if hx_name in view_allow_list:
-            return True
+            return True, allowed_unauthenticated
 
         # If additive = False it must be in the view allow list to be allowed
         if view_allow_list and use_global_hx_rules is False and hx_name not in view_allow_list:
-            return False
+            return False, allowed_unauthenticated
 
         # View list present + additive=True -> list OR policy
         if view_allow_list and use_global_hx_rules:
-            return global_ok or same_app_ok
+            return global_ok or same_app_ok, allowed_unauthenticated
 
         # No view list -> policy
-        return global_ok or (enforce_same_app and same_app_ok)
+        return global_ok or (enforce_same_app and same_app_ok), allowed_unauthenticated
 
     def _use_current_url(self, request):
-        # Start with the current GET params
-        merged_get = request.GET.copy()
-
-        # Check if HX-Current-URL is in the headers
+        # Params from the HX-Current-URL header are added only where the request
+        # doesn't have them. Framework params (name/object/kwargs/token) are
+        # never merged from the current URL: those are trusted only via the
+        # signed token, not raw query input.
         hx_current_url = request.headers.get("HX-Current-URL")
         if hx_current_url:
-            # Parse the URL and extract its query parameters
-            parsed_url = urlparse(hx_current_url)
-            additional_params = parse_qs(parsed_url.query)
-
-            # Add each HX param only if not already present. Framework params
-            # (name/object/kwargs/token) are never merged from the current URL:
-            # those are trusted only via the signed token, not raw query input.
-            for key, values in additional_params.items():
-                if key in (HX_TOKEN_PARAM, "hx_request_name", "object"):
-                    continue
-                if key not in merged_get:
-                    merged_get.setlist(key, values)
-
-        # Now override request.GET
-        request.GET = merged_get
+            additional_params = parse_qs(urlparse(hx_current_url).query)
+            request.GET = _without_framework_params(request.GET, additional_params)
         return request
+
+
+class HxRouterView(View):
+    """
+    A single endpoint for HxRequests that declare an ``owner_view`` (mounted by
+    ``hx_requests.urls``). The request is dispatched straight to the HxRequest,
+    with the allow rules checked against the owner view, so the page view's
+    URL, dispatch chain and ``get()`` are skipped entirely.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            payload = verify_hx_payload(request) if is_htmx_request(request) else None
+        except HxPayloadExpired as e:
+            raise Http404(EXPIRED_PAYLOAD_MESSAGE) from e
+        except signing.BadSignature:
+            payload = None
+        if payload is None:
+            logger.debug("hx_requests: router denied (404) -- no valid hx token.")
+            raise Http404("Invalid or tampered hx token.")
+
+        hx_request_class = HxRequestRegistry.get_hx_request(payload["name"])
+        owner_view = getattr(hx_request_class, "owner_view", None)
+        if owner_view is None:
+            logger.debug(
+                "hx_requests: router denied (404) -- HxRequest '%s' has no owner_view.",
+                payload["name"],
+            )
+            raise Http404(f"HxRequest '{payload['name']}' is not served by the hx router.")
+
+        view = _routed_owner_view(hx_request_class, owner_view)()
+        view.setup(request, *args, **kwargs)
+        if request.method.lower() not in view.http_method_names:
+            return view.http_method_not_allowed(request, *args, **kwargs)
+        return view.dispatch_hx_request(request, *args, **kwargs)
+
+
+def _routed_owner_view(hx_request_class, owner_view):
+    # Validated once per (HxRequest, owner_view) pair; a misconfiguration is
+    # not cached, so it keeps raising until fixed.
+    key = (hx_request_class, owner_view)
+    view = _owner_views.get(key)
+    if view is None:
+        view = _owner_views[key] = resolve_owner_view(hx_request_class)
+    return view
+
+
+def resolve_owner_view(hx_request_class):
+    """
+    Import and validate ``hx_request_class.owner_view`` for the hx router,
+    raising ``ImproperlyConfigured`` for a view it cannot safely dispatch as.
+    The ``check_owner_views`` system check runs this at startup.
+    """
+    # Lazy import: the auth mixins pull in the auth models.
+    from django.contrib.auth.mixins import AccessMixin
+
+    owner_view = hx_request_class.owner_view
+    if isinstance(owner_view, str):
+        owner_view = import_string(owner_view)
+    name = hx_request_class.__name__
+    if not (isinstance(owner_view, type) and issubclass(owner_view, HtmxViewMixin)):
+        raise ImproperlyConfigured(f"{name}.owner_view must be a view class using HtmxViewMixin.")
+    # The router never runs the owner view's dispatch, so an auth mixin or a
+    # decorator on it would be silently skipped.
+    if issubclass(owner_view, AccessMixin):
+        raise ImproperlyConfigured(
+            f"{name}.owner_view {owner_view.__name__} uses an auth mixin, which the hx router "
+            "would bypass. Authorize on the HxRequest instead, or drop owner_view."
+        )
+    decorated = next(
+        (klass for klass in owner_view.__mro__ if hasattr(vars(klass).get("dispatch"), "__wrapped__")),
+        None,
+    )
+    if decorated is not None:
+        raise ImproperlyConfigured(
+            f"{name}.owner_view {owner_view.__name__} has a decorated dispatch (on "
+            f"{decorated.__name__}, e.g. method_decorator(login_required)), which the hx router "
+            "would bypass. Authorize on the HxRequest instead, or drop owner_view."
+        )
+    if hx_request_class.get_views_context:
+        raise ImproperlyConfigured(
+            f"{name} declares an owner_view but not get_views_context = False: the hx router "
+            "never runs the page view, so it has no context to give."
+        )
+    return owner_view
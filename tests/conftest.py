@@ -25,6 +25,19 @@ def clean_registry():
 
     saved_registry = dict(HxRequestRegistry._registry)
     saved_initialized = HxRequestRegistry._initialized
+    saved_frozen = HxRequestRegistry._frozen
+    saved_file_index = dict(HxRequestRegistry._file_index)
+    saved_import_timings = dict(HxRequestRegistry._import_timings)
+    saved_metadata = dict(HxRequestRegistry._metadata)
+    saved_discovered = dict(HxRequestRegistry._discovered)
     yield HxRequestRegistry
     HxRequestRegistry._registry = saved_registry
     HxRequestRegistry._initialized = saved_initialized
+    HxRequestRegistry._frozen = saved_frozen
+    HxRequestRegistry._file_index = saved_file_index
+    HxRequestRegistry._import_timings = saved_import_timings
+    HxRequestRegistry._metadata = saved_metadata
+    HxRequestRegistry._discovered = saved_discovered
+    HxRequestRegistry._stale_modules = set()
+    HxRequestRegistry._file_index_dirty = False
+    HxRequestRegistry._names_version += 1
@@ -376,6 +376,16 @@ class PostActionSideEffectHx(BaseHxRequest):
         return None
 
 
+class AsyncPostActionHx(BaseHxRequest):
+    """Overrides only the async hook, so its action runs on async views only."""
+
+    name = "async_post_action"
+    POST_template = "post.html"
+
+    async def apost_action(self, **kwargs):
+        await Widget.objects.acreate(name="from-apost-action")
+
+
 class DynamicRedirectHx(BaseHxRequest):
     name = "dynamic_redirect"
     GET_template = "simple.html"
@@ -410,6 +420,38 @@ class DynamicReturnEmptyHx(BaseHxRequest):
         return True
 
 
+# --------------------------------------------------------------------------
+# Served by the hx router (owner_view)
+# --------------------------------------------------------------------------
+
+
+class RoutedObjectHx(BaseHxRequest):
+    name = "routed_object"
+    GET_template = "object.html"
+    owner_view = "test_app.views.BaseView"
+    get_views_context = False
+
+
+class RoutedWithViewsContextHx(BaseHxRequest):
+    name = "routed_with_views_context"
+    GET_template = "object.html"
+    owner_view = "test_app.views.BaseView"
+
+
+class RoutedToAuthViewHx(BaseHxRequest):
+    name = "routed_to_auth_view"
+    GET_template = "object.html"
+    owner_view = "test_app.views.AuthBeforeHxView"
+    get_views_context = False
+
+
+class RoutedToDecoratedViewHx(BaseHxRequest):
+    name = "routed_to_decorated_view"
+    GET_template = "object.html"
+    owner_view = "test_app.views.LoginRequiredDispatchView"
+    get_views_context = False
+
+
 # --------------------------------------------------------------------------
 # Registry edge case: a class with a `name` that is NOT an HxRequest
 # --------------------------------------------------------------------------
@@ -0,0 +1,7 @@
+from django.urls import include, path
+from test_app.views import BaseView
+
+urlpatterns = [
+    path("page/", BaseView.as_view()),
+    path("hx/", include("hx_requests.urls")),
+]
@@ -1,4 +1,6 @@
+from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.generic import ListView, TemplateView, UpdateView
 from test_app.models import Widget
@@ -28,6 +30,13 @@ class BaseView(HtmxViewMixin, TemplateView):
         return context
 
 
+class AsyncView(BaseView):
+    """An async page view: its hx requests take the async dispatch path."""
+
+    async def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
 class WidgetListView(HtmxViewMixin, ListView):
     model = Widget
     template_name = "widget_list.html"
@@ -108,3 +117,10 @@ class AuthBeforeHxView(LoginRequiredMixin, HtmxViewMixin, TemplateView):
 
     template_name = "base_view.html"
     login_url = "/login/"
+
+
+@method_decorator(login_required, name="dispatch")
+class LoginRequiredDispatchView(HtmxViewMixin, TemplateView):
+    """Auth applied as a dispatch decorator rather than a mixin."""
+
+    template_name = "base_view.html"
@@ -0,0 +1,262 @@
+"""Tests for native async dispatch: HxRequests served from an async page view."""
+
+import inspect
+
+import django
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.http import Http404
+from django.test import RequestFactory
+from test_app import hx_requests as hx
+from test_app.models import Widget
+from test_app.views import AsyncView, BaseView
+
+from hx_requests.hx_registry import HxRequestRegistry
+from hx_requests.hx_requests import BaseHxRequest, DeleteHxRequest, FormHxRequest
+from tests.helpers import _create_test_request, content_of
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(django.VERSION < (5, 0), reason="Async dispatch requires Django 5.0+"),
+]
+
+
+def _dispatch(hx_request, method="GET", **request_kwargs):
+    request = _create_test_request(hx_request, method=method, **request_kwargs)
+    response = AsyncView.as_view()(request)
+    assert inspect.iscoroutine(response)
+    return async_to_sync(_await)(response)
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+def _query_db(*args, **kwargs):
+    # Raises SynchronousOnlyOperation if run on the event loop.
+    Widget.objects.count()
+
+
+@pytest.fixture()
+def _no_sync_hooks(monkeypatch):
+    """Fail if the sync twins of the native async path are called."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("sync hook called on the native async path")
+
+    for cls, name in [
+        (BaseHxRequest, "dispatch"),
+        (BaseHxRequest, "get"),
+        (BaseHxRequest, "post"),
+        (BaseHxRequest, "get_hx_object"),
+        (BaseHxRequest, "_setup_hx_request"),
+        (FormHxRequest, "get"),
+        (FormHxRequest, "post"),
+        (FormHxRequest, "form_valid"),
+        (DeleteHxRequest, "post"),
+        (DeleteHxRequest, "delete"),
+    ]:
+        monkeypatch.setattr(cls, name, fail)
+
+
+# --------------------------------------------------------------------------
+# Native path
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.usefixtures("_no_sync_hooks")
+def test_get_resolves_the_object_natively(widget):
+    response = _dispatch(hx.ObjectEchoHx, hx_kwargs={"object": widget})
+    assert content_of(response).strip() == "object|gizmo"
+
+
+@pytest.mark.usefixtures("_no_sync_hooks")
+def test_missing_object_is_a_404():
+    with pytest.raises(Http404):
+        _dispatch(hx.ObjectEchoHx, hx_kwargs={"object": Widget(pk=404, name="gone")})
+
+
+@pytest.mark.usefixtures("_no_sync_hooks")
+def test_views_context_comes_from_the_async_get():
+    response = _dispatch(hx.SimpleGetHx)
+    assert "view_flavor:from-the-view" in content_of(response)
+
+
+@pytest.mark.usefixtures("_no_sync_hooks")
+def test_model_kwargs_are_resolved(widget):
+    response = _dispatch(hx.KwargsContextHx, hx_kwargs={"flavor": widget})
+    assert "gizmo" in content_of(response)
+
+
+@pytest.mark.usefixtures("_no_sync_hooks")
+def test_form_post_is_validated_and_saved():
+    response = _dispatch(hx.WidgetFormHx, method="POST", post_data={"name": "async-widget"})
+    assert Widget.objects.filter(name="async-widget").exists()
+    assert "FORM-SAVED" in content_of(response)
+
+
+@pytest.mark.usefixtures("_no_sync_hooks")
+def test_invalid_form_post_rerenders_the_form():
+    response = _dispatch(hx.WidgetFormHx, method="POST", post_data={})
+    assert "HAS-ERRORS" in content_of(response)
+
+
+@pytest.mark.usefixtures("_no_sync_hooks")
+def test_delete_post_deletes(widget):
+    _dispatch(hx.WidgetDeleteHx, method="POST", hx_kwargs={"object": widget})
+    assert not Widget.objects.filter(pk=widget.pk).exists()
+
+
+@pytest.mark.usefixtures("_no_sync_hooks")
+def test_async_hook_runs():
+    response = _dispatch(hx.AsyncPostActionHx, method="POST")
+    assert Widget.objects.filter(name="from-apost-action").exists()
+    assert "post-template" in content_of(response)
+
+
+def test_lazy_user_is_resolved_before_dispatch():
+    user = User.objects.create(username="async-user")
+
+    async def auser():
+        return user
+
+    request = _create_test_request(hx.SimpleGetHx, request_attrs={"auser": auser})
+    response = async_to_sync(_await)(AsyncView.as_view()(request))
+    assert response.status_code == 200
+    assert request.user == user
+
+
+def test_stored_payload_is_read_off_the_event_loop(settings):
+    settings.CACHES = {
+        **settings.CACHES,
+        "payloads": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "hx_payloads",
+        },
+    }
+    settings.HX_REQUESTS_PAYLOAD_STORE_CACHE = "payloads"
+    settings.HX_REQUESTS_PAYLOAD_STORE_THRESHOLD = 300
+    settings.HX_REQUESTS_TOKEN_COMPRESS_THRESHOLD = None
+    call_command("createcachetable", "--database", "default")
+
+    response = _dispatch(hx.KwargsContextHx, hx_kwargs={"flavor": "spicy " * 100})
+    assert "spicy spicy" in content_of(response)
+
+
+def test_overridden_view_hook_runs_off_the_event_loop(widget, monkeypatch):
+    get_hx_request = AsyncView.get_hx_request
+
+    def query_then_get_hx_request(self, request):
+        _query_db()
+        return get_hx_request(self, request)
+
+    monkeypatch.setattr(AsyncView, "get_hx_request", query_then_get_hx_request, raising=False)
+    response = _dispatch(hx.ObjectEchoHx, hx_kwargs={"object": widget})
+    assert content_of(response).strip() == "object|gizmo"
+
+
+def test_overridden_allow_rule_runs_off_the_event_loop(widget, monkeypatch):
+    def query_then_allow(self, hx_cls, request):
+        _query_db()
+        return True
+
+    monkeypatch.setattr(AsyncView, "is_hx_allowed", query_then_allow, raising=False)
+    response = _dispatch(hx.ObjectEchoHx, hx_kwargs={"object": widget})
+    assert content_of(response).strip() == "object|gizmo"
+
+
+def test_overridden_queryset_runs_off_the_event_loop(widget, monkeypatch):
+    def query_then_queryset(self):
+        _query_db()
+        return Widget.objects.all()
+
+    monkeypatch.setattr(hx.ObjectEchoHx, "get_queryset", query_then_queryset, raising=False)
+    response = _dispatch(hx.ObjectEchoHx, hx_kwargs={"object": widget})
+    assert content_of(response).strip() == "object|gizmo"
+
+
+@pytest.mark.parametrize("hook", ["get_form_kwargs", "get_initial"])
+def test_overridden_form_hooks_run_off_the_event_loop(hook, monkeypatch):
+    sync_hook = getattr(hx.WidgetFormHx, hook)
+
+    def query_then_call(self, **kwargs):
+        _query_db()
+        return sync_hook(self, **kwargs)
+
+    monkeypatch.setattr(hx.WidgetFormHx, hook, query_then_call)
+    response = _dispatch(hx.WidgetFormHx, method="POST", post_data={"name": "async-widget"})
+    assert "FORM-SAVED" in content_of(response)
+
+
+@pytest.mark.parametrize(
+    ("hx_class", "post_data", "hook"),
+    [
+        (hx.WidgetFormHx, {"name": "async-widget"}, "get_success_message"),
+        (hx.WidgetFormHx, {}, "get_error_message"),
+        (hx.WidgetDeleteHx, {}, "get_success_message"),
+    ],
+)
+def test_message_hooks_run_off_the_event_loop(widget, monkeypatch, hx_class, post_data, hook):
+    def query_then_message(self, **kwargs):
+        _query_db()
+        return "message"
+
+    monkeypatch.setattr(hx_class, hook, query_then_message)
+    response = _dispatch(hx_class, method="POST", hx_kwargs={"object": widget}, post_data=post_data)
+    assert response.status_code == 200
+
+
+def test_async_views_are_refused_before_django_5(monkeypatch):
+    monkeypatch.setattr(django, "VERSION", (4, 2, 0, "final", 0))
+    with pytest.raises(ImproperlyConfigured, match="Django 5.0 or later"):
+        AsyncView.as_view()(_create_test_request(hx.SimpleGetHx))
+
+
+def test_csrf_cookie_is_set():
+    response = _dispatch(hx.SimpleGetHx)
+    assert "csrftoken" in response.cookies
+
+
+def test_full_page_load_uses_the_async_get():
+    response = async_to_sync(_await)(AsyncView.as_view()(RequestFactory().get("/")))
+    assert "base-view-template|view_flavor:from-the-view" in content_of(response.render())
+    assert "csrftoken" in response.cookies
+
+
+# --------------------------------------------------------------------------
+# Sync fallback
+# --------------------------------------------------------------------------
+
+
+def test_sync_override_is_never_skipped():
+    assert hx.PostActionSideEffectHx.supports_native_async() is False
+    _dispatch(hx.PostActionSideEffectHx, method="POST")
+    assert Widget.objects.filter(name="from-post-action").exists()
+
+
+def test_registry_metadata_records_native_support():
+    assert HxRequestRegistry.get_hx_request_metadata("object_echo").native_async is True
+    assert HxRequestRegistry.get_hx_request_metadata("message_post").native_async is False
+
+
+@pytest.mark.parametrize(
+    ("hx_class", "native"),
+    [
+        (hx.WidgetFormHx, True),
+        (hx.WidgetFormModalHx, True),
+        (hx.ShortCircuitFormHx, False),
+        (hx.ShortCircuitDeleteHx, False),
+        (hx.RefreshViewsContextHx, False),
+    ],
+)
+def test_native_support_follows_overrides(hx_class, native):
+    assert hx_class.supports_native_async() is native
+
+
+def test_sync_views_keep_the_sync_path(widget):
+    request = _create_test_request(hx.ObjectEchoHx, hx_kwargs={"object": widget})
+    response = BaseView.as_view()(request)
+    assert "object|gizmo" in content_of(response)
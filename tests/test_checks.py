@@ -1,10 +1,23 @@
 """Tests for hx_requests.checks (Django system checks)."""
 
-# Importing the views registers them as HtmxViewMixin subclasses so the check
-# (which walks __subclasses__) can see them.
+import pytest
+from django.apps import apps
+from django.test import override_settings
+
+# Importing the views and handlers registers them as HtmxViewMixin /
+# BaseHxRequest subclasses so the checks (which walk __subclasses__) see them.
+from test_app import hx_requests  # noqa: F401
 from test_app.views import AuthAfterHxView, AuthBeforeHxView  # noqa: F401
 
-from hx_requests.checks import W_AUTH_MIXIN_ORDER, check_auth_mixin_ordering
+from hx_requests.checks import (
+    E_OWNER_VIEW,
+    W_AUTH_MIXIN_ORDER,
+    W_MANIFEST_MISSING_HANDLER,
+    W_MANIFEST_MODULE_NOT_FOUND,
+    check_auth_mixin_ordering,
+    check_hx_requests_modules_manifest,
+    check_owner_views,
+)
 
 
 def _flagged_view_names():
@@ -21,3 +34,69 @@ def test_warns_when_auth_mixin_is_after_htmxviewmixin():
 
 def test_does_not_warn_when_auth_mixin_is_before_htmxviewmixin():
     assert "AuthBeforeHxView" not in _flagged_view_names()
+
+
+def _manifest_warnings():
+    return [(w.id, w.msg) for w in check_hx_requests_modules_manifest(app_configs=None)]
+
+
+def test_manifest_check_is_silent_without_a_manifest():
+    assert _manifest_warnings() == []
+
+
+@override_settings(
+    HX_REQUESTS_MODULES=[
+        "test_app.hx_requests",
+        "test_app_two.hx_requests.widgets",
+        "test_app_two.hx_requests.nested.deep",
+    ]
+)
+def test_manifest_check_is_silent_for_a_complete_manifest():
+    assert _manifest_warnings() == []
+
+
+@override_settings(HX_REQUESTS_MODULES=["test_app.hx_requests", "test_app.no_such_module"])
+def test_manifest_check_flags_unlisted_handlers_and_missing_modules():
+    warnings = _manifest_warnings()
+    missing = [msg for wid, msg in warnings if wid == W_MANIFEST_MISSING_HANDLER]
+    assert any("'other_app_hx'" in msg for msg in missing)
+    assert any("'deep_hx'" in msg for msg in missing)
+    assert not any("'simple_get'" in msg for msg in missing)
+    assert [msg for wid, msg in warnings if wid == W_MANIFEST_MODULE_NOT_FOUND] == [
+        "hx_requests module manifest lists test_app.no_such_module, which was not found."
+    ]
+
+
+@override_settings(HX_REQUESTS_MODULES=["test_app.hx_requests"])
+def test_manifest_check_leaves_the_discovery_index_alone(clean_registry):
+    clean_registry._file_index = {}
+    clean_registry._file_index_dirty = False
+    assert _manifest_warnings()
+    assert clean_registry._file_index == {}
+    assert clean_registry._file_index_dirty is False
+
+
+@pytest.fixture()
+def _app_two_manifest(monkeypatch):
+    config = apps.get_app_config("test_app_two")
+    monkeypatch.setattr(
+        config, "hx_requests_modules", ["test_app_two.hx_requests.widgets"], raising=False
+    )
+
+
+@pytest.mark.usefixtures("_app_two_manifest")
+def test_manifest_check_covers_per_app_manifests():
+    missing = [msg for wid, msg in _manifest_warnings() if wid == W_MANIFEST_MISSING_HANDLER]
+    assert len(missing) == 1
+    assert "'deep_hx'" in missing[0]
+
+
+def test_owner_view_check_flags_unsafe_owner_views():
+    flagged = {
+        error.obj.name for error in check_owner_views(app_configs=None) if error.id == E_OWNER_VIEW
+    }
+    assert flagged == {
+        "routed_with_views_context",
+        "routed_to_auth_view",
+        "routed_to_decorated_view",
+    }
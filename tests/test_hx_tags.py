@@ -8,8 +8,8 @@ from urllib.parse import parse_qs, urlparse
 import pytest
 from django.template import Context, Template
 
-from hx_requests.templatetags.hx_tags import hx_get, hx_post, hx_url
-from hx_requests.utils import HX_TOKEN_PARAM, deserialize, deserialize_kwargs, unsign_hx_payload
+from hx_requests.templatetags.hx_tags import hx_get, hx_post, hx_url, hx_urls
+from hx_requests.utils import HX_TOKEN_PARAM, deserialize, deserialize_payload_kwargs, unsign_hx_payload
 from tests.helpers import make_context
 
 
@@ -40,7 +40,7 @@ def test_hx_get_includes_object_and_kwargs(widget):
     payload = payload_from_attr(out)
     assert payload["name"] == "simple_get"
     assert deserialize(payload["object"]) == widget
-    assert deserialize_kwargs(**payload["kwargs"]) == {"flavor": "spicy"}
+    assert deserialize_payload_kwargs(payload) == {"flavor": "spicy"}
 
 
 def test_hx_post_renders_quoted_attribute_and_csrf_headers():
@@ -79,3 +79,25 @@ def test_tags_render_through_the_template_engine():
     assert rendered.startswith("/page/?")
     query = parse_qs(urlparse(rendered).query)
     assert unsign_hx_payload(query[HX_TOKEN_PARAM][0])["name"] == "simple_get"
+
+
+def test_hx_urls_maps_each_object_to_its_hx_url():
+    from test_app.models import Widget
+
+    widgets = [Widget(pk=pk, name=f"w{pk}") for pk in (1, 2, 3)]
+    context = make_context()
+    urls = hx_urls(context, "simple_get", widgets, flavor="spicy")
+    assert urls == {w.pk: hx_url(context, "simple_get", w, flavor="spicy") for w in widgets}
+
+
+def test_hx_urls_and_hx_url_for_render_through_the_template_engine():
+    from test_app.models import Widget
+
+    widgets = [Widget(pk=pk, name=f"w{pk}") for pk in (1, 2)]
+    template = Template(
+        "{% load hx_tags %}{% hx_urls 'simple_get' widgets as urls %}"
+        "{% for widget in widgets %}{{ urls|hx_url_for:widget }}\n{% endfor %}"
+    )
+    rendered = template.render(Context({**make_context(), "widgets": widgets}))
+    lines = html.unescape(rendered).split()
+    assert lines == [hx_url(make_context(), "simple_get", w) for w in widgets]
@@ -0,0 +1,60 @@
+"""
+Import-cost regression tests.
+
+Processes that never render an HxRequest (migrations, celery workers, shell)
+still import the discovery and token modules. These run ``python -X
+importtime`` in a fresh interpreter and check what importing them drags in.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MARK = "@@hx-requests-import-mark"
+
+# The rendering stack: only needed once an HxRequest is actually dispatched.
+RENDERING_MODULES = {
+    "hx_requests.hx_requests",
+    "render_block",
+    "django.contrib.messages",
+    "django.forms",
+    "django.template.loader",
+}
+
+# A deliberately loose ceiling on the cumulative import time of the module
+# itself (Django already set up). The module-set assertion is the precise guard;
+# this catches an order-of-magnitude regression without being flaky.
+MAX_IMPORT_MICROSECONDS = 250_000
+
+
+def _import_profile(module):
+    """``{module_name: cumulative_microseconds}`` for imports done by ``import module``."""
+    code = f"import django, sys; django.setup(); sys.stderr.write('{MARK}\\n'); import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "tests.settings"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.split(MARK, 1)[1].splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        profile[name.strip()] = int(cumulative)
+    return profile
+
+
+@pytest.mark.parametrize("module", ["hx_requests.hx_registry", "hx_requests.utils"])
+def test_discovery_and_token_modules_do_not_import_the_rendering_stack(module):
+    profile = _import_profile(module)
+
+    assert module in profile
+    assert not RENDERING_MODULES & set(profile)
+    assert profile[module] < MAX_IMPORT_MICROSECONDS
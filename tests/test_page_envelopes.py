@@ -0,0 +1,160 @@
+"""Tests for page envelopes: one signed token per list, a short MAC per row."""
+
+import html
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.template import Context, Template
+from django.test import RequestFactory
+from test_app.models import Widget
+from test_app.views import BaseView
+
+from hx_requests.constants import HX_ENVELOPE_HEADER_PREFIX, HX_ROW_PARAM
+from hx_requests.token_codecs import JSONTokenCodec
+from hx_requests.utils import (
+    HX_TOKEN_PARAM,
+    get_envelope_urls,
+    get_hx_payload,
+    get_url,
+    unsign_hx_payload,
+)
+from tests.helpers import add_middleware_to_request, content_of, make_context
+
+WIDGETS = [Widget(pk=pk, name=f"w{pk}") for pk in (1, 2, 3)]
+
+
+def _row_request(url, envelope):
+    request = RequestFactory().get(url)
+    request.META["HTTP_HX_REQUEST"] = True
+    request.user = AnonymousUser()
+    for header, value in envelope.headers.items():
+        request.META[_meta_key(header)] = value
+    return add_middleware_to_request(request)
+
+
+def _meta_key(header):
+    return "HTTP_" + header.upper().replace("-", "_")
+
+
+def _row_param(url):
+    return parse_qs(urlparse(url).query)[HX_ROW_PARAM][0]
+
+
+def test_row_resolves_to_the_payload_of_a_full_token():
+    context = make_context()
+    urls = get_envelope_urls(context, "kwargs_context", WIDGETS, flavor="spicy")
+
+    for widget in WIDGETS:
+        full_token = parse_qs(urlparse(get_url(context, "kwargs_context", widget, flavor="spicy")).query)
+        expected = unsign_hx_payload(full_token[HX_TOKEN_PARAM][0])
+        assert get_hx_payload(_row_request(urls[widget.pk], urls)) == expected
+
+
+def test_row_urls_are_a_few_dozen_bytes():
+    urls = get_envelope_urls(make_context(), "kwargs_context", WIDGETS, flavor="spicy")
+    assert all(len(url) < 48 for url in urls.values())
+    assert len(urls.headers) == 1
+
+
+def test_one_full_signing_per_page(monkeypatch):
+    calls = []
+    real_encode = JSONTokenCodec.encode
+
+    def counting_encode(self, payload):
+        calls.append(payload)
+        return real_encode(self, payload)
+
+    monkeypatch.setattr(JSONTokenCodec, "encode", counting_encode)
+    widgets = [Widget(pk=pk, name=f"w{pk}") for pk in range(1, 201)]
+    get_envelope_urls(make_context(), "object_echo", widgets)
+    assert len(calls) == 1
+
+
+@pytest.mark.django_db()
+def test_row_dispatches_through_a_view(widget):
+    urls = get_envelope_urls(make_context(), "object_echo", [widget])
+    response = BaseView.as_view()(_row_request(urls[widget.pk], urls))
+    assert "object|gizmo" in content_of(response)
+
+
+@pytest.mark.parametrize(
+    "forge",
+    [
+        lambda row: row.replace(".1.", ".2."),  # another object's pk
+        lambda row: row[:-3] + "xxx",  # tampered MAC
+        lambda row: "00000000" + row[8:],  # unknown envelope
+    ],
+)
+def test_forged_rows_are_rejected(forge):
+    urls = get_envelope_urls(make_context(), "object_echo", WIDGETS)
+    request = _row_request(urls[1], urls)
+    request.GET = request.GET.copy()
+    request.GET[HX_ROW_PARAM] = forge(_row_param(urls[1]))
+    assert get_hx_payload(request) is None
+
+
+def test_row_from_another_envelope_is_rejected():
+    urls = get_envelope_urls(make_context(), "object_echo", WIDGETS)
+    other = get_envelope_urls(make_context(), "object_echo", WIDGETS, flavor="spicy")
+    request = _row_request(urls[1], urls)
+    # Swap in the other envelope under this row's header name.
+    request.META[_meta_key(next(iter(urls.headers)))] = next(iter(other.headers.values()))
+    assert get_hx_payload(request) is None
+
+
+def test_row_without_its_envelope_is_rejected():
+    urls = get_envelope_urls(make_context(), "object_echo", WIDGETS)
+    request = RequestFactory().get("/page/", data={HX_ROW_PARAM: _row_param(urls[1])})
+    assert get_hx_payload(request) is None
+
+
+def test_envelope_is_not_accepted_as_a_token():
+    urls = get_envelope_urls(make_context(), "object_echo", WIDGETS)
+    request = RequestFactory().get("/page/", data={HX_TOKEN_PARAM: next(iter(urls.headers.values()))})
+    assert get_hx_payload(request) is None
+
+
+def test_rows_honour_secret_key_fallbacks(settings):
+    urls = get_envelope_urls(make_context(), "object_echo", WIDGETS)
+    settings.SECRET_KEY_FALLBACKS = [settings.SECRET_KEY]
+    settings.SECRET_KEY = "a-brand-new-secret-key"
+    assert get_hx_payload(_row_request(urls[2], urls))["object"].endswith("__2")
+
+
+def test_envelope_carries_model_kwargs():
+    owner = Widget(pk=9, name="owner")
+    urls = get_envelope_urls(make_context(), "kwargs_context", WIDGETS, owner=owner)
+    payload = get_hx_payload(_row_request(urls[1], urls))
+    assert payload["kw_models"] == {"owner": "model_instance__test_app__widget__9"}
+    assert payload["kw"] == {}
+
+
+def test_binary_codec_carries_the_envelope(settings):
+    settings.HX_REQUESTS_TOKEN_CODEC = "hx_requests.token_codecs.BinaryTokenCodec"
+    urls = get_envelope_urls(make_context(), "object_echo", WIDGETS)
+    assert get_hx_payload(_row_request(urls[3], urls))["object"] == "model_instance__test_app__widget__3"
+
+
+def test_mixed_models_are_refused():
+    from django.contrib.auth.models import User
+
+    with pytest.raises(ValueError, match="page envelope"):
+        get_envelope_urls(make_context(), "object_echo", [WIDGETS[0], User(pk=1)])
+
+
+def test_no_objects_mint_nothing():
+    urls = get_envelope_urls(make_context(), "object_echo", [])
+    assert urls == {}
+    assert urls.headers == {}
+
+
+def test_envelope_tags_render_through_the_template_engine():
+    template = Template(
+        "{% load hx_tags %}{% hx_envelope 'object_echo' widgets as edit_urls %}"
+        "<tbody {% hx_envelope_attrs edit_urls %}>"
+        "{% for widget in widgets %}{{ edit_urls|hx_url_for:widget }}\n{% endfor %}</tbody>"
+    )
+    rendered = html.unescape(template.render(Context({**make_context(), "widgets": WIDGETS})))
+    assert f"hx-headers='{{\"{HX_ENVELOPE_HEADER_PREFIX}" in rendered
+    assert rendered.count(f"?{HX_ROW_PARAM}=") == len(WIDGETS)
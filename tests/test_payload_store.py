@@ -0,0 +1,123 @@
+"""Tests for the server-side payload store (HX_REQUESTS_PAYLOAD_STORE_THRESHOLD)."""
+
+import pytest
+from django.core.cache import cache, caches
+from django.http import Http404
+from django.test import RequestFactory
+from test_app import hx_requests as hx
+from test_app.views import BaseView
+
+from hx_requests.token_codecs import BinaryTokenCodec
+from hx_requests.utils import (
+    HX_TOKEN_PARAM,
+    PAYLOAD_STORE_KEY_PREFIX,
+    HxPayloadExpired,
+    deserialize_payload_kwargs,
+    get_hx_payload,
+    get_url,
+    is_hx_request,
+    sign_hx_payload,
+    unsign_hx_payload,
+)
+from tests.helpers import add_middleware_to_request, content_of, hx_get, make_context
+
+LONG_FLAVOR = "spicy " * 100
+
+
+@pytest.fixture()
+def payload_store(settings):
+    settings.HX_REQUESTS_PAYLOAD_STORE_THRESHOLD = 300
+    # LONG_FLAVOR compresses to almost nothing; keep token length tracking payload size.
+    settings.HX_REQUESTS_TOKEN_COMPRESS_THRESHOLD = None
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def _stored_keys(store):
+    return [key for key in store._cache if PAYLOAD_STORE_KEY_PREFIX in key]
+
+
+def test_small_payloads_are_signed_inline(payload_store):
+    token = sign_hx_payload("simple_get", flavor="spicy")
+    assert "stored" not in unsign_hx_payload(token)
+    assert _stored_keys(payload_store) == []
+
+
+def test_large_payloads_are_stored_and_rehydrated(payload_store):
+    token = sign_hx_payload("simple_get", bind_path="/page/", flavor=LONG_FLAVOR)
+
+    assert len(token) < 300
+    assert len(_stored_keys(payload_store)) == 1
+    payload = unsign_hx_payload(token)
+    assert payload["name"] == "simple_get"
+    assert payload["path"] == "/page/"
+    assert deserialize_payload_kwargs(payload) == {"flavor": LONG_FLAVOR}
+
+
+def test_identical_payloads_share_one_stored_entry(payload_store):
+    sign_hx_payload("simple_get", flavor=LONG_FLAVOR)
+    sign_hx_payload("simple_get", flavor=LONG_FLAVOR)
+    assert len(_stored_keys(payload_store)) == 1
+
+
+def test_stored_payload_dispatches_through_a_view(payload_store):
+    response = hx_get(hx.KwargsContextHx, BaseView, hx_kwargs={"flavor": LONG_FLAVOR})
+    assert f"direct:{LONG_FLAVOR.strip()}" in content_of(response)
+
+
+def _request_for(url):
+    request = RequestFactory().get(url)
+    request.META["HTTP_HX_REQUEST"] = True
+    return add_middleware_to_request(request)
+
+
+def test_evicted_payload_is_a_clear_404(payload_store):
+    url = get_url(make_context(), "kwargs_context", None, flavor=LONG_FLAVOR)
+    payload_store.clear()
+
+    with pytest.raises(Http404, match="expired"):
+        BaseView()._resolve_hx_token(_request_for(url))
+
+
+def test_evicted_payload_reads_as_no_hx_request(payload_store):
+    token = sign_hx_payload("simple_get", flavor=LONG_FLAVOR)
+    payload_store.clear()
+
+    request = RequestFactory().get("/", data={HX_TOKEN_PARAM: token})
+    assert get_hx_payload(request) is None
+    assert is_hx_request(request) is False
+    with pytest.raises(HxPayloadExpired):
+        unsign_hx_payload(token)
+
+
+def test_minting_again_after_eviction_stores_the_payload_again(payload_store):
+    sign_hx_payload("simple_get", flavor=LONG_FLAVOR)
+    payload_store.clear()
+
+    token = sign_hx_payload("simple_get", flavor=LONG_FLAVOR)
+    assert deserialize_payload_kwargs(unsign_hx_payload(token)) == {"flavor": LONG_FLAVOR}
+
+
+def test_binary_codec_carries_the_store_key(payload_store, settings):
+    settings.HX_REQUESTS_TOKEN_CODEC = "hx_requests.token_codecs.BinaryTokenCodec"
+    token = sign_hx_payload("simple_get", flavor=LONG_FLAVOR)
+    assert "stored" in BinaryTokenCodec().decode(token)
+    assert deserialize_payload_kwargs(unsign_hx_payload(token)) == {"flavor": LONG_FLAVOR}
+
+
+def test_store_uses_the_configured_cache_alias(payload_store, settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "hx_payloads": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "hx-payloads",
+        },
+    }
+    settings.HX_REQUESTS_PAYLOAD_STORE_CACHE = "hx_payloads"
+    settings.HX_REQUESTS_PAYLOAD_STORE_THRESHOLD = 300
+
+    token = sign_hx_payload("simple_get", flavor=LONG_FLAVOR)
+    assert len(_stored_keys(caches["hx_payloads"])) == 1
+    assert deserialize_payload_kwargs(unsign_hx_payload(token)) == {"flavor": LONG_FLAVOR}
+    caches["hx_payloads"].clear()
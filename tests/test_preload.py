@@ -0,0 +1,50 @@
+"""Tests for the pre-fork preload entry point."""
+
+import gc
+
+from hx_requests import preload as preload_module
+from hx_requests.hx_registry import HxRequestRegistry
+from hx_requests.preload import preload
+
+
+def test_preload_freezes_the_registry_and_builds_metadata(clean_registry):
+    HxRequestRegistry.reset()
+    result = preload(warm_templates=False)
+
+    assert HxRequestRegistry._frozen is not None
+    assert result["handlers"] == len(HxRequestRegistry._frozen)
+    assert set(HxRequestRegistry._metadata) >= set(HxRequestRegistry._frozen)
+
+
+def test_preload_without_freezing_still_resolves_every_handler(clean_registry):
+    HxRequestRegistry.reset()
+    preload(freeze_registry=False, warm_templates=False)
+
+    assert HxRequestRegistry._frozen is None
+    assert isinstance(HxRequestRegistry._registry["simple_get"], type)
+
+
+def test_preload_compiles_static_handler_templates(clean_registry, monkeypatch):
+    compiled = []
+    real_get_template = preload_module.get_template
+    monkeypatch.setattr(
+        preload_module, "get_template", lambda name: compiled.append(name) or real_get_template(name)
+    )
+
+    result = preload()
+
+    # Plain, list-form and dict-block templates, plus the modal/messages templates.
+    assert {"simple.html", "second.html", "blocks2.html", "hx_modal.html", "hx_messages.html"} <= set(
+        compiled
+    )
+    assert result["templates"] == len(set(compiled))
+
+
+def test_preload_can_freeze_the_garbage_collector(clean_registry, monkeypatch):
+    calls = []
+    monkeypatch.setattr(gc, "collect", lambda: calls.append("collect"))
+    monkeypatch.setattr(gc, "freeze", lambda: calls.append("freeze"))
+
+    preload(warm_templates=False, freeze_gc=True)
+
+    assert calls == ["collect", "freeze"]
@@ -1,8 +1,12 @@
 """Tests for HxRequestRegistry: AST discovery, lazy loading, manual registration."""
 
+import ast
+import json
 import logging
+import os
 
 import pytest
+from django.test import override_settings
 
 from hx_requests.hx_registry import DuplicateHxRequestNameError, HxRequestRegistry
 from hx_requests.hx_requests import BaseHxRequest
@@ -105,7 +109,7 @@ def test_parse_file_ignores_non_string_names(clean_registry, tmp_path):
 def test_parse_file_skips_unparsable_files_with_warning(clean_registry, tmp_path, caplog):
     HxRequestRegistry.reset()
     source = tmp_path / "scratch.py"
-    source.write_text("def broken(:\n")
+    source.write_text("class Foo:\n    name = 'broken'\n\ndef broken(:\n")
     with caplog.at_level(logging.WARNING, logger="hx_requests.hx_registry"):
         HxRequestRegistry._parse_file(str(source), "scratch.module")
     assert HxRequestRegistry._registry == {}
@@ -114,6 +118,51 @@ def test_parse_file_skips_unparsable_files_with_warning(clean_registry, tmp_path
     assert "scratch.py" in caplog.text
 
 
+def test_prefilter_skips_files_that_cannot_declare_a_name(clean_registry, tmp_path, monkeypatch):
+    HxRequestRegistry.reset()
+    helper = tmp_path / "helpers.py"
+    helper.write_text("class Mixin:\n    title = 'x'\n\ndef f(name='y'):\n    return name == 'y'\n")
+    parses = _count_ast_parses(monkeypatch)
+    HxRequestRegistry._parse_file(str(helper), "scratch.helpers")
+    assert parses == []
+    assert HxRequestRegistry._registry == {}
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "class Foo:\n    name = 'candidate'\n",
+        "class Foo:\n\tname: str = 'candidate'\n",
+        "class Foo: name = 'candidate'\n",
+        "class Foo:\n    title = name = 'candidate'\n",
+        "# -*- coding: latin-1 -*-\nclass Foo:\n    name='candidate'  # caf\xe9\n",
+    ],
+)
+def test_prefilter_keeps_every_name_assignment_form(clean_registry, tmp_path, source):
+    HxRequestRegistry.reset()
+    module = tmp_path / "scratch.py"
+    module.write_bytes(source.encode("latin-1"))
+    HxRequestRegistry._parse_file(str(module), "scratch.module")
+    assert HxRequestRegistry._registry == {"candidate": ("scratch.module", "Foo")}
+
+
+def test_prefilter_only_parses_candidates_in_a_large_tree(clean_registry, tmp_path, monkeypatch):
+    # A synthetic app tree: a few thousand helper/form/mixin modules and a
+    # handful of real handler modules. Only the handler modules get an AST.
+    candidates = []
+    for i in range(2000):
+        helper = tmp_path / f"helper_{i}.py"
+        helper.write_text(f"from django import forms\n\nclass Form{i}(forms.Form):\n    title = 'x'\n")
+        candidates.append((str(helper), f"scratch.helper_{i}"))
+    candidates.extend(_scratch_tree(tmp_path, 20))
+    parses = _count_ast_parses(monkeypatch)
+
+    _initialize_from(monkeypatch, candidates)
+
+    assert len(parses) == 20
+    assert len(HxRequestRegistry._registry) == 20
+
+
 def test_parse_file_skips_unreadable_file_with_warning(clean_registry, caplog):
     # A file that cannot be read (missing / unreadable) is skipped loudly
     # rather than blowing up discovery for the whole app.
@@ -133,6 +182,425 @@ def test_duplicate_names_raise(clean_registry, tmp_path):
         HxRequestRegistry._parse_file(str(source), "scratch.other_module")
 
 
+# --------------------------------------------------------------------------
+# Handler metadata
+# --------------------------------------------------------------------------
+
+
+def test_metadata_is_built_when_the_class_is_resolved(clean_registry):
+    from test_app.hx_requests import UnboundHx
+
+    HxRequestRegistry.reset()
+    HxRequestRegistry.get_hx_request("unbound")
+    metadata = HxRequestRegistry._metadata["unbound"]
+
+    assert metadata.hx_class is UnboundHx
+    assert metadata.name == "unbound"
+    assert metadata.app_label == "test_app"
+    assert metadata.bind_to_path is False
+    assert HxRequestRegistry.get_hx_request_metadata("unbound") is metadata
+    assert not hasattr(metadata, "__dict__")
+
+
+def test_metadata_for_unknown_name_is_none():
+    assert HxRequestRegistry.get_hx_request_metadata("no_such_hx_request") is None
+
+
+def test_manual_registration_builds_metadata(clean_registry):
+    class ManualHx(BaseHxRequest):
+        name = "manual_meta"
+        bind_to_path = False
+
+    HxRequestRegistry.register_hx_request("manual_meta", ManualHx)
+    assert HxRequestRegistry.get_hx_request_metadata("manual_meta").bind_to_path is False
+
+
+def test_dispatch_policy_reads_the_handler_app_label_from_metadata(monkeypatch):
+    from django.apps import apps
+    from django.test import RequestFactory
+    from test_app.hx_requests import SimpleGetHx
+    from test_app.views import BaseView
+
+    HxRequestRegistry.get_hx_request_metadata("simple_get")
+    looked_up = []
+    real = apps.get_containing_app_config
+    monkeypatch.setattr(
+        apps, "get_containing_app_config", lambda name: looked_up.append(name) or real(name)
+    )
+
+    assert BaseView().is_hx_allowed(SimpleGetHx, RequestFactory().get("/"))
+    assert SimpleGetHx.__module__ not in looked_up
+
+
+# --------------------------------------------------------------------------
+# Frozen snapshot
+# --------------------------------------------------------------------------
+
+
+def test_freeze_serves_lookups_from_an_immutable_snapshot(clean_registry):
+    from test_app.hx_requests import SimpleGetHx
+
+    HxRequestRegistry.reset()
+    HxRequestRegistry.freeze()
+    frozen = HxRequestRegistry._frozen
+
+    # Lookups no longer touch the mutable registry at all.
+    HxRequestRegistry._registry = {}
+    assert HxRequestRegistry.get_hx_request("simple_get") is SimpleGetHx
+    assert HxRequestRegistry.get_hx_request("not_an_hx_request") is None
+    assert "not_an_hx_request" not in frozen
+    with pytest.raises(TypeError):
+        frozen["simple_get"] = None
+
+
+def test_manual_registration_after_freeze_publishes_a_new_snapshot(clean_registry):
+    class ManualHx(BaseHxRequest):
+        pass
+
+    HxRequestRegistry.freeze()
+    before = HxRequestRegistry._frozen
+    HxRequestRegistry.register_hx_request("manual_after_freeze", ManualHx)
+
+    assert HxRequestRegistry.get_hx_request("manual_after_freeze") is ManualHx
+    assert "manual_after_freeze" not in before
+
+
+@override_settings(HX_REQUESTS_FREEZE_REGISTRY=True)
+def test_freeze_registry_setting_freezes_after_discovery(clean_registry):
+    HxRequestRegistry.reset()
+    assert HxRequestRegistry.get_hx_request("simple_get") is not None
+    assert HxRequestRegistry._frozen is not None
+    assert all(isinstance(v, type) for v in HxRequestRegistry._frozen.values())
+
+
+# --------------------------------------------------------------------------
+# Eager loading
+# --------------------------------------------------------------------------
+
+
+def test_eager_load_resolves_everything_and_reports_module_timings(clean_registry, caplog):
+    HxRequestRegistry.reset()
+    with caplog.at_level(logging.INFO, logger="hx_requests.hx_registry"):
+        timings = HxRequestRegistry.eager_load()
+
+    assert isinstance(HxRequestRegistry._registry["simple_get"], type)
+    assert isinstance(HxRequestRegistry._registry["deep_hx"], type)
+    assert {"test_app.hx_requests", "test_app_two.hx_requests.widgets"} <= set(timings)
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert "eagerly loaded" in caplog.text
+
+
+@pytest.mark.parametrize("mode", [True, "background"])
+def test_eager_load_setting_warms_the_registry_at_ready(clean_registry, mode):
+    from django.apps import apps
+
+    HxRequestRegistry.reset()
+    config = apps.get_app_config("hx_requests")
+    with override_settings(HX_REQUESTS_EAGER_LOAD=mode):
+        config.ready()
+    if mode == "background":
+        config.eager_load_thread.join(timeout=10)
+        config.eager_load_thread = None
+
+    assert isinstance(HxRequestRegistry._registry["simple_get"], type)
+
+
+# --------------------------------------------------------------------------
+# Persistent discovery index
+# --------------------------------------------------------------------------
+
+
+def _count_ast_parses(monkeypatch):
+    calls = []
+    real_parse = ast.parse
+
+    def counting_parse(*args, **kwargs):
+        calls.append(kwargs.get("filename"))
+        return real_parse(*args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    return calls
+
+
+def test_warm_start_from_discovery_index_parses_nothing(clean_registry, tmp_path, monkeypatch):
+    index_path = tmp_path / "hx_index.json"
+    with override_settings(HX_REQUESTS_DISCOVERY_CACHE=str(index_path)):
+        HxRequestRegistry.reset()
+        HxRequestRegistry.initialize()
+        cold = dict(HxRequestRegistry._registry)
+        assert index_path.exists()
+
+        HxRequestRegistry.reset()
+        parses = _count_ast_parses(monkeypatch)
+        HxRequestRegistry.initialize()
+
+    assert parses == []
+    assert HxRequestRegistry._registry == cold
+
+
+def test_discovery_index_reparses_changed_files(clean_registry, tmp_path, monkeypatch):
+    source = tmp_path / "scratch.py"
+    source.write_text("class Foo:\n    name = 'before'\n")
+    HxRequestRegistry.reset()
+    HxRequestRegistry._parse_file(str(source), "scratch.module")
+
+    source.write_text("class Foo:\n    name = 'after_edit'\n")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    HxRequestRegistry._registry = {}
+    parses = _count_ast_parses(monkeypatch)
+    HxRequestRegistry._parse_file(str(source), "scratch.module")
+
+    assert parses == [str(source)]
+    assert HxRequestRegistry._registry == {"after_edit": ("scratch.module", "Foo")}
+
+
+def test_discovery_index_drops_files_that_are_gone(clean_registry, tmp_path, monkeypatch):
+    index_path = tmp_path / "hx_index.json"
+    candidates = _scratch_tree(tmp_path, 3)
+    with override_settings(HX_REQUESTS_DISCOVERY_CACHE=str(index_path)):
+        _initialize_from(monkeypatch, candidates)
+        (tmp_path / "mod_2.py").unlink()
+        candidates.pop()
+        HxRequestRegistry.refresh()
+
+    assert sorted(json.loads(index_path.read_text())["files"]) == [c[0] for c in candidates]
+
+
+def test_discovery_index_from_another_version_is_ignored(clean_registry, tmp_path):
+    source = tmp_path / "scratch.py"
+    source.write_text("class Foo:\n    name = 'real_name'\n")
+    stat = source.stat()
+    index_path = tmp_path / "hx_index.json"
+    stale_entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "classes": [["stale", "Foo"]]}
+    index_path.write_text(json.dumps({"version": "0.0.0", "files": {str(source): stale_entry}}))
+
+    HxRequestRegistry.reset()
+    with override_settings(HX_REQUESTS_DISCOVERY_CACHE=str(index_path)):
+        HxRequestRegistry._load_discovery_index()
+    HxRequestRegistry._parse_file(str(source), "scratch.module")
+
+    assert HxRequestRegistry._registry == {"real_name": ("scratch.module", "Foo")}
+
+
+# --------------------------------------------------------------------------
+# Parallel discovery
+# --------------------------------------------------------------------------
+
+
+def _scratch_tree(tmp_path, count, duplicate_at=None):
+    candidates = []
+    for i in range(count):
+        hx_name = "scratch_0" if i == duplicate_at else f"scratch_{i}"
+        source = tmp_path / f"mod_{i}.py"
+        source.write_text(f"class Hx{i}:\n    name = '{hx_name}'\n")
+        candidates.append((str(source), f"scratch.mod_{i}"))
+    return candidates
+
+
+def _initialize_from(monkeypatch, candidates, **settings):
+    monkeypatch.setattr(
+        HxRequestRegistry, "_collect_hx_request_files", classmethod(lambda cls: candidates)
+    )
+    monkeypatch.setattr(HxRequestRegistry, "parallel_discovery_min_files", 2)
+    HxRequestRegistry.reset()
+    with override_settings(**settings):
+        HxRequestRegistry.initialize()
+
+
+def test_parallel_discovery_matches_sequential(clean_registry, tmp_path, monkeypatch):
+    candidates = _scratch_tree(tmp_path, 12)
+    _initialize_from(monkeypatch, candidates)
+    sequential = dict(HxRequestRegistry._registry)
+
+    _initialize_from(monkeypatch, candidates, HX_REQUESTS_PARALLEL_DISCOVERY=2)
+
+    assert list(HxRequestRegistry._registry.items()) == list(sequential.items())
+    assert len(HxRequestRegistry._file_index) == 12
+
+
+def test_parallel_discovery_reports_duplicates_like_sequential(clean_registry, tmp_path, monkeypatch):
+    candidates = _scratch_tree(tmp_path, 6, duplicate_at=4)
+    with pytest.raises(
+        DuplicateHxRequestNameError,
+        match=r"Duplicate HxRequest name found: scratch_0 \(in scratch.mod_4\)",
+    ):
+        _initialize_from(monkeypatch, candidates, HX_REQUESTS_PARALLEL_DISCOVERY=2)
+
+
+# --------------------------------------------------------------------------
+# Module manifest
+# --------------------------------------------------------------------------
+
+
+def _forbid_filesystem_probing(monkeypatch):
+    def forbidden(*args, **kwargs):
+        raise AssertionError("discovery probed the filesystem despite a manifest")
+
+    monkeypatch.setattr(os.path, "isdir", forbidden)
+    monkeypatch.setattr(os, "walk", forbidden)
+
+
+@override_settings(HX_REQUESTS_MODULES=["test_app_two.hx_requests.widgets"])
+def test_manifest_setting_restricts_discovery_without_probing(clean_registry, monkeypatch):
+    HxRequestRegistry.reset()
+    _forbid_filesystem_probing(monkeypatch)
+    HxRequestRegistry.initialize()
+
+    assert HxRequestRegistry._registry == {
+        "other_app_hx": ("test_app_two.hx_requests.widgets", "OtherAppHx")
+    }
+
+
+def test_per_app_manifest_replaces_that_apps_scan(clean_registry, monkeypatch):
+    from django.apps import apps
+
+    config = apps.get_app_config("test_app_two")
+    monkeypatch.setattr(
+        config, "hx_requests_modules", ["test_app_two.hx_requests.nested.deep"], raising=False
+    )
+    HxRequestRegistry.reset()
+    HxRequestRegistry.initialize()
+
+    assert "deep_hx" in HxRequestRegistry._registry
+    assert "other_app_hx" not in HxRequestRegistry._registry
+    assert "simple_get" in HxRequestRegistry._registry  # other apps still scanned
+
+
+@override_settings(HX_REQUESTS_MODULES=["not_an_app.hx_requests"])
+def test_manifest_module_outside_every_app_is_skipped_with_warning(clean_registry, caplog):
+    HxRequestRegistry.reset()
+    with caplog.at_level(logging.WARNING, logger="hx_requests.hx_registry"):
+        HxRequestRegistry.initialize()
+    assert HxRequestRegistry._registry == {}
+    assert "not a module of any installed app" in caplog.text
+
+
+# --------------------------------------------------------------------------
+# Incremental refresh
+# --------------------------------------------------------------------------
+
+
+def _touch(path, source):
+    # Bump mtime explicitly: a rewrite within the filesystem's timestamp
+    # granularity would otherwise look unchanged.
+    mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(source)
+    os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+
+
+def test_refresh_applies_only_changed_files(clean_registry, tmp_path, monkeypatch):
+    candidates = _scratch_tree(tmp_path, 5)
+    _initialize_from(monkeypatch, candidates)
+
+    _touch(tmp_path / "mod_1.py", "class Hx1:\n    name = 'renamed_1'\n")
+    (tmp_path / "mod_2.py").unlink()
+    new_file = tmp_path / "mod_new.py"
+    new_file.write_text("class HxNew:\n    name = 'brand_new'\n")
+    # Mutated in place: _initialize_from's patched collector returns this list.
+    candidates[:] = [c for c in candidates if not c[0].endswith("mod_2.py")]
+    candidates.append((str(new_file), "scratch.mod_new"))
+    parses = _count_ast_parses(monkeypatch)
+
+    changes = HxRequestRegistry.refresh()
+
+    assert sorted(parses) == sorted([str(tmp_path / "mod_1.py"), str(new_file)])
+    assert changes == {
+        "added": ["brand_new", "renamed_1"],
+        "removed": ["scratch_1", "scratch_2"],
+        "reloaded": [],
+    }
+    assert HxRequestRegistry._registry["brand_new"] == ("scratch.mod_new", "HxNew")
+    assert "scratch_0" in HxRequestRegistry._registry
+
+
+def test_refresh_rejects_duplicates_without_applying_anything(clean_registry, tmp_path, monkeypatch):
+    candidates = _scratch_tree(tmp_path, 3)
+    _initialize_from(monkeypatch, candidates)
+    before = dict(HxRequestRegistry._registry)
+
+    _touch(tmp_path / "mod_2.py", "class Hx2:\n    name = 'scratch_0'\n")
+    with pytest.raises(DuplicateHxRequestNameError, match="Duplicate HxRequest name found: scratch_0"):
+        HxRequestRegistry.refresh()
+
+    assert HxRequestRegistry._registry == before
+
+    # Fixing the clash elsewhere picks up the rejected file's rename as well.
+    _touch(tmp_path / "mod_0.py", "class Hx0:\n    name = 'renamed_0'\n")
+    assert HxRequestRegistry.refresh() == {
+        "added": ["renamed_0"],
+        "removed": ["scratch_2"],
+        "reloaded": ["scratch_0"],
+    }
+    assert HxRequestRegistry._registry["scratch_0"] == ("scratch.mod_2", "Hx2")
+
+
+def test_refresh_reimports_edited_handler_modules(clean_registry, tmp_path, monkeypatch):
+    package = tmp_path / "scratch_refresh_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    module = package / "handlers.py"
+    module.write_text(
+        "from hx_requests.hx_requests import BaseHxRequest\n\n"
+        "class EditedHx(BaseHxRequest):\n    name = 'edited_hx'\n    GET_template = 'before.html'\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    _initialize_from(monkeypatch, [(str(module), "scratch_refresh_pkg.handlers")])
+    assert HxRequestRegistry.get_hx_request("edited_hx").GET_template == "before.html"
+
+    _touch(module, module.read_text().replace("before.html", "after.html"))
+    assert HxRequestRegistry.refresh()["reloaded"] == ["edited_hx"]
+    assert HxRequestRegistry.get_hx_request("edited_hx").GET_template == "after.html"
+
+
+def test_hx_requests_files_are_those_of_installed_apps(clean_registry):
+    from django.apps import apps
+
+    app = apps.get_app_config("test_app")
+    assert HxRequestRegistry.is_hx_requests_file(os.path.join(app.path, "hx_requests.py"))
+    assert HxRequestRegistry.is_hx_requests_file(
+        os.path.join(apps.get_app_config("test_app_two").path, "hx_requests", "new.py")
+    )
+    assert not HxRequestRegistry.is_hx_requests_file(os.path.join(app.path, "views.py"))
+    assert not HxRequestRegistry.is_hx_requests_file("/proj/app/hx_requests.py")
+    assert not HxRequestRegistry.is_hx_requests_file("/proj/vendor/hx_requests/rows/edit.py")
+
+
+def test_autoreload_receiver_skips_the_restart_only_for_refreshed_names(
+    clean_registry, tmp_path, monkeypatch
+):
+    from hx_requests.apps import refresh_registry_on_file_change
+
+    candidates = _scratch_tree(tmp_path, 2)
+    _initialize_from(monkeypatch, candidates)
+    mod_0, mod_1 = (tmp_path / "mod_0.py", tmp_path / "mod_1.py")
+
+    assert refresh_registry_on_file_change(None, file_path="/proj/app/hx_requests.py") is None
+    # Claimed, but the refresh changes no name from the file.
+    assert refresh_registry_on_file_change(None, file_path=str(mod_0)) is None
+
+    _touch(mod_1, "class Hx1:\n    name = 'renamed_1'\n")
+    assert refresh_registry_on_file_change(None, file_path=str(mod_1)) is True
+    assert "renamed_1" in HxRequestRegistry._registry
+
+
+def test_autoreloader_watches_every_apps_hx_requests_files():
+    from pathlib import Path
+
+    from django.apps import apps
+    from django.utils.autoreload import StatReloader
+
+    from hx_requests.apps import watch_hx_requests_files
+
+    reloader = StatReloader()
+    watch_hx_requests_files(reloader)
+    watched = set(reloader.watched_files())
+
+    assert Path(apps.get_app_config("test_app").path, "hx_requests.py").resolve() in watched
+    app_two = Path(apps.get_app_config("test_app_two").path, "hx_requests").resolve()
+    assert app_two / "nested" / "deep.py" in watched
+
+
 # --------------------------------------------------------------------------
 # Manual registration and reset
 # --------------------------------------------------------------------------
@@ -159,5 +627,6 @@ def test_reset_clears_state_and_allows_reinitialization(clean_registry):
     HxRequestRegistry.reset()
     assert HxRequestRegistry._registry == {}
     assert HxRequestRegistry._initialized is False
+    assert HxRequestRegistry._frozen is None
     # get_hx_request re-initializes on demand.
     assert HxRequestRegistry.get_hx_request("simple_get") is not None
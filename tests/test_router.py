@@ -0,0 +1,144 @@
+"""Tests for the hx router: HxRequests with an owner_view served from one endpoint."""
+
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ImproperlyConfigured
+from django.http import Http404
+from django.test import RequestFactory
+from test_app import hx_requests as hx
+from test_app.views import BaseView, CountingView, StrictAllowListView
+
+from hx_requests.utils import HX_TOKEN_PARAM, get_url, get_urls, unsign_hx_payload
+from hx_requests.views import HxRouterView
+from tests.helpers import add_middleware_to_request, content_of, make_context
+
+pytestmark = pytest.mark.urls("test_app.urls")
+
+
+def _router_request(url, method="get"):
+    request = getattr(RequestFactory(), method)(url)
+    request.META["HTTP_HX_REQUEST"] = "true"
+    request.user = AnonymousUser()
+    return add_middleware_to_request(request)
+
+
+def _route(url, method="get"):
+    return HxRouterView.as_view()(_router_request(url, method))
+
+
+# ---------------------------------------------------------------------------
+# URLs
+# ---------------------------------------------------------------------------
+
+
+def test_routed_urls_point_at_the_router():
+    url = get_url(make_context("/page/?page=2"), "routed_object", None, use_full_path=True)
+    parsed = urlparse(url)
+    assert parsed.path == "/hx/"
+    # Loose page params still ride along, so the handler sees them.
+    assert parse_qs(parsed.query)["page"] == ["2"]
+
+
+def test_routed_tokens_are_not_bound_to_the_page():
+    url = get_url(make_context(), "routed_object", None)
+    token = parse_qs(urlparse(url).query)[HX_TOKEN_PARAM][0]
+    assert "path" not in unsign_hx_payload(token)
+
+
+def test_unrouted_urls_still_point_at_the_page():
+    assert urlparse(get_url(make_context(), "object_echo", None)).path == "/page/"
+
+
+def test_batched_urls_point_at_the_router():
+    from test_app.models import Widget
+
+    urls = get_urls(make_context(), "routed_object", [Widget(pk=1), Widget(pk=2)])
+    assert all(urlparse(url).path == "/hx/" for url in urls.values())
+
+
+# ---------------------------------------------------------------------------
+# Dispatch
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.django_db()
+def test_router_dispatches_to_the_hx_request(widget):
+    response = _route(get_url(make_context(), "routed_object", widget))
+    assert content_of(response).strip() == "object|gizmo"
+
+
+@pytest.mark.django_db()
+def test_router_skips_the_owner_views_get(widget, monkeypatch):
+    monkeypatch.setattr(hx.RoutedObjectHx, "owner_view", CountingView)
+    CountingView.get_call_count = 0
+    _route(get_url(make_context(), "routed_object", widget))
+    assert CountingView.get_call_count == 0
+
+
+def test_owner_view_allow_rules_apply(monkeypatch):
+    monkeypatch.setattr(hx.RoutedObjectHx, "owner_view", StrictAllowListView)
+    with pytest.raises(Http404, match="not allowed"):
+        _route(get_url(make_context(), "routed_object", None))
+
+
+def test_handler_without_owner_view_is_a_404():
+    token_url = get_url(make_context(), "simple_get", None)
+    with pytest.raises(Http404, match="not served by the hx router"):
+        _route("/hx/?" + urlparse(token_url).query)
+
+
+@pytest.mark.parametrize("query", ["", f"{HX_TOKEN_PARAM}=forged"])
+def test_missing_or_invalid_token_is_a_404(query):
+    with pytest.raises(Http404, match="Invalid or tampered"):
+        _route(f"/hx/?{query}")
+
+
+def test_non_htmx_request_is_a_404():
+    request = RequestFactory().get(get_url(make_context(), "routed_object", None))
+    with pytest.raises(Http404):
+        HxRouterView.as_view()(request)
+
+
+def test_method_not_allowed_by_the_owner_view(monkeypatch):
+    monkeypatch.setattr(BaseView, "http_method_names", ["get"])
+    response = _route(get_url(make_context(), "routed_object", None), method="post")
+    assert response.status_code == 405
+
+
+# ---------------------------------------------------------------------------
+# Misconfiguration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("name", "match"),
+    [
+        ("routed_to_auth_view", "auth mixin"),
+        ("routed_to_decorated_view", "decorated dispatch"),
+        ("routed_with_views_context", "get_views_context"),
+    ],
+)
+def test_unsafe_owner_views_are_refused(name, match):
+    with pytest.raises(ImproperlyConfigured, match=match):
+        _route(get_url(make_context(), name, None))
+
+
+def test_owner_view_must_use_the_mixin(monkeypatch):
+    monkeypatch.setattr(hx.RoutedObjectHx, "owner_view", "django.views.generic.TemplateView")
+    with pytest.raises(ImproperlyConfigured, match="HtmxViewMixin"):
+        _route(get_url(make_context(), "routed_object", None))
+
+
+def test_owner_view_is_validated_once(monkeypatch):
+    from hx_requests import views
+
+    calls = []
+    resolve = views.resolve_owner_view
+    monkeypatch.setattr(views, "resolve_owner_view", lambda cls: calls.append(cls) or resolve(cls))
+    monkeypatch.setattr(views, "_owner_views", {})
+    url = get_url(make_context(), "routed_object", None)
+    _route(url)
+    _route(url)
+    assert calls == [hx.RoutedObjectHx]
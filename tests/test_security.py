@@ -131,6 +131,74 @@ def test_strict_allow_list_blocks_unlisted_even_same_app():
     assert is_allowed(StrictAllowListView, TriggerListHx) is False
 
 
+# --------------------------------------------------------------------------
+# Compiled policy
+# --------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def count_compiles(monkeypatch):
+    from hx_requests import views
+
+    views._allow_policies.clear()
+    calls = []
+    real_compile = views.HtmxViewMixin._compile_allow_policy
+
+    def counting_compile(self, hx_cls):
+        calls.append((type(self), hx_cls))
+        return real_compile(self, hx_cls)
+
+    monkeypatch.setattr(views.HtmxViewMixin, "_compile_allow_policy", counting_compile)
+    return calls
+
+
+def _request_as(user):
+    request = RequestFactory().get("/")
+    request.user = user
+    return request
+
+
+@override_settings(HX_REQUESTS_REQUIRE_AUTH=True)
+def test_policy_is_compiled_once_per_view_and_handler(count_compiles):
+    for _ in range(3):
+        BaseView().is_hx_allowed(SimpleGetHx, _request_as(authed_user()))
+        BaseView().is_hx_allowed(OtherAppHx, _request_as(authed_user()))
+        AllowListView().is_hx_allowed(OtherAppHx, _request_as(authed_user()))
+    assert len(count_compiles) == 3
+
+
+@override_settings(HX_REQUESTS_REQUIRE_AUTH=True)
+def test_compiled_policy_still_checks_the_user_per_request(count_compiles):
+    assert BaseView().is_hx_allowed(SimpleGetHx, _request_as(authed_user()))
+    assert BaseView().is_hx_allowed(SimpleGetHx, _request_as(AnonymousUser())) is False
+    assert len(count_compiles) == 1
+
+
+def test_settings_changes_recompile_the_policy(count_compiles):
+    assert is_allowed(BaseView, OtherAppHx, user=authed_user()) is False
+    assert is_allowed(BaseView, OtherAppHx, user=authed_user(), HX_REQUESTS_ENFORCE_SAME_APP=False)
+    assert len(count_compiles) == 2
+
+
+def test_per_instance_allow_lists_are_not_cached(count_compiles):
+    request = _request_as(authed_user())
+    assert BaseView(allowed_hx_requests=["other_app_hx"]).is_hx_allowed(OtherAppHx, request)
+    assert BaseView().is_hx_allowed(OtherAppHx, request) is False
+
+
+def test_computed_allow_lists_are_not_cached(count_compiles):
+    class ToggleView(BaseView):
+        open_to_other_app = False
+
+        @property
+        def allowed_hx_requests(self):
+            return ["other_app_hx"] if self.open_to_other_app else []
+
+    request = _request_as(authed_user())
+    assert ToggleView().is_hx_allowed(OtherAppHx, request) is False
+    assert ToggleView(open_to_other_app=True).is_hx_allowed(OtherAppHx, request)
+
+
 # --------------------------------------------------------------------------
 # Integration: disallowed requests raise 404 through the view
 # --------------------------------------------------------------------------
@@ -1,6 +1,8 @@
 """Unit tests for the pure helpers in hx_requests.security_utils."""
 
 import pytest
+from django.apps import apps
+from django.test import override_settings
 
 from hx_requests.security_utils import (
     app_label_for_object,
@@ -64,3 +66,33 @@ class TestAppLabelResolution:
         from test_app_two.hx_requests.nested.deep import DeepHx
 
         assert app_label_for_object(DeepHx) == "test_app_two"
+
+    @pytest.mark.parametrize(
+        "module_name",
+        [
+            "django.contrib.auth",
+            "django.contrib.auth.models",
+            "django.contrib",
+            "django.contrib.authx",
+            "test_app_two.hx_requests.nested.deep",
+            "hx_requests",
+            "tests.settings",
+        ],
+    )
+    def test_matches_the_app_registry(self, module_name):
+        cfg = apps.get_containing_app_config(module_name)
+        assert app_label_from_module(module_name) == (cfg.label if cfg else None)
+
+    def test_resolved_labels_are_memoized(self, monkeypatch):
+        app_label_from_module("test_app.views")
+        monkeypatch.setattr(apps, "get_containing_app_config", lambda name: pytest.fail("scanned apps"))
+        monkeypatch.setattr(apps, "get_app_configs", lambda: pytest.fail("rebuilt the index"))
+        assert app_label_from_module("test_app.views") == "test_app"
+        # A new module walks the trie without scanning the app configs either.
+        assert app_label_from_module("test_app.forms.widgets") == "test_app"
+
+    def test_index_follows_installed_apps_changes(self):
+        assert app_label_from_module("test_app.views") == "test_app"
+        with override_settings(INSTALLED_APPS=["hx_requests", "test_app_two"]):
+            assert app_label_from_module("test_app.views") is None
+        assert app_label_from_module("test_app.views") == "test_app"
@@ -0,0 +1,89 @@
+"""Tests for the pluggable hx token signer (HX_REQUESTS_SIGNER)."""
+
+import pytest
+from django.core import signing
+from test_app import hx_requests as hx
+from test_app.views import BaseView
+
+from hx_requests.signers import Blake2bSigner, _keyed_blake2b, get_hx_signer
+from hx_requests.token_codecs import BinaryTokenCodec, JSONTokenCodec
+from hx_requests.utils import sign_hx_payload, unsign_hx_payload
+from tests.helpers import content_of, hx_get
+
+BLAKE2B_SIGNER = "hx_requests.signers.Blake2bSigner"
+
+
+def test_blake2b_signer_round_trips():
+    signer = Blake2bSigner(salt="hx-test")
+    assert signer.unsign(signer.sign("hello")) == "hello"
+    assert signer.unsign_object(signer.sign_object({"a": [1, 2]})) == {"a": [1, 2]}
+
+
+def test_blake2b_signature_is_not_the_hmac_one():
+    assert Blake2bSigner(salt="hx-test").sign("hello") != signing.Signer(salt="hx-test").sign("hello")
+
+
+@pytest.mark.parametrize(
+    "forge",
+    [
+        lambda token: token[:-3] + "xxx",  # tampered signature
+        lambda token: "jello" + token[5:],  # tampered value
+        lambda token: Blake2bSigner(salt="other-salt").sign("hello"),  # another salt
+    ],
+)
+def test_blake2b_signer_rejects_forgeries(forge):
+    signer = Blake2bSigner(salt="hx-test")
+    with pytest.raises(signing.BadSignature):
+        signer.unsign(forge(signer.sign("hello")))
+
+
+def test_blake2b_signer_honours_secret_key_fallbacks(settings):
+    token = Blake2bSigner(salt="hx-test").sign("hello")
+    old_key = settings.SECRET_KEY
+
+    settings.SECRET_KEY = "a-brand-new-secret-key"
+    with pytest.raises(signing.BadSignature):
+        Blake2bSigner(salt="hx-test").unsign(token)
+
+    settings.SECRET_KEY_FALLBACKS = [old_key]
+    assert Blake2bSigner(salt="hx-test").unsign(token) == "hello"
+
+
+def test_keyed_state_is_derived_once_per_key_and_salt():
+    _keyed_blake2b.cache_clear()
+    signer = Blake2bSigner(salt="hx-test")
+    for value in ("a", "b", "c"):
+        signer.unsign(signer.sign(value))
+    assert _keyed_blake2b.cache_info().misses == 1
+
+
+def test_no_signer_setting_keeps_django_signing(settings):
+    assert get_hx_signer("hx-test") is None
+    assert type(get_hx_signer("hx-test", default=signing.Signer)) is signing.Signer
+
+
+@pytest.mark.parametrize("signer_setting", [BLAKE2B_SIGNER, Blake2bSigner])
+def test_signer_setting_accepts_a_class_or_its_path(settings, signer_setting):
+    settings.HX_REQUESTS_SIGNER = signer_setting
+    assert isinstance(get_hx_signer("hx-test"), Blake2bSigner)
+
+
+@pytest.mark.parametrize("codec", [JSONTokenCodec, BinaryTokenCodec])
+def test_codecs_sign_with_the_configured_signer(settings, codec):
+    payload = {"name": "simple_get", "object": None, "kw": {"flavor": "spicy"}}
+    default_token = codec().encode(payload)
+
+    settings.HX_REQUESTS_SIGNER = BLAKE2B_SIGNER
+    token = codec().encode(payload)
+    assert codec().decode(token) == payload
+    with pytest.raises(signing.BadSignature):
+        codec().decode(default_token)  # a different signer is a different key
+
+
+@pytest.mark.django_db()
+def test_signer_setting_applies_end_to_end(settings, widget):
+    settings.HX_REQUESTS_SIGNER = BLAKE2B_SIGNER
+    assert unsign_hx_payload(sign_hx_payload("simple_get"))["name"] == "simple_get"
+
+    response = hx_get(hx.ObjectEchoHx, BaseView, hx_kwargs={"object": widget})
+    assert "object|gizmo" in content_of(response)
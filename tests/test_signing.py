@@ -9,12 +9,14 @@ reaching a deserializer (no 500s).
 """
 
 import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core import signing
 from django.http import Http404
 from django.test import RequestFactory
 from test_app import hx_requests as hx
 from test_app.views import BaseView
 
-from hx_requests.utils import HX_TOKEN_PARAM, sign_hx_payload
+from hx_requests.utils import HX_TOKEN_PARAM, get_hx_request_name, is_hx_request, sign_hx_payload
 from tests.helpers import add_middleware_to_request, content_of, hx_get
 
 pytestmark = pytest.mark.django_db
@@ -71,7 +73,7 @@ def test_resolve_strips_client_supplied_framework_params():
     assert request.GET["page"] == "2"  # legit loose param preserved
     # A loose param a client invents (whatever its name) is harmless: kwargs are
     # sourced only from the signed token, never from raw query input.
-    assert request._hx_kwargs == {}  # kwargs sourced only from the token
+    assert BaseView().get_hx_extra_kwargs(request) == {}  # kwargs sourced only from the token
 
 
 def test_resolve_does_not_smuggle_framework_data_through_get(widget):
@@ -91,3 +93,70 @@ def test_resolve_does_not_smuggle_framework_data_through_get(widget):
     assert "object" not in request.GET
     assert HX_TOKEN_PARAM not in request.GET
     assert request.GET.urlencode() == "page=2"  # only the loose param survives
+
+
+def test_stripping_framework_params_copies_nothing(monkeypatch):
+    # request.GET is rebuilt without the token, and the current URL's params
+    # merged in, without deep-copying the query: the value lists are shared.
+    import copy
+
+    monkeypatch.setattr(copy, "deepcopy", lambda *args: pytest.fail("deep-copied request.GET"))
+    response = hx_get(
+        hx.CurrentUrlHx,
+        BaseView,
+        get_params={"bar": "from-request"},
+        request_attrs={"META": {"HTTP_HX_CURRENT_URL": "http://testserver/page?foo=from-url"}},
+    )
+    assert "foo:from-url" in content_of(response)
+    assert "bar:from-request" in content_of(response)
+
+
+def test_changing_the_stripped_query_leaves_the_original_alone():
+    request = RequestFactory().get(
+        "/", data={HX_TOKEN_PARAM: sign_hx_payload("simple_get"), "page": "2"}
+    )
+    original = request.GET
+    BaseView()._resolve_hx_token(request)
+
+    request.GET.appendlist("page", "3")
+    request.GET["sort"] = "name"
+    assert request.GET.getlist("page") == ["2", "3"]
+    assert original.getlist("page") == ["2"]
+    assert "sort" not in original
+
+
+def test_token_is_verified_once_per_request(monkeypatch):
+    # Middleware branching on hx requests, the public accessors and dispatch
+    # all read the same token; only the first of them pays for the HMAC.
+    hmacs = []
+    real_salted_hmac = signing.salted_hmac
+
+    def counting_salted_hmac(*args, **kwargs):
+        hmacs.append(args)
+        return real_salted_hmac(*args, **kwargs)
+
+    token = sign_hx_payload(hx.KwargsContextHx.name)
+    request = RequestFactory().get("/", data={HX_TOKEN_PARAM: token})
+    request.META["HTTP_HX_REQUEST"] = True
+    request.user = AnonymousUser()
+    add_middleware_to_request(request)
+    monkeypatch.setattr(signing, "salted_hmac", counting_salted_hmac)
+
+    assert is_hx_request(request)
+    assert get_hx_request_name(request) == hx.KwargsContextHx.name
+    response = BaseView.as_view()(request)
+
+    assert response.status_code == 200
+    assert len(hmacs) == 1
+
+
+def test_a_changed_token_is_verified_again():
+    request = RequestFactory().get("/", data={HX_TOKEN_PARAM: sign_hx_payload("simple_get")})
+    assert get_hx_request_name(request) == "simple_get"
+
+    request.GET = request.GET.copy()
+    request.GET[HX_TOKEN_PARAM] = sign_hx_payload("edit_widget")
+    assert get_hx_request_name(request) == "edit_widget"
+
+    request.GET[HX_TOKEN_PARAM] = "tampered"
+    assert is_hx_request(request) is False
@@ -0,0 +1,220 @@
+"""Tests for the pluggable token codecs (HX_REQUESTS_TOKEN_CODEC)."""
+
+import pytest
+from django.core import signing
+from test_app import hx_requests as hx
+from test_app.views import BaseView
+
+from hx_requests.token_codecs import BinaryTokenCodec, JSONTokenCodec
+from hx_requests.utils import get_token_codec, serialize_kwargs, unsign_hx_payload
+from tests.helpers import content_of, hx_get
+
+BINARY_CODEC = "hx_requests.token_codecs.BinaryTokenCodec"
+
+# Representative payloads: a bare action, a per-row object action, and a row
+# action carrying a couple of kwargs -- all path-bound, as get_url mints them.
+PAYLOADS = [
+    {"name": "simple_get", "object": None, "kw": {}, "path": "/widgets/"},
+    {
+        "name": "object_echo",
+        "object": "model_instance__test_app__widget__48213",
+        "kw": {},
+        "path": "/widgets/",
+    },
+    {
+        "name": "kwargs_context",
+        "object": "model_instance__test_app__widget__48213",
+        "kw": {"flavor": "spicy", "page": 3},
+        "path": "/widgets/",
+    },
+]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_binary_codec_round_trips_like_the_json_codec(payload):
+    codec = BinaryTokenCodec()
+    assert codec.decode(codec.encode(payload)) == JSONTokenCodec().decode(
+        JSONTokenCodec().encode(payload)
+    )
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_binary_tokens_are_much_shorter(payload):
+    binary = BinaryTokenCodec().encode(payload)
+    assert len(binary) < 0.6 * len(JSONTokenCodec().encode(payload))
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        "model_instance__test_app__widget__a__b",  # string pk
+        "model_instance__test_app__widget__007",  # not a canonical int
+        '{"a": 1}',  # not a model reference
+    ],
+)
+def test_binary_codec_round_trips_other_objects(obj):
+    payload = {"name": "simple_get", "object": obj, "kw": {}}
+    codec = BinaryTokenCodec()
+    assert codec.decode(codec.encode(payload)) == payload
+
+
+def test_binary_codec_round_trips_model_kwargs():
+    payload = {
+        "name": "kwargs_context",
+        "object": None,
+        "kw": {"flavor": "spicy"},
+        "kw_models": {
+            "widget": "model_instance__test_app__widget__7",
+            "other": "model_instance__x__y__a",
+        },
+    }
+    codec = BinaryTokenCodec()
+    assert codec.decode(codec.encode(payload)) == payload
+
+
+def test_binary_codec_round_trips_kwargs_minted_before_typed_kwargs():
+    payload = {"name": "kwargs_context", "object": None, "kwargs": serialize_kwargs(flavor="spicy")}
+    codec = BinaryTokenCodec()
+    assert codec.decode(codec.encode(payload)) == payload
+
+
+def test_registered_handler_names_are_interned():
+    codec = BinaryTokenCodec()
+    token = codec.encode({"name": "view_template_names_fallback", "object": None, "kw": {}})
+    value = signing.Signer(salt=BinaryTokenCodec.salt).unsign(token)
+    assert b"view_template_names_fallback" not in signing.b64_decode(value.encode())
+
+
+def test_unregistered_handler_names_travel_literally():
+    payload = {"name": "not_registered_anywhere", "object": None, "kw": {}}
+    codec = BinaryTokenCodec()
+    assert codec.decode(codec.encode(payload)) == payload
+
+
+def test_literal_names_do_not_reload_the_handler_ids(clean_registry, monkeypatch):
+    codec = BinaryTokenCodec()
+    loads = []
+    real_load = BinaryTokenCodec._load_handler_ids
+    monkeypatch.setattr(
+        BinaryTokenCodec, "_load_handler_ids", lambda self: loads.append(1) or real_load(self)
+    )
+
+    for _ in range(3):
+        codec.encode({"name": "not_registered_anywhere", "object": None, "kw": {}})
+    assert len(loads) == 1
+
+    clean_registry.register_hx_request("not_registered_anywhere", hx.SimpleGetHx)
+    token = codec.encode({"name": "not_registered_anywhere", "object": None, "kw": {}})
+    assert len(loads) == 2
+    value = signing.Signer(salt=BinaryTokenCodec.salt).unsign(token)
+    assert b"not_registered_anywhere" not in signing.b64_decode(value.encode())
+
+
+def test_token_for_a_removed_handler_is_rejected(clean_registry):
+    codec = BinaryTokenCodec()
+    token = codec.encode({"name": "simple_get", "object": None, "kw": {}})
+    clean_registry._registry.pop("simple_get")
+    with pytest.raises(signing.BadSignature):
+        BinaryTokenCodec().decode(token)
+
+
+def test_tampered_binary_token_is_rejected():
+    token = BinaryTokenCodec().encode(PAYLOADS[0])
+    with pytest.raises(signing.BadSignature):
+        BinaryTokenCodec().decode(token[:-3] + "xxx")
+
+
+def test_signed_but_unreadable_binary_token_is_rejected():
+    token = signing.Signer(salt=BinaryTokenCodec.salt).sign(signing.b64_encode(b"\x09junk").decode())
+    with pytest.raises(signing.BadSignature):
+        BinaryTokenCodec().decode(token)
+
+
+def test_binary_codec_accepts_tokens_minted_before_the_switch():
+    token = JSONTokenCodec().encode(PAYLOADS[1])
+    assert BinaryTokenCodec().decode(token) == PAYLOADS[1]
+
+
+def test_json_codec_is_the_default():
+    assert isinstance(get_token_codec(), JSONTokenCodec)
+
+
+@pytest.mark.django_db()
+def test_codec_setting_applies_end_to_end(settings, widget):
+    settings.HX_REQUESTS_TOKEN_CODEC = BINARY_CODEC
+    assert isinstance(get_token_codec(), BinaryTokenCodec)
+
+    response = hx_get(hx.ObjectEchoHx, BaseView, hx_kwargs={"object": widget})
+    assert "object|gizmo" in content_of(response)
+
+
+def test_unsign_uses_the_configured_codec(settings):
+    settings.HX_REQUESTS_TOKEN_CODEC = BINARY_CODEC
+    token = BinaryTokenCodec().encode(PAYLOADS[0])
+    assert unsign_hx_payload(token) == PAYLOADS[0]
+
+
+# --------------------------------------------------------------------------
+# compression policy
+# --------------------------------------------------------------------------
+
+BIG_PAYLOAD = {"name": "kwargs_context", "object": None, "kw": {"ids": list(range(200))}}
+SMALL_PAYLOAD = {"name": "simple_get", "object": None, "kw": {"flavor": "spicy"}}
+
+
+def _compressed(codec, token):
+    if isinstance(codec, BinaryTokenCodec):
+        return signing.b64_decode(codec.signer.unsign(token).encode())[:1] == b"\x00"
+    return token.startswith(".")
+
+
+@pytest.mark.parametrize("codec_class", [JSONTokenCodec, BinaryTokenCodec])
+def test_large_payloads_are_compressed(codec_class):
+    codec = codec_class()
+    token = codec.encode(BIG_PAYLOAD)
+    assert _compressed(codec, token)
+    assert codec.decode(token)["kw"] == BIG_PAYLOAD["kw"]
+
+
+@pytest.mark.parametrize("codec_class", [JSONTokenCodec, BinaryTokenCodec])
+def test_payloads_below_the_threshold_are_not_compressed(codec_class, monkeypatch):
+    import zlib
+
+    monkeypatch.setattr(zlib, "compress", lambda *args: pytest.fail("compressed a small payload"))
+    codec = codec_class()
+    assert not _compressed(codec, codec.encode(SMALL_PAYLOAD))
+
+
+def test_compression_is_skipped_when_it_does_not_win(settings):
+    settings.HX_REQUESTS_TOKEN_COMPRESS_THRESHOLD = 1
+    codec = JSONTokenCodec()
+    token = codec.encode(SMALL_PAYLOAD)
+    assert not _compressed(codec, token)
+    assert codec.decode(token) == SMALL_PAYLOAD
+
+
+def test_compression_can_be_turned_off(settings):
+    settings.HX_REQUESTS_TOKEN_COMPRESS_THRESHOLD = None
+    codec = JSONTokenCodec()
+    assert not _compressed(codec, codec.encode(BIG_PAYLOAD))
+
+
+def test_compression_level_is_configurable(settings, monkeypatch):
+    import zlib
+
+    levels = []
+    real_compress = zlib.compress
+
+    def recording_compress(data, level):
+        levels.append(level)
+        return real_compress(data, level)
+
+    monkeypatch.setattr(zlib, "compress", recording_compress)
+    settings.HX_REQUESTS_TOKEN_COMPRESS_LEVEL = 9
+    JSONTokenCodec().encode(BIG_PAYLOAD)
+    assert levels == [9]
+
+
+def test_compressed_json_tokens_are_read_by_django_signing():
+    token = JSONTokenCodec().encode(BIG_PAYLOAD)
+    assert signing.loads(token, salt="hx-requests")["kw"] == BIG_PAYLOAD["kw"]
@@ -0,0 +1,62 @@
+"""Tests for per-handler token size statistics (HX_REQUESTS_TOKEN_STATS)."""
+
+import pytest
+from test_app.models import Widget
+
+from hx_requests.token_stats import TokenSizeStats, get_token_stats, reset_token_stats
+from hx_requests.utils import get_envelope_urls, get_urls, sign_hx_payload
+from tests.helpers import make_context
+
+
+@pytest.fixture()
+def _token_stats(settings):
+    settings.HX_REQUESTS_TOKEN_STATS = True
+    reset_token_stats()
+    yield
+    reset_token_stats()
+
+
+def test_nothing_is_recorded_by_default():
+    reset_token_stats()
+    sign_hx_payload("simple_get")
+    assert get_token_stats() == {}
+
+
+@pytest.mark.usefixtures("_token_stats")
+def test_every_minted_token_is_recorded():
+    token = sign_hx_payload("simple_get")
+    sign_hx_payload("simple_get")  # served from the token cache, still on the page
+
+    stats = get_token_stats()["simple_get"]
+    assert stats["count"] == 2
+    assert stats["total_size"] == 2 * len(token)
+    assert stats["max_size"] == stats["mean_size"] == len(token)
+
+
+@pytest.mark.usefixtures("_token_stats")
+def test_heaviest_handlers_come_first():
+    sign_hx_payload("simple_get")
+    sign_hx_payload("kwargs_context", ids=list(range(100)))
+    assert list(get_token_stats()) == ["kwargs_context", "simple_get"]
+
+
+@pytest.mark.usefixtures("_token_stats")
+def test_batch_and_envelope_tokens_are_recorded():
+    widgets = [Widget(pk=pk, name=f"w{pk}") for pk in (1, 2, 3)]
+    get_urls(make_context(), "object_echo", widgets)
+    get_envelope_urls(make_context(), "kwargs_context", widgets)
+
+    stats = get_token_stats()
+    assert stats["object_echo"]["count"] == 3
+    assert stats["kwargs_context"]["count"] == 4  # the envelope and one row each
+
+
+def test_histogram_buckets_sizes():
+    stats = TokenSizeStats()
+    for size in (10, 64, 65, 5000):
+        stats.record("a", size)
+    histogram = stats.snapshot()["a"]["histogram"]
+    assert histogram["<=64"] == 2
+    assert histogram["<=128"] == 1
+    assert histogram[">4096"] == 1
+    assert sum(histogram.values()) == 4
@@ -1,6 +1,8 @@
 """Unit tests for hx_requests.utils: serialization, URL building, csrf."""
 
 import datetime
+import math
+from decimal import Decimal
 from urllib.parse import parse_qs, urlparse
 
 import pytest
@@ -11,9 +13,11 @@ from hx_requests.utils import (
     HX_TOKEN_PARAM,
     deserialize,
     deserialize_kwargs,
+    deserialize_payload_kwargs,
     get_hx_payload,
     get_hx_request_name,
     get_url,
+    get_urls,
     is_htmx_request,
     is_hx_request,
     parse_model_ref,
@@ -21,6 +25,7 @@ from hx_requests.utils import (
     serialize,
     serialize_kwargs,
     sign_hx_payload,
+    split_typed_kwargs,
     unsign_hx_payload,
 )
 from tests.helpers import make_context
@@ -159,6 +164,77 @@ def test_kwarg_name_containing_prefix_sequence_round_trips():
     assert deserialize_kwargs(**serialized) == {"foo___bar": "x"}
 
 
+# --------------------------------------------------------------------------
+# typed kwargs (split_typed_kwargs / deserialize_payload_kwargs)
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.django_db()
+def test_split_typed_kwargs_separates_model_instances(widget):
+    kw, kw_models = split_typed_kwargs(widget=widget, count=3, flavor="spicy")
+    assert kw == {"count": 3, "flavor": "spicy"}
+    assert kw_models == {"widget": serialize(widget)}
+
+
+@pytest.mark.django_db()
+def test_typed_kwargs_round_trip_through_a_token(widget):
+    payload = unsign_hx_payload(sign_hx_payload("simple_get", widget=widget, count=3, tags=["a", "b"]))
+    assert deserialize_payload_kwargs(payload) == {"widget": widget, "count": 3, "tags": ["a", "b"]}
+
+
+def test_typed_kwargs_keep_django_json_encoder_types():
+    # Same values the per-kwarg serialize() produced: DjangoJSONEncoder output.
+    when = datetime.date(2020, 1, 2)
+    payload = unsign_hx_payload(sign_hx_payload("simple_get", when=when, amount=Decimal("1.50")))
+    assert deserialize_payload_kwargs(payload) == {"when": "2020-01-02", "amount": "1.50"}
+    assert deserialize_payload_kwargs(payload) == deserialize_kwargs(
+        **serialize_kwargs(when=when, amount=Decimal("1.50"))
+    )
+
+
+def test_typed_kwargs_are_not_json_inside_json():
+    import json
+
+    from django.core import signing
+
+    token = sign_hx_payload("simple_get", flavor="spicy")
+    raw = signing.b64_decode(token.split(":", 1)[0].encode()).decode()
+    assert json.loads(raw)["kw"] == {"flavor": "spicy"}
+    assert "\\" not in raw  # no escaped quotes from a second encoding pass
+
+
+def test_string_kwarg_that_looks_like_a_model_ref_stays_a_string():
+    ref = "model_instance__test_app__widget__1"
+    payload = unsign_hx_payload(sign_hx_payload("simple_get", note=ref))
+    assert deserialize_payload_kwargs(payload) == {"note": ref}
+
+
+def test_tokens_minted_with_serialized_kwargs_are_still_read():
+    from django.core import signing
+
+    from hx_requests.constants import HX_SIGNING_SALT
+
+    legacy = {"name": "simple_get", "object": None, "kwargs": serialize_kwargs(flavor="spicy", count=3)}
+    payload = unsign_hx_payload(signing.dumps(legacy, salt=HX_SIGNING_SALT))
+    assert deserialize_payload_kwargs(payload) == {"flavor": "spicy", "count": 3}
+
+
+def test_cached_tokens_distinguish_equal_values_of_different_types(settings):
+    settings.HX_REQUESTS_TOKEN_CACHE_SIZE = 16
+    as_bool = unsign_hx_payload(sign_hx_payload("simple_get", flag=True))
+    as_int = unsign_hx_payload(sign_hx_payload("simple_get", flag=1))
+    assert as_bool["kw"]["flag"] is True
+    assert as_int["kw"]["flag"] == 1
+    assert as_int["kw"]["flag"] is not True
+
+
+def test_cached_tokens_distinguish_negative_zero(settings):
+    settings.HX_REQUESTS_TOKEN_CACHE_SIZE = 16
+    unsign_hx_payload(sign_hx_payload("simple_get", x=0.0))
+    negative = unsign_hx_payload(sign_hx_payload("simple_get", x=-0.0))
+    assert math.copysign(1, negative["kw"]["x"]) == -1
+
+
 # --------------------------------------------------------------------------
 # is_htmx_request
 # --------------------------------------------------------------------------
@@ -185,12 +261,12 @@ def test_sign_payload_round_trips_name_object_and_kwargs(widget):
     payload = unsign_hx_payload(token)
     assert payload["name"] == "edit_widget"
     assert deserialize(payload["object"]) == widget
-    assert deserialize_kwargs(**payload["kwargs"]) == {"flavor": "spicy"}
+    assert deserialize_payload_kwargs(payload) == {"flavor": "spicy"}
 
 
 def test_sign_payload_without_object_or_kwargs():
     payload = unsign_hx_payload(sign_hx_payload("simple_get"))
-    assert payload == {"name": "simple_get", "object": None, "kwargs": {}}
+    assert payload == {"name": "simple_get", "object": None, "kw": {}}
 
 
 def test_tampered_token_fails_verification():
@@ -237,7 +313,7 @@ def test_get_hx_payload_returns_verified_contents(widget):
     payload = get_hx_payload(request)
     assert payload["name"] == "edit_widget"
     assert deserialize(payload["object"]) == widget
-    assert deserialize_kwargs(**payload["kwargs"]) == {"flavor": "spicy"}
+    assert deserialize_payload_kwargs(payload) == {"flavor": "spicy"}
 
 
 def test_get_hx_payload_none_without_token():
@@ -299,7 +375,7 @@ def test_get_url_includes_serialized_object(widget):
 
 def test_get_url_appends_serialized_kwargs():
     url = get_url(make_context(), "simple_get", None, flavor="spicy")
-    assert deserialize_kwargs(**token_from_url(url)["kwargs"]) == {"flavor": "spicy"}
+    assert deserialize_payload_kwargs(token_from_url(url)) == {"flavor": "spicy"}
 
 
 def test_get_url_use_full_path_carries_existing_params():
@@ -325,3 +401,195 @@ def test_get_url_use_full_path_filters_internal_params():
     # treated as special beyond the token param and the two legacy names above.
     assert query["extra"] == ["keep"]
     assert token_from_url(url)["name"] == "new_name"
+
+
+# --------------------------------------------------------------------------
+# get_urls
+# --------------------------------------------------------------------------
+
+
+def test_get_urls_returns_the_get_url_of_every_object():
+    widgets = [Widget(pk=pk, name=f"w{pk}") for pk in range(1, 6)]
+    context = make_context("/page/?q=search&page=2")
+    urls = get_urls(context, "simple_get", widgets, use_full_path=True, flavor="spicy")
+    assert urls == {
+        w.pk: get_url(context, "simple_get", w, use_full_path=True, flavor="spicy") for w in widgets
+    }
+    query = parse_qs(urlparse(urls[3]).query)
+    assert query["q"] == ["search"]
+    assert token_from_url(urls[3])["object"] == serialize(widgets[2])
+
+
+def test_get_urls_resolves_the_shared_work_once(monkeypatch, settings):
+    import hx_requests.utils as utils
+
+    settings.HX_REQUESTS_TOKEN_CACHE_SIZE = 0
+    lookups = []
+    real_handler_target = utils._handler_target
+    monkeypatch.setattr(
+        utils,
+        "_handler_target",
+        lambda name, request: lookups.append(name) or real_handler_target(name, request),
+    )
+    widgets = [Widget(pk=pk, name=f"w{pk}") for pk in range(1, 1001)]
+
+    urls = get_urls(make_context(), "simple_get", widgets, flavor="spicy")
+
+    assert len(urls) == 1000
+    assert lookups == ["simple_get"]
+    assert {token_from_url(url)["object"] for url in urls.values()} == {serialize(w) for w in widgets}
+
+
+# --------------------------------------------------------------------------
+# minted-token cache
+# --------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def count_signatures(monkeypatch):
+    from hx_requests.token_codecs import JSONTokenCodec
+
+    calls = []
+    real_encode = JSONTokenCodec.encode
+
+    def counting_encode(self, payload):
+        calls.append(payload)
+        return real_encode(self, payload)
+
+    monkeypatch.setattr(JSONTokenCodec, "encode", counting_encode)
+    return calls
+
+
+@pytest.mark.django_db()
+def test_table_render_signs_each_distinct_token_once(settings, count_signatures):
+    settings.HX_REQUESTS_TOKEN_CACHE_SIZE = 4096  # also starts from an empty cache
+    widgets = [Widget(pk=pk, name=f"w{pk}") for pk in range(1, 1001)]
+    context = make_context()
+
+    def render_table():
+        rows = []
+        for widget in widgets:
+            rows.append(get_url(context, "edit_widget", widget))
+            rows.append(get_url(context, "simple_get", None, flavor="spicy"))
+        return rows
+
+    first = render_table()
+    assert len(count_signatures) == 1001  # one per row object + one shared tag
+    assert render_table() == first  # a re-render reuses every minted token
+    assert len(count_signatures) == 1001
+
+
+def test_cached_token_is_keyed_by_the_full_payload(settings, count_signatures):
+    settings.HX_REQUESTS_TOKEN_CACHE_SIZE = 16
+    spicy = sign_hx_payload("simple_get", flavor="spicy")
+    assert sign_hx_payload("simple_get", flavor="spicy") == spicy
+    assert unsign_hx_payload(sign_hx_payload("simple_get", flavor="mild"))["kw"] == {"flavor": "mild"}
+    assert "path" in unsign_hx_payload(sign_hx_payload("simple_get", bind_path="/page/", flavor="spicy"))
+    assert len(count_signatures) == 3
+
+
+def test_token_cache_evicts_least_recently_used(settings, count_signatures):
+    settings.HX_REQUESTS_TOKEN_CACHE_SIZE = 2
+    sign_hx_payload("a")
+    sign_hx_payload("b")
+    sign_hx_payload("a")  # hit: "b" is now the oldest
+    sign_hx_payload("c")  # evicts "b"
+    sign_hx_payload("a")
+    sign_hx_payload("b")
+    assert [payload["name"] for payload in count_signatures] == ["a", "b", "c", "b"]
+
+
+def test_token_cache_size_zero_disables_it(settings, count_signatures):
+    settings.HX_REQUESTS_TOKEN_CACHE_SIZE = 0
+    for _ in range(3):
+        sign_hx_payload("simple_get")
+    assert len(count_signatures) == 3
+
+
+def test_token_cache_is_dropped_when_the_secret_key_changes(settings):
+    token = sign_hx_payload("simple_get")
+    settings.SECRET_KEY = "another-secret-key-for-this-test"
+    rotated = sign_hx_payload("simple_get")
+    assert rotated != token
+    assert unsign_hx_payload(rotated)["name"] == "simple_get"
+
+
+# --------------------------------------------------------------------------
+# verified-payload cache
+# --------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def count_verifications(monkeypatch):
+    from django.core import signing
+
+    calls = []
+    real_loads = signing.loads
+
+    def counting_loads(token, *args, **kwargs):
+        calls.append(token)
+        return real_loads(token, *args, **kwargs)
+
+    monkeypatch.setattr(signing, "loads", counting_loads)
+    return calls
+
+
+def _token_request(token):
+    return RequestFactory().get("/", data={HX_TOKEN_PARAM: token})
+
+
+def test_payload_cache_is_off_by_default(count_verifications):
+    token = sign_hx_payload("simple_get")
+    for _ in range(3):
+        get_hx_payload(_token_request(token))
+    assert len(count_verifications) == 3
+
+
+def test_payload_cache_verifies_a_hot_token_once(settings, count_verifications):
+    settings.HX_REQUESTS_PAYLOAD_CACHE_SIZE = 8
+    token = sign_hx_payload("simple_get", flavor="spicy")
+    payloads = [get_hx_payload(_token_request(token)) for _ in range(5)]
+    assert len(count_verifications) == 1
+    assert all(payload == payloads[0] for payload in payloads)
+
+
+def test_payload_cache_hands_out_copies(settings):
+    settings.HX_REQUESTS_PAYLOAD_CACHE_SIZE = 8
+    token = sign_hx_payload("simple_get", flavor="spicy")
+    first = get_hx_payload(_token_request(token))
+    first["name"] = "tampered"
+    first["kw"]["flavor"] = "tampered"
+    second = get_hx_payload(_token_request(token))
+    assert second["name"] == "simple_get"
+    assert second["kw"] == {"flavor": "spicy"}
+
+
+def test_payload_cache_never_caches_a_bad_signature(settings, count_verifications):
+    settings.HX_REQUESTS_PAYLOAD_CACHE_SIZE = 8
+    forged = sign_hx_payload("simple_get")[:-3] + "xxx"
+    assert get_hx_payload(_token_request(forged)) is None
+    assert get_hx_payload(_token_request(forged)) is None
+    assert len(count_verifications) == 2
+
+
+def test_payload_cache_entries_expire(settings, count_verifications, monkeypatch):
+    import time
+
+    settings.HX_REQUESTS_PAYLOAD_CACHE_SIZE = 8
+    settings.HX_REQUESTS_PAYLOAD_CACHE_TTL = 30
+    token = sign_hx_payload("simple_get")
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    get_hx_payload(_token_request(token))
+    get_hx_payload(_token_request(token))
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+    get_hx_payload(_token_request(token))
+    assert len(count_verifications) == 2
+
+
+def test_payload_cache_is_dropped_when_the_secret_key_changes(settings):
+    settings.HX_REQUESTS_PAYLOAD_CACHE_SIZE = 8
+    token = sign_hx_payload("simple_get")
+    assert get_hx_payload(_token_request(token)) is not None
+    settings.SECRET_KEY = "another-secret-key-for-this-test"
+    assert get_hx_payload(_token_request(token)) is None